@@ -0,0 +1,75 @@
+import numpy as np
+from MDAnalysis.topology.PSFParser import PSFParser
+import MDAnalysis as mda
+
+try:
+    from MDAnalysisTests.datafiles import PSF
+except:
+    pass
+
+
+class PSFReadBench(object):
+    def time_parse_PSF_file(self):
+        """Time to create topology from the testsuite PSF file"""
+        p = PSFParser(PSF)
+        top = p.parse()
+
+    def time_create_PSF_universe(self):
+        """Time to create MDA Universe of PSF"""
+        u = mda.Universe(PSF)
+
+
+class LargePSFParse(object):
+    """Benchmarks for parsing a large PSF in the different formats"""
+    params = (['STANDARD', 'EXT', 'NAMD'])
+    param_names = ['psf_format']
+    timeout = 300
+
+    def setup_cache(self):
+        # 100000 waters with 2 bonds and 1 angle each
+        n_res = 100000
+        atom_formats = {
+            'STANDARD': '{:8d} {:<4s} {:<4d} {:<4s} {:<4s} {:<4s} '
+                        '{:14.6f}{:14.4f}{:8d}\n',
+            'EXT': '{:10d} {:<8s} {:<8d} {:<8s} {:<8s} {:<4s} '
+                   '{:14.6f}{:14.4f}{:8d}\n',
+            'NAMD': '{:10d} {:s} {:d} {:s} {:s} {:s} {:.6f} {:.4f} {:d}\n',
+        }
+        atoms = [('OH2', 'OT', -0.834, 15.9994),
+                 ('H1', 'HT', 0.417, 1.008),
+                 ('H2', 'HT', 0.417, 1.008)]
+        idx = np.arange(1, 3 * n_res + 1).reshape(n_res, 3)
+        bonds = np.column_stack([idx[:, 0], idx[:, 1],
+                                 idx[:, 0], idx[:, 2]]).ravel()
+        angles = idx[:, [1, 0, 2]].ravel()
+
+        flags = {'STANDARD': '', 'EXT': ' EXT', 'NAMD': ' EXT NAMD'}
+        for psf_format, atom_format in atom_formats.items():
+            with open('large_{}.psf'.format(psf_format), 'w') as f:
+                f.write('PSF{}\n\n       1 !NTITLE\n REMARKS benchmark\n\n'
+                        '{:8d} !NATOM\n'.format(flags[psf_format],
+                                                3 * n_res))
+                for i in range(3 * n_res):
+                    name, atype, charge, mass = atoms[i % 3]
+                    # the standard format has room for 4 digit resids
+                    resid = (i // 3) % 9999 + 1
+                    f.write(atom_format.format(i + 1, 'SOLV', resid,
+                                               'TIP3', name, atype, charge,
+                                               mass, 0))
+                for values, n, title, per_line in (
+                        (bonds, 2, '!NBOND: bonds', 8),
+                        (angles, 3, '!NTHETA: angles', 9)):
+                    f.write('\n{:8d} {}\n'.format(len(values) // n, title))
+                    for start in range(0, len(values), per_line):
+                        f.write(''.join('{:10d}'.format(v) for v in
+                                        values[start:start + per_line]))
+                        f.write('\n')
+                f.write('\n       0 !NPHI: dihedrals\n\n'
+                        '\n       0 !NIMPHI: impropers\n\n')
+
+    def setup(self, psf_format):
+        self.filename = 'large_{}.psf'.format(psf_format)
+
+    def time_parse_large_PSF(self, psf_format):
+        """Time to create topology from a large PSF file"""
+        PSFParser(self.filename).parse()
@@ -6,6 +6,7 @@ try:
                                            PSF, DCD,
                                            TRZ_psf, TRZ)
     from MDAnalysis.exceptions import NoDataError
+    from MDAnalysis.lib.mdamath import UnwrapPlan
 except:
     pass
 
@@ -347,3 +348,89 @@ class FragmentFinding(object):
 
     def time_find_fragments(self, universe_type):
         frags = self.u.atoms.fragments
+
+
+class UnwrapCompounds(object):
+    """Benchmarks for unwrapping many small molecules at once"""
+    params = (['residues', 'fragments', 'molecules'], ['com', 'cog', None])
+    param_names = ['compound', 'reference']
+
+    def setup(self, compound, reference):
+        # 30000 waters scattered over a periodic box, broken across the
+        # boundaries
+        n_res = 30000
+        n_atoms = 3 * n_res
+        self.u = MDAnalysis.Universe.empty(
+            n_atoms, n_residues=n_res,
+            atom_resindex=np.repeat(np.arange(n_res), 3), trajectory=True)
+        self.u.add_TopologyAttr('masses', np.tile([16.0, 1.0, 1.0], n_res))
+        self.u.add_TopologyAttr('molnums', np.arange(n_res))
+        idx = np.arange(n_atoms).reshape(n_res, 3)
+        self.u.add_TopologyAttr('bonds', np.concatenate([idx[:, [0, 1]],
+                                                         idx[:, [0, 2]]]))
+        self.u.dimensions = [70, 70, 70, 90, 90, 90]
+        rng = np.random.RandomState(0)
+        positions = (np.repeat(rng.uniform(0, 70, (n_res, 3)), 3, axis=0) +
+                     rng.uniform(-1, 1, (n_atoms, 3)))
+        self.u.atoms.positions = positions % 70
+        # fragments are computed once per universe
+        self.u.atoms.fragindices
+        self.plan = UnwrapPlan(self.u.atoms, compound=compound)
+
+    def time_unwrap(self, compound, reference):
+        """Benchmark unwrapping all the compounds of the system"""
+        self.u.atoms.unwrap(compound=compound, reference=reference,
+                            inplace=False)
+
+    def time_unwrap_plan(self, compound, reference):
+        """Benchmark unwrapping all the compounds of the system with a
+        plan built beforehand, as done for each frame of a trajectory
+        """
+        self.plan.unwrap(reference=reference, inplace=False)
+
+
+class CompoundMethods(object):
+    """Benchmarks for compound-wise centers, accumulations and wraps"""
+    params = (['residues', 'fragments', 'molecules', 'segments'],)
+    param_names = ['compound']
+
+    def setup(self, compound):
+        # 30000 waters listed in random order
+        n_res = 30000
+        n_atoms = 3 * n_res
+        self.u = MDAnalysis.Universe.empty(
+            n_atoms, n_residues=n_res, n_segments=10,
+            atom_resindex=np.repeat(np.arange(n_res), 3),
+            residue_segindex=np.arange(n_res) % 10, trajectory=True)
+        self.u.add_TopologyAttr('masses', np.tile([16.0, 1.0, 1.0], n_res))
+        self.u.add_TopologyAttr('charges', np.tile([-0.8, 0.4, 0.4], n_res))
+        self.u.add_TopologyAttr('molnums', np.arange(n_res))
+        idx = np.arange(n_atoms).reshape(n_res, 3)
+        self.u.add_TopologyAttr('bonds', np.concatenate([idx[:, [0, 1]],
+                                                         idx[:, [0, 2]]]))
+        self.u.dimensions = [70, 70, 70, 90, 90, 90]
+        rng = np.random.RandomState(0)
+        self.u.atoms.positions = rng.uniform(0, 70, (n_atoms, 3))
+        self.ag = self.u.atoms[rng.permutation(n_atoms)]
+        # fragments are computed once per universe
+        self.u.atoms.fragindices
+
+    def time_center_of_mass(self, compound):
+        """Benchmark compound-wise centers of mass"""
+        self.ag.center_of_mass(compound=compound)
+
+    def time_center_of_mass_pbc(self, compound):
+        """Benchmark compound-wise centers of mass moved into the box"""
+        self.ag.center_of_mass(compound=compound, pbc=True)
+
+    def time_accumulate(self, compound):
+        """Benchmark compound-wise sums of charges"""
+        self.ag.accumulate('charges', compound=compound)
+
+    def time_accumulate_function(self, compound):
+        """Benchmark compound-wise maxima of charges"""
+        self.ag.accumulate('charges', function=np.max, compound=compound)
+
+    def time_wrap(self, compound):
+        """Benchmark wrapping all compounds of the system"""
+        self.ag.wrap(compound=compound, inplace=False)
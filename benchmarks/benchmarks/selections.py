@@ -80,3 +80,30 @@ class GeoSelectionBench(object):
             self.u.select_atoms(selection_string, updating=dynamic_selection)
         else:
             self.u.selectAtoms(selection_string, updating=dynamic_selection)
+
+
+class StringSelectionBench(object):
+    """Benchmarks for string selections and for updating
+    the string attributes they match against.
+    """
+    params = ('name C*',
+              'name CA CB CG',
+              'resname LYS ARG',
+              'segid SYSTEM',
+              'type O* and not resname SOL')
+
+    param_names = ['selection_string']
+
+    def setup(self, selection_string):
+        self.u = MDAnalysis.Universe(GRO)
+        self.water = self.u.select_atoms('resname SOL')
+
+    def time_string_selections(self, selection_string):
+        """Benchmark string selections on the standard test GRO file.
+        """
+        self.u.select_atoms(selection_string)
+
+    def time_set_names(self, selection_string):
+        """Benchmark renaming a subset of atoms.
+        """
+        self.water.names = 'OW'
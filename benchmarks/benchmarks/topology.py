@@ -30,3 +30,31 @@ class TopologyGuessBench(object):
                              box=self.ag.dimensions,
                              vdwradii=self.vdwradii)
 
+
+
+class ConnectionAccessBench(object):
+    """Benchmarks for retrieving the bonds and dihedrals of atoms"""
+    params = (1, 1000, 1000000)
+    param_names = ['num_atoms']
+    timeout = 300
+
+    def setup(self, num_atoms):
+        # a single chain of 1000000 atoms
+        n_atoms = 1000000
+        idx = np.arange(n_atoms)
+        self.u = MDAnalysis.Universe.empty(n_atoms)
+        self.u.add_TopologyAttr('bonds', np.column_stack([idx[:-1], idx[1:]]))
+        self.u.add_TopologyAttr('dihedrals', np.column_stack(
+            [idx[:-3], idx[1:-2], idx[2:-1], idx[3:]]))
+        self.ag = self.u.atoms[::n_atoms // num_atoms]
+        # build the atom to connection tables
+        self.u.atoms[0].bonds
+        self.u.atoms[0].dihedrals
+
+    def time_bonds(self, num_atoms):
+        """Benchmark for the bonds of a group"""
+        self.ag.bonds
+
+    def time_dihedrals(self, num_atoms):
+        """Benchmark for the dihedrals of a group"""
+        self.ag.dihedrals
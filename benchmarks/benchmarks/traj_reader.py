@@ -1,4 +1,13 @@
 
+import numpy as np
+
+try:
+    from MDAnalysis.coordinates.XYZ import XYZReader
+    from MDAnalysis.coordinates.LAMMPS import DumpReader
+    from MDAnalysis.coordinates.GRO import GROReader
+except ImportError:
+    pass
+
 try:
     from MDAnalysis.coordinates.DCD import DCDReader
     from MDAnalysisTests.datafiles import DCD
@@ -7,7 +16,8 @@ except ImportError:
 
 try:
     from MDAnalysis.coordinates.XTC import XTCReader
-    from MDAnalysisTests.datafiles import XTC
+    from MDAnalysis.lib.formats.libmdaxdr import XTCFile
+    from MDAnalysisTests.datafiles import XTC, RANDOM_WALK
 except ImportError:
     pass
 
@@ -60,3 +70,73 @@ class TrajReaderIteration(object):
         """
         for ts in self.reader_object:
             pass
+
+
+class XTCOffsetScanning(object):
+    """Benchmarks for scanning a large XTC file for frame offsets
+    with several threads."""
+    params = ([1, 2, 4, 8])
+    param_names = ['n_threads']
+    timeout = 300
+
+    def setup_cache(self):
+        # 5000 copies of a 100 frame trajectory of 100 atoms, 500000 frames
+        fname = 'offsets_scan.xtc'
+        with open(RANDOM_WALK, 'rb') as f:
+            data = f.read()
+        with open(fname, 'wb') as f:
+            for _ in range(5000):
+                f.write(data)
+        return fname
+
+    def time_calc_offsets(self, fname, n_threads):
+        """Benchmark finding the frames of the file."""
+        with XTCFile(fname) as xtc:
+            xtc.calc_offsets(n_threads=n_threads)
+
+
+class TextTrajReaderIteration(object):
+    """Benchmarks for reading frames of large text trajectories."""
+    params = (['XYZ', 'LAMMPSDUMP', 'GRO'])
+    param_names = ['traj_format']
+    timeout = 300
+
+    def setup_cache(self):
+        # 3 frames of 200000 atoms
+        n_atoms, n_frames = 200000, 3
+        rng = np.random.RandomState(42)
+        positions = rng.uniform(0, 99, size=(n_atoms, 3))
+        with open('large.xyz', 'w') as f:
+            for _ in range(n_frames):
+                f.write('{}\nframe\n'.format(n_atoms))
+                for x, y, z in positions:
+                    f.write('C {:.5f} {:.5f} {:.5f}\n'.format(x, y, z))
+        with open('large.lammpsdump', 'w') as f:
+            for i in range(n_frames):
+                f.write('ITEM: TIMESTEP\n{}\nITEM: NUMBER OF ATOMS\n{}\n'
+                        'ITEM: BOX BOUNDS pp pp pp\n0 100\n0 100\n0 100\n'
+                        'ITEM: ATOMS id type xs ys zs\n'.format(i, n_atoms))
+                for j, (x, y, z) in enumerate(positions / 100):
+                    f.write('{} 1 {:.5f} {:.5f} {:.5f}\n'.format(j + 1, x, y,
+                                                                 z))
+        with open('large.gro', 'w') as f:
+            f.write('benchmark\n{}\n'.format(n_atoms))
+            for j, (x, y, z) in enumerate(positions / 10):
+                f.write('{:>5d}{:<5s}{:>5s}{:>5d}{:8.3f}{:8.3f}{:8.3f}'
+                        '{:8.4f}{:8.4f}{:8.4f}\n'.format(
+                            j % 100000, 'SOL', 'OW', j % 100000, x, y, z,
+                            0.1, 0.1, 0.1))
+            f.write('{:10.5f}{:10.5f}{:10.5f}\n'.format(10, 10, 10))
+
+    def setup(self, traj_format):
+        self.filename = {'XYZ': 'large.xyz',
+                         'LAMMPSDUMP': 'large.lammpsdump',
+                         'GRO': 'large.gro'}[traj_format]
+        self.traj_reader = {'XYZ': XYZReader,
+                            'LAMMPSDUMP': DumpReader,
+                            'GRO': GROReader}[traj_format]
+
+    def time_read_frames(self, traj_format):
+        """Benchmark opening the file and reading all its frames."""
+        for ts in self.traj_reader(self.filename):
+            pass
@@ -27,18 +27,143 @@ Analysis building blocks --- :mod:`MDAnalysis.analysis.base`
 A collection of useful building blocks for creating Analysis
 classes.
 
+
+Parallel execution
+------------------
+
+:meth:`AnalysisBase.run` can split the frames to be analysed into contiguous
+blocks and analyse each block in a separate worker process (*split*,
+*apply*, *combine*).  Each worker receives a pickled copy of the analysis
+(Universes and trajectory readers are picklable), calls
+:meth:`~AnalysisBase._prepare` and :meth:`~AnalysisBase._single_frame` for
+the frames of its block and sends the analysis back.  The per-block copies
+are merged by :meth:`AnalysisBase._combine` before
+:meth:`~AnalysisBase._conclude` is called in the main process.
+
+Only analyses that implement :meth:`~AnalysisBase._combine` can be run in
+parallel.  The following backends are available:
+
+``"serial"``
+    all blocks are analysed one after the other in the current process; this
+    exercises the full split/apply/combine machinery (including pickling) and
+    is mostly useful for testing.  With ``n_workers=None`` the trajectory is
+    iterated directly, as in previous versions.
+``"multiprocessing"``
+    blocks are analysed by a :class:`multiprocessing.Pool`
+``"dask"``
+    blocks are analysed by `dask`_ with the ``"processes"`` scheduler
+    (requires dask to be installed)
+
+.. code-block:: python
+
+   R = rms.RMSD(u, ref, select="backbone")
+   R.run(backend="multiprocessing", n_workers=8)
+
+.. _dask: https://dask.org
+
+
+Checkpointing
+-------------
+
+Long analyses can be made to survive the job being killed.  With a
+`checkpoint` file, :meth:`AnalysisBase.run` saves the state of the analysis
+every `checkpoint_every` frames.  Running the same analysis again with
+``resume=True`` restores that state and only analyses the remaining frames:
+
+.. code-block:: python
+
+   hbonds = HydrogenBondAnalysis(u)
+   hbonds.run(checkpoint="hbonds.npz", checkpoint_every=1000, resume=True)
+
+The state consists of the :attr:`~AnalysisBase.frames` and
+:attr:`~AnalysisBase.times` arrays and the current values of all attributes
+(re)bound by :meth:`~AnalysisBase._prepare`, except for AtomGroups and
+Universes, which are recreated by :meth:`~AnalysisBase._prepare` on resume.
+Analyses with other requirements can override
+:meth:`~AnalysisBase._get_checkpoint_state`.  If the checkpoint
+file does not exist, ``resume=True`` starts from the first frame, so the same
+command can be used to start and to restart a job.  A checkpoint is only
+resumed by an analysis of the same class, trajectory, frames and atoms;
+anything else raises a :exc:`ValueError`.
+
+.. warning::
+
+   The state is stored with :mod:`pickle`, so loading a checkpoint can
+   execute code from the file.  Only resume from checkpoints that come from
+   a trusted source.
+
+
+Profiling
+---------
+
+``run(profile=True)`` measures the wall time spent in the phases of the
+analysis and stores the totals (in seconds) in the
+:attr:`AnalysisBase.timings` dictionary:
+
+``"prepare"``, ``"conclude"``
+    :meth:`~AnalysisBase._prepare` and :meth:`~AnalysisBase._conclude`
+``"read"``
+    reading the frames from the trajectory
+``"transformations"``
+    applying the on-the-fly transformations of the trajectory
+``"single_frame"``
+    :meth:`~AnalysisBase._single_frame` (or
+    :meth:`~AnalysisBase._batch_frames`)
+``"combine"``, ``"checkpoint"``
+    merging the blocks of a parallel run and writing checkpoints
+``"total"``
+    the whole of :meth:`~AnalysisBase.run`
+
+For parallel runs the times of all blocks are added up.  The times of the
+``"read"``, ``"transformations"`` and ``"single_frame"`` phases of each
+analysed frame are stored in the :attr:`AnalysisBase.frame_timings`
+dictionary of arrays, e.g. to plot their histograms.  A summary is logged at
+the ``INFO`` level, so it appears in the log file written after
+:func:`MDAnalysis.start_logging`.
+
+.. code-block:: python
+
+   R = rms.RMSD(u, ref, select="backbone").run(profile=True)
+   print(R.timings)
+   np.histogram(R.frame_timings["read"])
+
 """
 import inspect
 import logging
 import itertools
+import multiprocessing
+import os
+import pickle
+import time
+from contextlib import contextmanager
 
 import numpy as np
 from MDAnalysis import coordinates
-from MDAnalysis.core.groups import AtomGroup
+from MDAnalysis.core.groups import AtomGroup, GroupBase
+from MDAnalysis.core.universe import Universe
 from MDAnalysis.lib.log import ProgressBar
 
 logger = logging.getLogger(__name__)
 
+#: backends accepted by :meth:`AnalysisBase.run`
+BACKENDS = ('serial', 'multiprocessing', 'dask')
+
+#: phases timed for each frame by ``AnalysisBase.run(profile=True)``
+FRAME_PHASES = ('read', 'transformations', 'single_frame')
+
+
+def _run_block(analysis, indices):
+    """Analyse the frames at positions `indices` of the analysed frames
+
+    Module level function so that it can be sent to worker processes.
+    """
+    analysis._block_indices = indices
+    with analysis._timed('prepare'):
+        analysis._prepare()
+    frames = np.arange(analysis.start, analysis.stop, analysis.step)[indices]
+    analysis._analyse_frames(analysis._trajectory[frames], indices)
+    return analysis
+
 
 class AnalysisBase(object):
     """Base class for defining multi frame analysis
@@ -86,12 +211,44 @@ class AnalysisBase(object):
        na = NewAnalysis(u.select_atoms('name CA'), 35).run(start=10, stop=20)
        print(na.result)
 
+    Analyses can additionally define ``_batch_frames(positions, boxes)`` to
+    process many frames in one call. When :meth:`run` is called with a
+    `batch_size`, the positions of the atoms in ``_batch_atoms`` (an
+    :class:`~MDAnalysis.core.groups.AtomGroup` that can be set in
+    ``_prepare``; all atoms if ``None``) are copied into a contiguous
+    ``(batch_size, n_atoms, 3)`` array and ``_batch_frames`` is called once
+    per batch instead of ``_single_frame`` once per frame. The position of the
+    first frame of the batch among the analysed frames is available as
+    ``self._frame_index``.
+
+    .. code-block:: python
+
+       class NewBatchAnalysis(NewAnalysis):
+           def _prepare(self):
+               self.result = []
+               self._batch_atoms = self._ag
+
+           def _batch_frames(self, positions, boxes):
+               # OPTIONAL
+               # positions: (n_frames_in_batch, n_atoms, 3)
+               # boxes: (n_frames_in_batch, 6)
+               self.result.extend(some_vectorized_function(positions, boxes))
+
+       na = NewBatchAnalysis(u.select_atoms('name CA'), 35).run(batch_size=64)
+
     Attributes
     ----------
     times: np.ndarray
         array of Timestep times. Only exists after calling run()
     frames: np.ndarray
         array of Timestep frame indices. Only exists after calling run()
+    timings: dict
+        total wall time in seconds of each phase of the analysis. Only exists
+        after calling ``run(profile=True)``
+    frame_timings: dict
+        arrays with the wall time in seconds of the ``"read"``,
+        ``"transformations"`` and ``"single_frame"`` phases of each analysed
+        frame. Only exists after calling ``run(profile=True)``
 
     """
 
@@ -112,6 +269,7 @@ class AnalysisBase(object):
         """
         self._trajectory = trajectory
         self._verbose = verbose
+        self._batch_atoms = None
 
     def _setup_frames(self, trajectory, start=None, stop=None, step=None):
         """
@@ -161,7 +319,326 @@ class AnalysisBase(object):
         """
         pass  # pylint: disable=unnecessary-pass
 
-    def run(self, start=None, stop=None, step=None, verbose=None):
+    def _batch_frames(self, positions, boxes):
+        """Calculate data from a batch of consecutive analysed frames
+
+        Optional vectorized alternative to :meth:`_single_frame`, used when
+        :meth:`run` is called with a `batch_size`.
+
+        Parameters
+        ----------
+        positions : numpy.ndarray
+            ``(n, n_atoms, 3)`` float32 array with the positions of
+            ``self._batch_atoms`` (all atoms if ``None``) in the ``n`` frames
+            of the batch
+        boxes : numpy.ndarray
+            ``(n, 6)`` float32 array with the unitcell dimensions of the
+            frames of the batch
+
+
+        .. versionadded:: 2.0.0
+        """
+        raise NotImplementedError("Only implemented in child classes")
+
+    def _analyse_frames(self, iterator, indices, verbose=False):
+        """Call :meth:`_single_frame` or :meth:`_batch_frames` for the frames
+
+        `indices` are the positions of the frames produced by `iterator`
+        among all analysed frames.
+        """
+        profile = self._profile
+        if profile:
+            iterator = self._timed_frames(iterator, indices)
+        try:
+            self._analyse_frames_loop(ProgressBar(iterator, verbose=verbose),
+                                      indices, profile)
+        finally:
+            if profile:
+                iterator.close()
+
+    def _analyse_frames_loop(self, iterator, indices, profile):
+        batch_size = getattr(self, '_batch_size', None)
+        if not batch_size:
+            for ts, i in zip(iterator, indices):
+                self._frame_index = i
+                self._ts = ts
+                self.frames[i] = ts.frame
+                self.times[i] = ts.time
+                if profile:
+                    t0 = time.perf_counter()
+                self._single_frame()
+                if profile:
+                    self.frame_timings['single_frame'][i] = (
+                        time.perf_counter() - t0)
+            return
+
+        atoms = getattr(self, '_batch_atoms', None)
+        if atoms is None:
+            ix, n_atoms = slice(None), self._trajectory.n_atoms
+        else:
+            ix, n_atoms = atoms.ix, atoms.n_atoms
+        positions = np.empty((batch_size, n_atoms, 3), dtype=np.float32)
+        boxes = np.empty((batch_size, 6), dtype=np.float32)
+        n = 0
+        for ts, i in zip(iterator, indices):
+            if n == 0:
+                first = i
+            self._ts = ts
+            self.frames[i] = ts.frame
+            self.times[i] = ts.time
+            positions[n] = ts.positions[ix]
+            boxes[n] = ts.dimensions
+            n += 1
+            if n == batch_size:
+                self._call_batch_frames(first, positions, boxes, profile)
+                n = 0
+        if n:
+            self._call_batch_frames(first, positions[:n], boxes[:n], profile)
+
+    def _call_batch_frames(self, first, positions, boxes, profile):
+        self._frame_index = first
+        if profile:
+            t0 = time.perf_counter()
+        self._batch_frames(positions, boxes)
+        if profile:
+            # share the time of the batch evenly between its frames
+            n = len(positions)
+            self.frame_timings['single_frame'][first:first + n] = (
+                (time.perf_counter() - t0) / n)
+
+    def _timed_frames(self, iterator, indices):
+        """Iterate over `iterator` and time reading and transforming frames
+
+        The transformations are timed by temporarily shadowing the
+        ``_apply_transformations`` method of the trajectory reader.
+        """
+        reader = self._trajectory
+        apply_transformations = reader._apply_transformations
+        spent = [0.0]
+
+        def timed_transformations(ts):
+            t0 = time.perf_counter()
+            ts = apply_transformations(ts)
+            spent[0] += time.perf_counter() - t0
+            return ts
+
+        reader._apply_transformations = timed_transformations
+        try:
+            iterator = iter(iterator)
+            for i in indices:
+                spent[0] = 0.0
+                t0 = time.perf_counter()
+                try:
+                    ts = next(iterator)
+                except StopIteration:
+                    return
+                elapsed = time.perf_counter() - t0
+                self.frame_timings['transformations'][i] = spent[0]
+                self.frame_timings['read'][i] = elapsed - spent[0]
+                yield ts
+        finally:
+            del reader._apply_transformations
+
+    @contextmanager
+    def _timed(self, phase):
+        """Add the wall time of the block to ``timings[phase]`` if profiling"""
+        if not self._profile:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = (self.timings.get(phase, 0.0)
+                                   + time.perf_counter() - t0)
+
+    def _log_timings(self):
+        """Log a summary of :attr:`timings` and :attr:`frame_timings`"""
+        logger.info("Timings of {} (s): {}".format(
+            type(self).__name__, ", ".join(
+                "{} {:.4g}".format(phase, t)
+                for phase, t in self.timings.items())))
+        if self.n_frames:
+            for phase in FRAME_PHASES:
+                t = self.frame_timings[phase]
+                logger.info("Per-frame {} time (s): mean {:.3g}, "
+                            "median {:.3g}, max {:.3g}".format(
+                                phase, t.mean(), np.median(t), t.max()))
+
+    def _get_checkpoint_state(self):
+        """State of the analysis that is saved in a checkpoint
+
+        Returns
+        -------
+        dict
+            attributes that are restored on the analysis after
+            :meth:`_prepare` when a run is resumed from the checkpoint
+
+
+        .. versionadded:: 2.0.0
+        """
+        state = {key: getattr(self, key) for key in self._checkpoint_keys}
+        state = {key: value for key, value in state.items()
+                 if not isinstance(value, (GroupBase, Universe))}
+        state['frames'] = self.frames
+        state['times'] = self.times
+        return state
+
+    def _prepare_checkpoint(self):
+        """Call :meth:`_prepare` and remember the attributes it sets"""
+        before = dict(self.__dict__)
+        self._prepare()
+        self._checkpoint_keys = [
+            key for key, value in self.__dict__.items()
+            if before.get(key, self) is not value]
+
+    def _checkpoint_identity(self):
+        """What a checkpoint must have been written for to be resumed
+
+        The analysis class, the trajectory, the frames and the indices of
+        the atoms of all groups the analysis holds.
+        """
+        reader = self._trajectory
+        groups = [value for key, value in sorted(self.__dict__.items(),
+                                                 key=lambda item: item[0])
+                  if isinstance(value, GroupBase)]
+        # the atoms of an UpdatingAtomGroup depend on the frame, the atoms
+        # it selects from don't
+        atoms = [getattr(group, '_base_group', group).atoms.ix
+                 for group in groups]
+        return {
+            'analysis': type(self).__qualname__,
+            'trajectory': str(getattr(reader, 'filename', None)),
+            'n_frames': reader.n_frames,
+            'n_atoms': reader.n_atoms,
+            'atoms': (np.concatenate(atoms) if atoms
+                      else np.array([], dtype=np.intp)),
+            'atom_counts': np.array([len(ix) for ix in atoms],
+                                    dtype=np.intp),
+        }
+
+    def _write_checkpoint(self, filename, n_done):
+        """Save the state after the first `n_done` analysed frames"""
+        state = self._get_checkpoint_state()
+        for key in ('_ts', '_frame_index', '_trajectory',
+                    '_checkpoint_keys'):
+            state.pop(key, None)
+        # write to a temporary file first so that a job killed while writing
+        # does not destroy the previous checkpoint
+        tmp = filename + '.tmp'
+        with open(tmp, 'wb') as f:
+            np.savez(f, start=self.start, stop=self.stop, step=self.step,
+                     n_done=n_done,
+                     state=np.frombuffer(pickle.dumps(state), dtype=np.uint8),
+                     **self._checkpoint_identity())
+        os.replace(tmp, filename)
+        logger.info("Wrote checkpoint {} after {} of {} frames".format(
+            filename, n_done, self.n_frames))
+
+    def _read_checkpoint(self, filename):
+        """Restore the state saved in `filename`
+
+        Returns
+        -------
+        int
+            number of analysed frames that have already been processed
+        """
+        identity = self._checkpoint_identity()
+        with np.load(filename) as data:
+            missing = [key for key in ['start', 'stop', 'step'] +
+                       list(identity) if key not in data.files]
+            if missing:
+                raise ValueError("{} is not a checkpoint of this version of "
+                                 "MDAnalysis, it lacks {}".format(
+                                     filename, ", ".join(missing)))
+            if (data['start'], data['stop'], data['step']) != (
+                    self.start, self.stop, self.step):
+                raise ValueError(
+                    "checkpoint {} was written for frames {}:{}:{}, not "
+                    "{}:{}:{}".format(filename, data['start'], data['stop'],
+                                      data['step'], self.start, self.stop,
+                                      self.step))
+            for key in ('analysis', 'trajectory', 'n_frames', 'n_atoms'):
+                value = data[key].item()
+                if value != identity[key]:
+                    raise ValueError(
+                        "checkpoint {} was written for {} {!r}, not "
+                        "{!r}".format(filename, key.replace('_', ' '), value,
+                                      identity[key]))
+            if not (np.array_equal(data['atom_counts'],
+                                   identity['atom_counts']) and
+                    np.array_equal(data['atoms'], identity['atoms'])):
+                raise ValueError("checkpoint {} was written for other atoms"
+                                 "".format(filename))
+            n_done = int(data['n_done'])
+            state = pickle.loads(data['state'].tobytes())
+        self.__dict__.update(state)
+        logger.info("Resuming from checkpoint {} after {} of {} frames".format(
+            filename, n_done, self.n_frames))
+        return n_done
+
+    def _combine(self, blocks):
+        """Merge the results of analyses run over separate blocks of frames
+
+        Called by :meth:`run` for parallel backends, after :meth:`_prepare`
+        and before :meth:`_conclude`. Subclasses that support parallel
+        execution must override this method and gather the per-frame data or
+        accumulated quantities of all `blocks` into ``self``. The
+        :attr:`frames` and :attr:`times` arrays are merged by :meth:`run`.
+
+        Parameters
+        ----------
+        blocks : list of AnalysisBase
+            copies of this analysis in frame order, each of which has been
+            prepared and has analysed one block of frames; the positions (in
+            the range ``0`` to ``n_frames - 1``) of the frames analysed by a
+            block are stored in its ``_block_indices`` attribute
+
+
+        .. versionadded:: 2.0.0
+        """
+        raise NotImplementedError("Only implemented in child classes")
+
+    def _run_blocks(self, backend, n_workers, verbose):
+        """Split the frames into blocks and analyse them with `backend`"""
+        if type(self)._combine is AnalysisBase._combine:
+            raise NotImplementedError(
+                "{} does not support parallel execution: it does not "
+                "implement _combine()".format(type(self).__name__))
+        if n_workers is None:
+            n_workers = multiprocessing.cpu_count()
+        n_blocks = max(1, min(n_workers, self.n_frames))
+        indices = [idx for idx in np.array_split(np.arange(self.n_frames),
+                                                 n_blocks) if len(idx)]
+
+        logger.info("Analysing {} blocks with the {} backend".format(
+            len(indices), backend))
+        if backend == 'serial':
+            # round-trip through pickle so that the blocks are independent
+            # copies, exactly as they would be in a worker process
+            blocks = [_run_block(pickle.loads(pickle.dumps(self)), idx)
+                      for idx in ProgressBar(indices, verbose=verbose)]
+        elif backend == 'multiprocessing':
+            with multiprocessing.Pool(n_workers) as pool:
+                blocks = pool.starmap(_run_block,
+                                      [(self, idx) for idx in indices])
+        else:
+            try:
+                import dask
+            except ImportError:
+                raise ImportError("The 'dask' backend requires dask, which "
+                                  "can be installed with "
+                                  "'pip install dask'") from None
+            tasks = [dask.delayed(_run_block, pure=False)(self, idx)
+                     for idx in indices]
+            blocks = dask.compute(*tasks, scheduler='processes',
+                                  num_workers=n_workers)
+        return list(blocks)
+
+    def run(self, start=None, stop=None, step=None, verbose=None,
+            backend='serial', n_workers=None, batch_size=None,
+            checkpoint=None, checkpoint_every=100, resume=False,
+            profile=False):
         """Perform the calculation
 
         Parameters
@@ -174,26 +651,132 @@ class AnalysisBase(object):
             number of frames to skip between each analysed frame
         verbose : bool, optional
             Turn on verbosity
+        backend : {'serial', 'multiprocessing', 'dask'}, optional
+            how to execute the analysis, see the *Parallel execution* section
+            of :mod:`MDAnalysis.analysis.base`
+        n_workers : int, optional
+            number of blocks (and worker processes) the frames are split
+            into. ``None`` analyses all frames in a single loop for the
+            ``'serial'`` backend and uses one worker per CPU core for the
+            parallel backends.
+        batch_size : int, optional
+            number of frames passed at once to :meth:`_batch_frames`.
+            ``None`` calls :meth:`_single_frame` for each frame.
+        checkpoint : str, optional
+            file the state of the analysis is saved to, see the
+            *Checkpointing* section of :mod:`MDAnalysis.analysis.base`
+        checkpoint_every : int, optional
+            number of analysed frames between checkpoints
+        resume : bool, optional
+            continue from the state saved in `checkpoint`, if it exists.
+            The state is unpickled, which can execute code stored in the
+            file: only resume from checkpoints from a trusted source.
+        profile : bool, optional
+            measure the time spent in each phase of the analysis, see the
+            *Profiling* section of :mod:`MDAnalysis.analysis.base`
+
+        Raises
+        ------
+        ValueError
+            if `backend` is unknown, `batch_size` or `checkpoint_every` is
+            not positive, a `checkpoint` is requested for a parallel run or
+            the checkpoint to resume from was written for another analysis
+            class, trajectory, frames or atoms
+        NotImplementedError
+            if a parallel run is requested for an analysis that does not
+            implement :meth:`_combine` or a `batch_size` is given for an
+            analysis that does not implement :meth:`_batch_frames`
+
+
+        .. versionchanged:: 2.0.0
+           Added the `backend` and `n_workers` keywords for parallel
+           execution, the `batch_size` keyword for batched analysis and the
+           `checkpoint`, `checkpoint_every` and `resume` keywords and the
+           `profile` keyword.
         """
+        if backend not in BACKENDS:
+            raise ValueError("backend must be one of {}, not {!r}".format(
+                ", ".join(BACKENDS), backend))
+        if batch_size is not None:
+            if batch_size < 1:
+                raise ValueError("batch_size must be a positive integer, "
+                                 "not {}".format(batch_size))
+            if type(self)._batch_frames is AnalysisBase._batch_frames:
+                raise NotImplementedError(
+                    "{} does not support batched analysis: it does not "
+                    "implement _batch_frames()".format(type(self).__name__))
+        if checkpoint is not None:
+            if backend != 'serial' or n_workers is not None:
+                raise ValueError("checkpoint can only be used for serial "
+                                 "runs without n_workers")
+            if checkpoint_every < 1:
+                raise ValueError("checkpoint_every must be a positive "
+                                 "integer, not {}".format(checkpoint_every))
+        self._batch_size = batch_size
+        self._profile = profile
+        t_start = time.perf_counter()
         logger.info("Choosing frames to analyze")
         # if verbose unchanged, use class default
         verbose = getattr(self, '_verbose',
                           False) if verbose is None else verbose
 
         self._setup_frames(self._trajectory, start, stop, step)
-        logger.info("Starting preparation")
-        self._prepare()
-        for i, ts in enumerate(ProgressBar(
-                self._trajectory[self.start:self.stop:self.step],
-                verbose=verbose)):
-            self._frame_index = i
-            self._ts = ts
-            self.frames[i] = ts.frame
-            self.times[i] = ts.time
-            # logger.info("--> Doing frame {} of {}".format(i+1, self.n_frames))
-            self._single_frame()
+        if profile:
+            self.timings = {}
+            self.frame_timings = {phase: np.zeros(self.n_frames)
+                                  for phase in FRAME_PHASES}
+        if backend != 'serial' or n_workers is not None:
+            # workers prepare their own copy of the analysis
+            blocks = self._run_blocks(backend, n_workers, verbose)
+            logger.info("Starting preparation")
+            with self._timed('prepare'):
+                self._prepare()
+            for block in blocks:
+                idx = block._block_indices
+                self.frames[idx] = block.frames[idx]
+                self.times[idx] = block.times[idx]
+                if profile:
+                    for phase, t in block.timings.items():
+                        self.timings[phase] = (self.timings.get(phase, 0.0)
+                                               + t)
+                    for phase in FRAME_PHASES:
+                        self.frame_timings[phase][idx] = (
+                            block.frame_timings[phase][idx])
+            self._frame_index = self.n_frames - 1
+            logger.info("Combining {} blocks".format(len(blocks)))
+            with self._timed('combine'):
+                self._combine(blocks)
+        else:
+            logger.info("Starting preparation")
+            if checkpoint is None:
+                with self._timed('prepare'):
+                    self._prepare()
+                self._analyse_frames(
+                    self._trajectory[self.start:self.stop:self.step],
+                    range(self.n_frames), verbose=verbose)
+            else:
+                with self._timed('prepare'):
+                    self._prepare_checkpoint()
+                n_done = 0
+                if resume and os.path.exists(checkpoint):
+                    with self._timed('checkpoint'):
+                        n_done = self._read_checkpoint(checkpoint)
+                frames = np.arange(self.start, self.stop, self.step)
+                for first in range(n_done, self.n_frames, checkpoint_every):
+                    indices = range(first, min(first + checkpoint_every,
+                                               self.n_frames))
+                    self._analyse_frames(self._trajectory[frames[indices]],
+                                         indices, verbose=verbose)
+                    with self._timed('checkpoint'):
+                        self._write_checkpoint(checkpoint, indices.stop)
         logger.info("Finishing up")
-        self._conclude()
+        with self._timed('conclude'):
+            self._conclude()
+        if profile:
+            for phase in FRAME_PHASES:
+                self.timings[phase] = self.frame_timings[phase].sum()
+            self.timings['total'] = time.perf_counter() - t_start
+            self._log_timings()
         return self
 
 
@@ -266,6 +849,10 @@ class AnalysisFromFunction(AnalysisBase):
     def _single_frame(self):
         self.results.append(self.function(*self.args, **self.kwargs))
 
+    def _combine(self, blocks):
+        for block in blocks:
+            self.results.extend(block.results)
+
     def _conclude(self):
         self.results = np.asarray(self.results)
 
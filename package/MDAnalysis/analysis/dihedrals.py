@@ -251,6 +251,10 @@ class Dihedral(AnalysisBase):
     selection of atomgroups. If there is only one atomgroup of interest, then
     it must be given as a list of one atomgroup.
 
+
+    .. versionchanged:: 2.0.0
+       Can be run with the parallel backends and the `batch_size` of
+       :meth:`Dihedral.run`.
     """
 
     def __init__(self, atomgroups, **kwargs):
@@ -279,6 +283,7 @@ class Dihedral(AnalysisBase):
 
     def _prepare(self):
         self.angles = []
+        self._batch_atoms = self.ag1 + self.ag2 + self.ag3 + self.ag4
 
     def _single_frame(self):
         angle = calc_dihedrals(self.ag1.positions, self.ag2.positions,
@@ -286,6 +291,24 @@ class Dihedral(AnalysisBase):
                                box=self.ag1.dimensions)
         self.angles.append(angle)
 
+    def _batch_frames(self, positions, boxes):
+        n_frames, n = len(positions), self.ag1.n_atoms
+        if (boxes == boxes[0]).all():
+            # same box in all frames: treat the batch as one big frame
+            coords = [positions[:, i * n:(i + 1) * n].reshape(-1, 3)
+                      for i in range(4)]
+            angles = calc_dihedrals(*coords, box=boxes[0])
+            self.angles.extend(angles.reshape(n_frames, n))
+        else:
+            for frame_positions, box in zip(positions, boxes):
+                coords = [frame_positions[i * n:(i + 1) * n]
+                          for i in range(4)]
+                self.angles.append(calc_dihedrals(*coords, box=box))
+
+    def _combine(self, blocks):
+        for block in blocks:
+            self.angles.extend(block.angles)
+
     def _conclude(self):
         self.angles = np.rad2deg(np.array(self.angles))
 
@@ -176,6 +176,7 @@ import numpy as np
 
 from ..lib.util import blocks_of
 from ..lib import distances
+from ..lib import mdamath
 from .base import AnalysisBase
 
 
@@ -232,6 +233,9 @@ class InterRDF(AnalysisBase):
        Support for the ``start``, ``stop``, and ``step`` keywords has been
        removed. These should instead be passed to :meth:`InterRDF.run`.
 
+    .. versionchanged:: 2.0.0
+       Can be run with the parallel backends and the `batch_size` of
+       :meth:`InterRDF.run`.
     """
     def __init__(self, g1, g2,
                  nbins=75, range=(0.0, 15.0), exclusion_block=None,
@@ -258,6 +262,7 @@ class InterRDF(AnalysisBase):
         self.volume = 0.0
         # Set the max range to filter the search radius
         self._maxrange = self.rdf_settings['range'][1]
+        self._batch_atoms = self.g1 + self.g2
 
 
     def _single_frame(self):
@@ -277,6 +282,30 @@ class InterRDF(AnalysisBase):
 
         self.volume += self._ts.volume
 
+    def _batch_frames(self, positions, boxes):
+        n1 = self.g1.n_atoms
+        dists = []
+        for frame_positions, box in zip(positions, boxes):
+            pairs, dist = distances.capped_distance(frame_positions[:n1],
+                                                    frame_positions[n1:],
+                                                    self._maxrange,
+                                                    box=box)
+            if self._exclusion_block is not None:
+                idxA = pairs[:, 0]//self._exclusion_block[0]
+                idxB = pairs[:, 1]//self._exclusion_block[1]
+                dist = dist[idxA != idxB]
+            dists.append(dist)
+            self.volume += mdamath.box_volume(box)
+
+        # one histogram for the whole batch
+        self.count += np.histogram(np.concatenate(dists),
+                                   **self.rdf_settings)[0]
+
+    def _combine(self, blocks):
+        for block in blocks:
+            self.count += block.count
+            self.volume += block.volume
+
     def _conclude(self):
         # Number of each selection
         nA = len(self.g1)
@@ -375,6 +404,8 @@ class InterRDF_s(AnalysisBase):
        Support for the ``start``, ``stop``, and ``step`` keywords has been
        removed. These should instead be passed to :meth:`InterRDF_s.run`.
 
+    .. versionchanged:: 2.0.0
+       Can be run with the parallel backends of :meth:`InterRDF_s.run`.
     """
     def __init__(self, u, ags,
                  nbins=75, range=(0.0, 15.0), density=False, **kwargs):
@@ -416,6 +447,11 @@ class InterRDF_s(AnalysisBase):
 
         self.volume += self._ts.volume
 
+    def _combine(self, blocks):
+        for block in blocks:
+            for count, block_count in zip(self.count, block.count):
+                count += block_count
+            self.volume += block.volume
 
     def _conclude(self):
         # Volume in each radial shell
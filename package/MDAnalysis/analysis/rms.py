@@ -461,6 +461,9 @@ class RMSD(AnalysisBase):
            are *not* rotationally superimposed any more.
         .. versionchanged:: 1.0.0
            `filename` keyword was removed.
+        .. versionchanged:: 2.0.0
+           Can be run with the parallel backends and the `batch_size` of
+           :meth:`run`.
 
         """
         super(RMSD, self).__init__(atomgroup.universe.trajectory,
@@ -630,6 +633,12 @@ class RMSD(AnalysisBase):
 
         self._mobile_coordinates64 = self.mobile_atoms.positions.copy().astype(np.float64)
 
+        # positions needed by _batch_frames: the mobile atoms followed by the
+        # mobile atoms of each group selection
+        self._batch_atoms = sum((atoms['mobile']
+                                 for atoms in self._groupselections_atoms),
+                                self.mobile_atoms)
+
     def _single_frame(self):
         mobile_com = self.mobile_atoms.center(self.weights_select).astype(np.float64)
         self._mobile_coordinates64[:] = self.mobile_atoms.positions
@@ -674,6 +683,54 @@ class RMSD(AnalysisBase):
                 self._ref_coordinates64, self._mobile_coordinates64,
                 self._n_atoms, None, self.weights_select)
 
+    def _batch_frames(self, positions, boxes):
+        n_frames = len(positions)
+        batch = slice(self._frame_index, self._frame_index + n_frames)
+        rmsd = self.rmsd[batch]
+        rmsd[:, 0] = self.frames[batch]
+        rmsd[:, 1] = self.times[batch]
+
+        mobile = positions[:, :self._n_atoms].astype(np.float64)
+        if self.weights_select is None:
+            mobile_com = mobile.mean(axis=1)
+        else:
+            mobile_com = (np.einsum('i,fij->fj', self.weights_select, mobile)
+                          / self.weights_select.sum())
+        mobile -= mobile_com[:, np.newaxis]
+
+        # the QCP kernel works on one frame at a time; the rotation matrices
+        # are only needed for the secondary RMSDs
+        R = np.zeros((n_frames, 3, 3))
+        for k in range(n_frames):
+            rmsd[k, 2] = qcp.CalcRMSDRotationalMatrix(
+                self._ref_coordinates64, mobile[k], self._n_atoms,
+                self._rot, self.weights_select)
+            if self._rot is not None:
+                R[k] = self._rot.reshape(3, 3)
+
+        if not self._groupselections_atoms:
+            return
+        start = self._n_atoms
+        for igroup, (refpos, atoms) in enumerate(
+                zip(self._groupselections_ref_coords64,
+                    self._groupselections_atoms), 3):
+            stop = start + atoms['mobile'].n_atoms
+            # superimpose with the rotation of the mobile atoms (R acts to
+            # the left) and compute all RMSDs of the batch at once
+            group = positions[:, start:stop] - mobile_com[:, np.newaxis]
+            group = np.einsum('fij,fjk->fik', group, R) + self._ref_com
+            sqdist = ((group - refpos) ** 2).sum(axis=2)
+            weights = self.weights_groupselections[igroup - 3]
+            if weights is not None:
+                sqdist *= weights
+            rmsd[:, igroup] = np.sqrt(sqdist.sum(axis=1) / (stop - start))
+            start = stop
+
+    def _combine(self, blocks):
+        for block in blocks:
+            idx = block._block_indices
+            self.rmsd[idx] = block.rmsd[idx]
+
 
 class RMSF(AnalysisBase):
     r"""Calculate RMSF of given atoms across a trajectory.
@@ -47,6 +47,28 @@ See Also
    https://github.com/MDAnalysis/mdanalysis/issues/187
 
 
+.. _dcd-mmap-label:
+
+Memory mapped DCD files
+-----------------------
+
+All frames of a DCD file have the same size, so that the file can be mapped
+into memory with ``DCDReader(filename, mmap=True)`` (or
+``mda.Universe(PSF, DCD, mmap=True)``). Frames are then copied straight from
+the mapped file without seeking, which makes random access as fast as
+sequential reading, and :meth:`DCDReader.timeseries` of all atoms returns a
+read-only view of the file without copying any coordinates::
+
+   u = mda.Universe(PSF, DCD, mmap=True)
+   xyz = u.trajectory.timeseries(order='fac')  # no copy
+   x = xyz[:, :, 0]  # x coordinates of all atoms in all frames
+
+The coordinates of a DCD frame are stored as one block of x, then y, then z
+values, so the arrays are strided views over these blocks. The pages of the
+file are loaded by the operating system when they are accessed. Files with
+fixed atoms can not be mapped.
+
+
 Classes
 -------
 
@@ -113,7 +135,8 @@ class DCDReader(base.ReaderBase):
     flavor = 'CHARMM'
     units = {'time': 'AKMA', 'length': 'Angstrom'}
 
-    def __init__(self, filename, convert_units=True, dt=None, **kwargs):
+    def __init__(self, filename, convert_units=True, dt=None, mmap=False,
+                 **kwargs):
         """
         Parameters
         ----------
@@ -123,17 +146,26 @@ class DCDReader(base.ReaderBase):
             convert units to MDAnalysis units
         dt : float (optional)
             overwrite time delta stored in DCD
+        mmap : bool (optional)
+            map the file into memory instead of reading it frame by frame, see
+            :ref:`Memory mapped DCD files <dcd-mmap-label>`
         **kwargs : dict
             General reader arguments.
 
 
         .. versionchanged:: 0.17.0
            Changed to use libdcd.pyx library and removed the correl function
+        .. versionchanged:: 2.0.0
+           Added the `mmap` keyword
         """
         super(DCDReader, self).__init__(
             filename, convert_units=convert_units, **kwargs)
         self._file = DCDFile(self.filename)
         self.n_atoms = self._file.header['natoms']
+        self._mmap = mmap
+        self._mmap_xyz = self._mmap_unitcell = None
+        if mmap:
+            self._open_mmap()
 
         delta = mdaunits.convert(self._file.header['delta'],
                                  self.units['time'], 'ps')
@@ -162,6 +194,71 @@ class DCDReader(base.ReaderBase):
             n_atoms = f.header['natoms']
         return n_atoms
 
+    def _open_mmap(self):
+        """map the frames of the file into memory as read-only arrays
+
+        In a frame the unit cell record (if any) is followed by one record
+        each for the x, y and z coordinates of all atoms; every record is
+        framed by two 4 byte integers holding its size.
+        """
+        header_size = self._file._header_size
+        framesize = self._file._framesize
+        if self._file._firstframesize != framesize:
+            raise ValueError("DCD files with fixed atoms can not be memory "
+                             "mapped: {}".format(self.filename))
+        # the header starts with the size of its first record, 84
+        endian = ('<' if np.fromfile(self.filename, dtype='<i4',
+                                     count=1)[0] == 84 else '>')
+        ndims = self._file.ndims
+        recordsize = (self.n_atoms + 2) * 4
+        cellsize = framesize - ndims * recordsize
+        data = np.memmap(self.filename, dtype=np.uint8, mode='r',
+                         offset=header_size,
+                         shape=(self.n_frames * framesize,))
+        self._mmap_xyz = np.ndarray((self.n_frames, self.n_atoms, ndims),
+                                    dtype=endian + 'f4', buffer=data,
+                                    offset=cellsize + 4,
+                                    strides=(framesize, 4, recordsize))
+        if cellsize:
+            self._mmap_unitcell = np.ndarray((self.n_frames, 6),
+                                             dtype=endian + 'f8', buffer=data,
+                                             offset=4, strides=(framesize, 8))
+
+    @staticmethod
+    def _mmap_slice(start, stop, step):
+        """slice of the mapped frames in ``range(start, stop, step)``"""
+        # a negative stop ends a reversed range before the first frame
+        return slice(start, stop if stop >= 0 else None, step)
+
+    def _mmap_to_ts(self, i, ts):
+        """copy frame `i` from the memory mapped file into `ts`"""
+        ts.frame = i
+        ts.time = (i + self._file.header['istart']/self._file.header['nsavc']) * self.ts.dt
+        ts.data['step'] = i + 1
+        if self._mmap_unitcell is not None:
+            ts.dimensions = self._unitcell_to_dimensions(self._mmap_unitcell[i])
+        else:
+            ts.dimensions = self._unitcell_to_dimensions(self._no_unitcell)
+        ts.positions = self._mmap_xyz[i, :, :3]
+
+        if self.convert_units:
+            self.convert_pos_from_native(ts.dimensions[:3])
+            self.convert_pos_from_native(ts.positions)
+
+        return ts
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the maps are rebuilt instead of pickling the whole trajectory
+        state['_mmap_xyz'] = state['_mmap_unitcell'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__ = state
+        if self._mmap:
+            self._open_mmap()
+        super(DCDReader, self).__setstate__(state)
+
     def close(self):
         """close reader"""
         self._file.close()
@@ -181,7 +278,8 @@ class DCDReader(base.ReaderBase):
     def _read_frame(self, i):
         """read frame i"""
         self._frame = i - 1
-        self._file.seek(i)
+        if self._mmap_xyz is None:
+            self._file.seek(i)
         return self._read_next_timestep()
 
     def _read_next_timestep(self, ts=None):
@@ -192,9 +290,12 @@ class DCDReader(base.ReaderBase):
             # use a copy to avoid that ts always points to the same reference
             # removing this breaks lammps reader
             ts = self.ts.copy()
-        frame = self._file.read()
         self._frame += 1
-        ts = self._frame_to_ts(frame, ts)
+        if self._mmap_xyz is not None:
+            ts = self._mmap_to_ts(self._frame, ts)
+        else:
+            frame = self._file.read()
+            ts = self._frame_to_ts(frame, ts)
         self.ts = ts
         return ts
 
@@ -214,10 +315,24 @@ class DCDReader(base.ReaderBase):
         ts.frame = self._frame
         ts.time = (ts.frame + self._file.header['istart']/self._file.header['nsavc']) * self.ts.dt
         ts.data['step'] = self._file.tell()
+        ts.dimensions = self._unitcell_to_dimensions(frame.unitcell)
+        ts.positions = frame.xyz
+
+        if self.convert_units:
+            self.convert_pos_from_native(ts.dimensions[:3])
+            self.convert_pos_from_native(ts.positions)
+
+        return ts
+
+    #: raw unit cell of frames without one, as read by :class:`DCDFile`
+    _no_unitcell = np.array([0., 90., 0., 90., 90., 0.])
 
+    @staticmethod
+    def _unitcell_to_dimensions(unitcell):
+        """convert a raw dcd unitcell to ``[A, B, C, alpha, beta, gamma]``"""
         # The original unitcell is read as ``[A, gamma, B, beta, alpha, C]``
         _ts_order = [0, 2, 5, 4, 3, 1]
-        uc = np.take(frame.unitcell, _ts_order)
+        uc = np.take(unitcell, _ts_order)
 
         pi_2 = np.pi / 2
         if (-1.0 <= uc[3] <= 1.0) and (-1.0 <= uc[4] <= 1.0) and (
@@ -234,7 +349,7 @@ class DCDReader(base.ReaderBase):
         # heuristic sanity check: uc = A,B,C,alpha,beta,gamma
         elif np.any(uc < 0.) or np.any(uc[3:] > 180.):
             # might be new CHARMM: box matrix vectors
-            H = frame.unitcell.copy()
+            H = unitcell.copy()
             e1, e2, e3 = H[[0, 1, 3]], H[[1, 2, 4]], H[[3, 4, 5]]
             uc = triclinic_box(e1, e2, e3)
         else:
@@ -242,14 +357,31 @@ class DCDReader(base.ReaderBase):
             # angles are specified in degrees rather than angle cosines.
             pass
 
-        ts.dimensions = uc
-        ts.positions = frame.xyz
-
+        return uc
+
+    def _read_block(self, start, stop, step, atom_indices, positions,
+                    dimensions):
+        """read a block of frames with :meth:`DCDFile.readframes` or from the
+        memory mapped file"""
+        if self._mmap_xyz is not None:
+            xyz = self._mmap_xyz[self._mmap_slice(start, stop, step), :, :3]
+            positions[:] = (xyz if atom_indices is None
+                            else xyz[:, atom_indices])
+            if self._mmap_unitcell is not None:
+                unitcells = self._mmap_unitcell[
+                    self._mmap_slice(start, stop, step)]
+            else:
+                unitcells = np.tile(self._no_unitcell, (len(positions), 1))
+        else:
+            frames = self._file.readframes(start, stop, step, order='fac',
+                                           indices=atom_indices)
+            positions[:] = frames.xyz
+            unitcells = frames.unitcell
+        for k, unitcell in enumerate(unitcells):
+            dimensions[k] = self._unitcell_to_dimensions(unitcell)
         if self.convert_units:
-            self.convert_pos_from_native(ts.dimensions[:3])
-            self.convert_pos_from_native(ts.positions)
-
-        return ts
+            self.convert_pos_from_native(positions)
+            self.convert_pos_from_native(dimensions[:, :3])
 
     @property
     def dimensions(self):
@@ -297,6 +429,9 @@ class DCDReader(base.ReaderBase):
 
         .. versionchanged:: 1.0.0
            `skip` and `format` keywords have been removed.
+        .. versionchanged:: 2.0.0
+           Returns a read-only view of the memory mapped file for all atoms
+           if the reader was opened with ``mmap=True``.
         """
 
         start, stop, step = self.check_slice_indices(start, stop, step)
@@ -309,6 +444,16 @@ class DCDReader(base.ReaderBase):
         else:
             atom_numbers = list(range(self.n_atoms))
 
+        if self._mmap_xyz is not None:
+            if sorted(order) != ['a', 'c', 'f']:
+                raise ValueError("unkown order '{}'".format(order))
+            xyz = self._mmap_xyz[self._mmap_slice(start, stop, step)]
+            if asel is not None:
+                xyz = xyz[:, atom_numbers]
+            if not xyz.dtype.isnative:
+                xyz = xyz.astype(np.float32)
+            return xyz.transpose(['fac'.index(c) for c in order])
+
         frames = self._file.readframes(
             start, stop, step, order=order, indices=atom_numbers)
         return frames.xyz
@@ -178,39 +178,37 @@ class GROReader(base.SingleFrameReaderBase):
             grofile.readline()
             self.n_atoms = n_atoms = int(grofile.readline())
             self.ts = ts = self._Timestep(n_atoms, **self._ts_kwargs)
-            # Always try, and maybe add them later
-            velocities = np.zeros((n_atoms, 3), dtype=np.float32)
-            missed_vel = False
-
-            # and the third line to get the spacing between coords (cs)
-            # (dependent upon the GRO file precision)
-            first_atomline = grofile.readline()
-            cs = first_atomline[25:].find('.') + 1
-            ts._pos[0] = [first_atomline[20 + cs * i:20 + cs * (i + 1)]
-                          for i in range(3)]
+            # 2 header lines, 1 box line at end
+            lines = [grofile.readline() for _ in range(n_atoms)]
+            line = grofile.readline()
             try:
-                velocities[0] = [first_atomline[20 + cs * i:20 + cs * (i + 1)]
-                                 for i in range(3, 6)]
+                unitcell = np.float32(line.split())
             except ValueError:
-                # Remember that we got this error
-                missed_vel = True
-
-            for pos, line in enumerate(grofile, start=1):
-                # 2 header lines, 1 box line at end
-                if pos == n_atoms:
+                # Try to parse floats with 5 digits if no spaces between values...
+                unitcell = np.float32(re.findall(r"(\d+\.\d{5})", line))
+
+        # the spacing between coords (cs) of the first atom line
+        # (dependent upon the GRO file precision)
+        cs = lines[0][25:].find('.') + 1
+        columns = [(20 + cs * i, 20 + cs * (i + 1)) for i in range(6)]
+        # all fields are converted at once
+        ts._pos[:] = util.fixed_width_floats(lines, columns[:3], np.float32)
+        # Always try, and maybe add them later
+        velocities = np.zeros((n_atoms, 3), dtype=np.float32)
+        missed_vel = False
+        if max(map(len, lines)) > columns[3][0] + 1:
+            try:
+                velocities[:] = util.fixed_width_floats(lines, columns[3:],
+                                                        np.float32)
+            except ValueError:
+                # not all lines have velocities, read them line by line
+                for pos, line in enumerate(lines):
                     try:
-                        unitcell = np.float32(line.split())
+                        velocities[pos] = [line[start:stop]
+                                           for start, stop in columns[3:]]
                     except ValueError:
-                        # Try to parse floats with 5 digits if no spaces between values...
-                        unitcell = np.float32(re.findall(r"(\d+\.\d{5})", line))
-                    break
-
-                ts._pos[pos] = [line[20 + cs * i:20 + cs * (i + 1)] for i in range(3)]
-                try:
-                    velocities[pos] = [line[20 + cs * i:20 + cs * (i + 1)] for i in range(3, 6)]
-                except ValueError:
-                    # Remember that we got this error
-                    missed_vel = True
+                        # Remember that we got this error
+                        missed_vel = True
 
         if np.any(velocities):
             ts.velocities = velocities
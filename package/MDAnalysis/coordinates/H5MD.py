@@ -137,6 +137,28 @@ If you have questions or want to share how you managed to build
 parallel hdf5/h5py/mpi4py please let everyone know on the
 `MDAnalysis forums`_.
 
+.. _h5md-chunks-label:
+
+Chunked and compressed files
+----------------------------
+
+The datasets of H5MD files are often stored in chunks of several frames that
+are compressed as a whole, so that reading a single frame decompresses the
+whole chunk.  The :class:`H5MDReader` keeps recently read chunks of frames in
+a cache of `chunk_cache` bytes (32 MiB by default) so that consecutive frames
+do not decompress the same chunk again, and
+:meth:`~MDAnalysis.coordinates.base.ProtoReader.read_block` reads whole
+blocks of frames with one read per dataset::
+
+    u = mda.Universe("topology.tpr", "trajectory.h5md",
+                     chunk_cache=256 * 2**20)
+    positions, dimensions = u.trajectory.read_block(0, 1000)
+
+Without MPI, a trajectory can be read by several processes at once, each
+opening the file itself, for instance with the ``'multiprocessing'`` backend
+of :meth:`~MDAnalysis.analysis.base.AnalysisBase.run` (the reader is pickled
+with its file name, see :class:`H5PYPicklable`).
+
 .. _`H5MD`: https://nongnu.org/h5md/index.html
 .. _`HDF5`: https://www.hdfgroup.org/solutions/hdf5/
 .. _`H5PY`: http://docs.h5py.org/
@@ -180,11 +202,17 @@ Classes
 
    .. automethod:: H5MDReader._reopen
 
+.. autoclass:: H5MDWriter
+   :members:
+
 .. autoclass:: H5PYPicklable
    :members:
 
 """
 
+import warnings
+from collections import OrderedDict
+
 import numpy as np
 import MDAnalysis as mda
 from . import base, core
@@ -385,6 +413,7 @@ class H5MDReader(base.ReaderBase):
                  convert_units=True,
                  driver=None,
                  comm=None,
+                 chunk_cache=32 * 2**20,
                  **kwargs):
         """
         Parameters
@@ -398,6 +427,10 @@ class H5MDReader(base.ReaderBase):
         comm : :class:`MPI.Comm` (optional)
             MPI communicator used to open H5MD file
             Must be passed with `'mpio'` file driver
+        chunk_cache : int (optional)
+            bytes of chunks of frames of chunked datasets that are kept in
+            memory, see :ref:`h5md-chunks-label`; ``0`` reads every frame
+            from the file
         **kwargs : dict
             General reader arguments.
 
@@ -420,6 +453,9 @@ class H5MDReader(base.ReaderBase):
             when the H5MD file has no 'position', 'velocity', or
             'force' group
 
+
+        .. versionchanged:: 2.0.0
+           Added the `chunk_cache` keyword
         """
         if not HAS_H5PY:
             raise RuntimeError("Please install h5py")
@@ -431,6 +467,7 @@ class H5MDReader(base.ReaderBase):
         # opened with parallel h5py/hdf5 enabled
         self._driver = driver
         self._comm = comm
+        self._chunk_cache_size = chunk_cache
         if (self._comm is not None) and (self._driver != 'mpio'):
             raise ValueError("If MPI communicator object is used to open"
                              " h5md file, ``driver='mpio'`` must be passed.")
@@ -562,6 +599,9 @@ class H5MDReader(base.ReaderBase):
     def open_trajectory(self):
         """opens the trajectory file using h5py library"""
         self._frame = -1
+        # chunks of frames by (dataset name, chunk index)
+        self._chunk_cache = OrderedDict()
+        self._chunk_cache_nbytes = 0
         if isinstance(self.filename, h5py.File):
             self._file = self.filename
             self._driver = self._file.driver
@@ -590,17 +630,51 @@ class H5MDReader(base.ReaderBase):
             if value:
                 return self._particle_group[name]['value'].shape[0]
 
+    def _read_cached(self, dataset, frame):
+        """frame `frame` of `dataset`, through the cache of chunks of frames
+
+        Chunked datasets are read a whole chunk of frames at a time; the
+        chunks read last are kept up to `chunk_cache` bytes.
+        """
+        chunks = dataset.chunks
+        if not self._chunk_cache_size or chunks is None:
+            return dataset[frame]
+        n_frames = dataset.shape[0]
+        if not -n_frames <= frame < n_frames:
+            raise ValueError("frame {} out of range".format(frame))
+        frame %= n_frames
+        index = frame // chunks[0]
+        key = (dataset.name, index)
+        try:
+            self._chunk_cache.move_to_end(key)
+            block = self._chunk_cache[key]
+        except KeyError:
+            start = index * chunks[0]
+            nbytes = (min(chunks[0], n_frames - start) * dataset.dtype.itemsize
+                      * int(np.prod(dataset.shape[1:])))
+            if nbytes > self._chunk_cache_size:
+                return dataset[frame]
+            block = dataset[start:start + chunks[0]]
+            self._chunk_cache[key] = block
+            self._chunk_cache_nbytes += block.nbytes
+            while self._chunk_cache_nbytes > self._chunk_cache_size:
+                _, old = self._chunk_cache.popitem(last=False)
+                self._chunk_cache_nbytes -= old.nbytes
+        return block[frame - index * chunks[0]]
+
     def _read_frame(self, frame):
         """reads data from h5md file and copies to current timestep"""
         try:
             for name, value in self._has.items():
                 if value:
-                    _ = self._particle_group[name]['step'][frame]
+                    _ = self._read_cached(self._particle_group[name]['step'],
+                                          frame)
                     break
             else:
                 raise NoDataError("Provide at least a position, velocity"
                                   " or force group in the h5md file.")
-        except ValueError:
+        except (ValueError, IndexError):
+            # h5py raises IndexError for frames out of range from version 3
             raise IOError from None
 
         self._frame = frame
@@ -616,7 +690,8 @@ class H5MDReader(base.ReaderBase):
         # Sets frame box dimensions
         # Note: H5MD files must contain 'box' group in each 'particles' group
         if 'edges' in particle_group['box'] and ts._unitcell is not None:
-            ts._unitcell[:] = particle_group['box/edges/value'][frame, :]
+            ts._unitcell[:] = self._read_cached(
+                particle_group['box/edges/value'], frame)
         else:
             # sets ts.dimensions = None
             ts._unitcell = None
@@ -640,22 +715,24 @@ class H5MDReader(base.ReaderBase):
 
         if 'observables' in self._file:
             for key in self._file['observables'].keys():
-                self.ts.data[key] = self._file['observables'][key][
-                    'value'][self._frame]
+                # a copy, not a view of the cached chunk
+                self.ts.data[key] = np.array(self._read_cached(
+                    self._file['observables'][key]['value'],
+                    self._frame))[()]
 
         # pulls 'time' out of first available parent group
         for name, value in self._has.items():
             if value:
                 if 'time' in self._particle_group[name]:
-                    self.ts.data['time'] = self._particle_group[name][
-                        'time'][self._frame]
+                    self.ts.data['time'] = self._read_cached(
+                        self._particle_group[name]['time'], self._frame)
                     break
 
     def _get_frame_dataset(self, dataset):
         """retrieves dataset array at current frame"""
 
-        frame_dataset = self._particle_group[
-            dataset]['value'][self._frame, :]
+        frame_dataset = self._read_cached(
+            self._particle_group[dataset]['value'], self._frame)
         n_atoms_now = frame_dataset.shape[0]
         if n_atoms_now != self.n_atoms:
             raise ValueError("Frame {} has {} atoms but the initial frame"
@@ -687,10 +764,60 @@ class H5MDReader(base.ReaderBase):
         if self._has['force']:
             self.convert_forces_from_native(self.ts.forces)
 
+    def _read_block(self, start, stop, step, atom_indices, positions,
+                    dimensions):
+        """read a block of frames by slicing the hdf5 datasets"""
+        if not self._has['position']:
+            return super(H5MDReader, self)._read_block(
+                start, stop, step, atom_indices, positions, dimensions)
+        particle_group = self._particle_group
+        if step > 0:
+            frames, order = slice(start, stop, step), slice(None)
+        else:
+            # h5py only slices forwards: read the frames forwards and reverse
+            last = range(start, stop, step)[-1]
+            frames, order = slice(last, start + 1, -step), slice(None, None, -1)
+        block = particle_group['position/value'][frames][order]
+        if block.shape[1] != self.n_atoms:
+            raise ValueError("Frames {} have {} atoms but the initial frame"
+                             " has {} atoms. MDAnalysis is unable to deal"
+                             " with variable topology!"
+                             "".format(frames, block.shape[1], self.n_atoms))
+        positions[:] = block if atom_indices is None else block[:, atom_indices]
+        if 'edges' in particle_group['box'] and self.ts._unitcell is not None:
+            unitcell = np.zeros((3, 3), dtype=np.float32)
+            for k, edges in enumerate(
+                    particle_group['box/edges/value'][frames][order]):
+                unitcell[:] = edges
+                dimensions[k] = core.triclinic_box(*unitcell)
+        if self.convert_units:
+            self.convert_pos_from_native(positions)
+            self.convert_pos_from_native(dimensions[:, :3])
+
     def _read_next_timestep(self):
         """read next frame in trajectory"""
         return self._read_frame(self._frame + 1)
 
+    def Writer(self, filename, n_atoms=None, **kwargs):
+        """Return a :class:`H5MDWriter` for `filename`
+
+        Parameters
+        ----------
+        filename : str
+            trajectory filename
+        n_atoms : int (optional)
+            number of atoms, by default the number of atoms of this
+            trajectory
+        **kwargs : dict
+            keyword arguments of :class:`H5MDWriter`
+
+
+        .. versionadded:: 2.0.0
+        """
+        if n_atoms is None:
+            n_atoms = self.n_atoms
+        return H5MDWriter(filename, n_atoms=n_atoms, **kwargs)
+
     def close(self):
         """close reader"""
         self._file.close()
@@ -745,6 +872,8 @@ class H5MDReader(base.ReaderBase):
     def __getstate__(self):
         state = self.__dict__.copy()
         del state['_particle_group']
+        state['_chunk_cache'] = OrderedDict()
+        state['_chunk_cache_nbytes'] = 0
         return state
 
     def __setstate__(self, state):
@@ -754,6 +883,370 @@ class H5MDReader(base.ReaderBase):
         self[self.ts.frame]
 
 
+class H5MDWriter(base.WriterBase):
+    """Writer for the H5MD format.
+
+    The writer creates the HDF5 hierarchy read by the :class:`H5MDReader`
+    (see there) and stores positions, velocities and forces in the standard
+    MDAnalysis units. All datasets that depend on the frame can grow, so
+    frames are appended to them as they are written; their chunk shape and
+    compression are set with `chunks`, `compression` and
+    `compression_opts` (see :ref:`h5md-chunks-label`).
+
+    Velocities and forces are written if they are requested and present in
+    the first frame written; the box is written if the first frame has
+    one, otherwise (no or all-zero dimensions) the boundary is ``'none'`` and
+    no ``edges`` are written, and a warning is issued if later frames have a
+    box. The step of each frame is taken from ``ts.data['step']`` if present
+    and is the frame index otherwise.
+
+    Whole blocks of frames, for instance as returned by
+    :meth:`~MDAnalysis.coordinates.base.ProtoReader.read_block`, are written
+    at once with :meth:`write_block`::
+
+        with H5MDWriter("out.h5md", u.atoms.n_atoms) as W:
+            for start in range(0, u.trajectory.n_frames, 100):
+                W.write_block(*u.trajectory.read_block(start, start + 100))
+
+
+    .. versionadded:: 2.0.0
+
+    """
+
+    format = 'H5MD'
+    multiframe = True
+    units = {'time': 'ps',
+             'length': 'Angstrom',
+             'velocity': 'Angstrom/ps',
+             'force': 'kJ/(mol*Angstrom)'}
+
+    # units in H5MD notation, see H5MDReader._unit_translation
+    _h5md_units = {'time': 'ps',
+                   'position': 'Angstrom',
+                   'velocity': 'Angstrom ps-1',
+                   'force': 'kJ mol-1 Angstrom-1'}
+
+    #: bytes of a chunk of frames of the default chunk shape
+    _chunk_bytes = 2**19
+
+    def __init__(self, filename, n_atoms, n_frames=None, convert_units=True,
+                 chunks=None, compression=None, compression_opts=None,
+                 positions=True, velocities=True, forces=True,
+                 author='N/A', author_email=None, creator='MDAnalysis',
+                 creator_version=mda.__version__, **kwargs):
+        """
+        Parameters
+        ----------
+        filename : str
+            trajectory filename
+        n_atoms : int
+            number of atoms to be written
+        n_frames : int (optional)
+            number of frames that will be written; the datasets are created
+            with this many frames and shrunk to the frames actually written on
+            :meth:`close`
+        convert_units : bool (optional)
+            convert from MDAnalysis units to the units of the file, which are
+            the MDAnalysis units
+        chunks : tuple (optional)
+            chunk shape ``(frames, atoms, 3)`` of the position, velocity and
+            force datasets; by default, chunks hold as many whole frames as
+            fit into 512 KiB
+        compression : str (optional)
+            HDF5 compression filter of the frame datasets, ``'gzip'`` or
+            ``'lzf'``; ``None`` writes them uncompressed
+        compression_opts : int (optional)
+            compression level 0 to 9 for ``'gzip'`` compression
+        positions : bool (optional)
+            write positions
+        velocities : bool (optional)
+            write velocities if the frames have velocities
+        forces : bool (optional)
+            write forces if the frames have forces
+        author : str (optional)
+            name of the author of the file
+        author_email : str (optional)
+            email address of the author of the file
+        creator : str (optional)
+            name of the program that created the file
+        creator_version : str (optional)
+            version of the program that created the file
+        **kwargs : dict
+            General writer arguments
+
+        Raises
+        ------
+        RuntimeError
+            when `H5PY`_ is not installed
+        ValueError
+            when `compression` is not ``'gzip'``, ``'lzf'`` or ``None``
+        """
+        self._file = None
+        if not HAS_H5PY:
+            raise RuntimeError("Please install h5py")
+        if compression not in (None, 'gzip', 'lzf'):
+            raise ValueError("compression must be 'gzip', 'lzf' or None,"
+                             " not {!r}".format(compression))
+        self.filename = filename
+        self.n_atoms = n_atoms
+        self.n_frames = n_frames
+        self.convert_units = convert_units
+        if chunks is None:
+            chunks = (max(1, self._chunk_bytes // max(1, 12 * n_atoms)),
+                      n_atoms, 3)
+            if n_frames:
+                chunks = (min(chunks[0], n_frames),) + chunks[1:]
+        self.chunks = tuple(chunks)
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self._write = {'position': positions,
+                       'velocity': velocities,
+                       'force': forces}
+        self._has = None
+        self._n_written = 0
+        self._warned_box = False
+
+        self._file = h5py.File(self.filename, 'w')
+        h5md = self._file.require_group('h5md')
+        h5md.attrs['version'] = np.array([1, 1], dtype=np.int32)
+        h5md.require_group('author').attrs['name'] = author
+        if author_email is not None:
+            h5md['author'].attrs['email'] = author_email
+        h5md.require_group('creator').attrs['name'] = creator
+        h5md['creator'].attrs['version'] = creator_version
+
+    def _create_datasets(self, has_positions, has_velocities, has_forces,
+                         has_box):
+        """create the groups and growable datasets for the frames"""
+        self._has = {'position': has_positions and self._write['position'],
+                     'velocity': has_velocities and self._write['velocity'],
+                     'force': has_forces and self._write['force']}
+        if not any(self._has.values()):
+            raise NoDataError("The frames have none of the positions,"
+                              " velocities or forces that are written.")
+        size = self.n_frames or 0
+        group = self._file.require_group('particles/trajectory')
+        box = group.require_group('box')
+        box.attrs['dimension'] = 3
+        box.attrs['boundary'] = np.array(
+            3 * ['periodic' if has_box else 'none'], dtype='S8')
+
+        # step and time are shared by all groups through hard links
+        step_time = None
+        self._datasets = {}
+        for name in ('position', 'velocity', 'force'):
+            if not self._has[name]:
+                continue
+            g = group.require_group(name)
+            if step_time is None:
+                g.create_dataset('step', (size,), maxshape=(None,),
+                                 dtype=np.int32, chunks=(self.chunks[0],))
+                g.create_dataset('time', (size,), maxshape=(None,),
+                                 dtype=np.float64, chunks=(self.chunks[0],))
+                g['time'].attrs['unit'] = self._h5md_units['time']
+                step_time = g
+            else:
+                g['step'] = step_time['step']
+                g['time'] = step_time['time']
+            g.create_dataset('value', (size, self.n_atoms, 3),
+                             maxshape=(None, self.n_atoms, 3),
+                             dtype=np.float32, chunks=self.chunks,
+                             compression=self.compression,
+                             compression_opts=self.compression_opts)
+            g['value'].attrs['unit'] = self._h5md_units[name]
+            self._datasets[name] = g['value']
+        self._datasets['step'] = step_time['step']
+        self._datasets['time'] = step_time['time']
+        if has_box:
+            edges = box.require_group('edges')
+            edges['step'] = step_time['step']
+            edges['time'] = step_time['time']
+            edges.create_dataset('value', (size, 3, 3),
+                                 maxshape=(None, 3, 3), dtype=np.float32,
+                                 chunks=(self.chunks[0], 3, 3))
+            edges['value'].attrs['unit'] = self._h5md_units['position']
+            self._datasets['edges'] = edges['value']
+
+    @staticmethod
+    def _has_box(dimensions):
+        """whether `dimensions` describe a unitcell; all zeros means no box"""
+        return dimensions is not None and np.any(dimensions)
+
+    def _resize(self, n_frames):
+        """grow all frame datasets to at least `n_frames` frames"""
+        for dataset in self._datasets.values():
+            if dataset.shape[0] < n_frames:
+                dataset.resize(n_frames, axis=0)
+
+    def _write_next_frame(self, ag):
+        """Write information associated with ``ag`` at current frame into trajectory
+
+        Parameters
+        ----------
+        ag : AtomGroup or Universe
+        """
+        try:
+            # Atomgroup?
+            ts = ag.ts
+        except AttributeError:
+            try:
+                # Universe?
+                ts = ag.trajectory.ts
+            except AttributeError:
+                errmsg = "Input obj is neither an AtomGroup or Universe"
+                raise TypeError(errmsg) from None
+
+        if ts.n_atoms != self.n_atoms:
+            raise IOError("H5MDWriter: Timestep does not have the correct"
+                          " number of atoms")
+        if self._has is None:
+            self._create_datasets(ts.has_positions, ts.has_velocities,
+                                  ts.has_forces, self._has_box(ts.dimensions))
+        self._write_frames(
+            positions=ts.positions[np.newaxis] if self._has['position']
+            else None,
+            velocities=ts.velocities[np.newaxis] if self._has['velocity']
+            else None,
+            forces=ts.forces[np.newaxis] if self._has['force'] else None,
+            dimensions=None if ts.dimensions is None
+            else ts.dimensions[np.newaxis],
+            times=np.array([ts.time]),
+            steps=np.array([ts.data.get('step', ts.frame)]))
+
+    def write_block(self, positions=None, dimensions=None, velocities=None,
+                    forces=None, times=None, steps=None):
+        """Append a block of frames to the trajectory
+
+        Parameters
+        ----------
+        positions : numpy.ndarray (optional)
+            positions of shape ``(n_frames, n_atoms, 3)``
+        dimensions : numpy.ndarray (optional)
+            unitcells ``[A, B, C, alpha, beta, gamma]`` of shape
+            ``(n_frames, 6)``
+        velocities : numpy.ndarray (optional)
+            velocities of shape ``(n_frames, n_atoms, 3)``
+        forces : numpy.ndarray (optional)
+            forces of shape ``(n_frames, n_atoms, 3)``
+        times : numpy.ndarray (optional)
+            times of the frames; by default the index of the frame
+        steps : numpy.ndarray (optional)
+            integration steps of the frames; by default the index of the
+            frame
+
+        Raises
+        ------
+        ValueError
+            when none of `positions`, `velocities` and `forces` is given, or
+            when the arrays do not have the same number of frames or the
+            number of atoms of the writer
+        NoDataError
+            when an array that was written with the first frames is missing
+
+
+        .. versionadded:: 2.0.0
+        """
+        arrays = {'position': positions,
+                  'velocity': velocities,
+                  'force': forces}
+        arrays = {k: None if v is None else np.asarray(v)
+                  for k, v in arrays.items()}
+        lengths = {len(v) for v in arrays.values() if v is not None}
+        if not lengths:
+            raise ValueError("No data given: at least one of positions,"
+                             " velocities and forces is required")
+        if len(lengths) != 1:
+            raise ValueError("positions, velocities and forces must have"
+                             " the same number of frames")
+        n_frames = lengths.pop()
+        for name, array in arrays.items():
+            if array is not None and array.shape != (n_frames,
+                                                     self.n_atoms, 3):
+                raise ValueError("{} have shape {} instead of ({}, {}, 3)"
+                                 "".format(name, array.shape, n_frames,
+                                           self.n_atoms))
+        # check everything before the datasets are created or grown
+        for name, array in (('dimensions', dimensions), ('times', times),
+                            ('steps', steps)):
+            if array is not None and len(array) != n_frames:
+                raise ValueError("{} have {} frames instead of {}"
+                                 "".format(name, len(array), n_frames))
+        if self._has is None:
+            self._create_datasets(positions is not None,
+                                  velocities is not None,
+                                  forces is not None,
+                                  self._has_box(dimensions))
+        first = self._n_written
+        if times is None:
+            times = np.arange(first, first + n_frames)
+        if steps is None:
+            steps = np.arange(first, first + n_frames)
+        self._write_frames(positions=arrays['position'],
+                           velocities=arrays['velocity'],
+                           forces=arrays['force'], dimensions=dimensions,
+                           times=times, steps=steps)
+
+    def _write_frames(self, positions, velocities, forces, dimensions, times,
+                      steps):
+        """write the frames to the datasets after the last written frame"""
+        arrays = {'position': positions,
+                  'velocity': velocities,
+                  'force': forces}
+        for name, written in self._has.items():
+            if written and arrays[name] is None:
+                raise NoDataError("The first frames were written with {0}s,"
+                                  " the new frames have no {0}s."
+                                  "".format(name))
+        if ('edges' not in self._datasets and not self._warned_box
+                and self._has_box(dimensions)):
+            warnings.warn("H5MDWriter: the first frames were written without"
+                          " a box, the boxes of the new frames are not"
+                          " written.")
+            self._warned_box = True
+        n_frames = len(times)
+        first = self._n_written
+        frames = slice(first, first + n_frames)
+        self._resize(first + n_frames)
+
+        convert = {'position': self.convert_pos_to_native,
+                   'velocity': self.convert_velocities_to_native,
+                   'force': self.convert_forces_to_native}
+        for name, written in self._has.items():
+            if written:
+                values = np.array(arrays[name], dtype=np.float32)
+                if self.convert_units:
+                    convert[name](values)
+                self._datasets[name][frames] = values
+        if 'edges' in self._datasets:
+            edges = np.zeros((n_frames, 3, 3), dtype=np.float32)
+            if dimensions is not None:
+                for k, box in enumerate(np.asarray(dimensions)):
+                    edges[k] = core.triclinic_vectors(box)
+            if self.convert_units:
+                self.convert_pos_to_native(edges)
+            self._datasets['edges'][frames] = edges
+        times = np.asarray(times, dtype=np.float64)
+        if self.convert_units:
+            times = self.convert_time_to_native(times, inplace=False)
+        self._datasets['time'][frames] = times
+        self._datasets['step'][frames] = steps
+        self._n_written += n_frames
+
+    def close(self):
+        """close trajectory
+
+        Frames that were reserved with `n_frames` but not written are
+        removed.
+        """
+        if self._file is None:
+            return
+        if self._has is not None:
+            for dataset in self._datasets.values():
+                dataset.resize(self._n_written, axis=0)
+        self._file.close()
+        self._file = None
+
+
 class H5PYPicklable(h5py.File):
     """H5PY file object (read-only) that can be pickled.
 
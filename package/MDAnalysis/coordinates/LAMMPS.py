@@ -132,6 +132,7 @@ from .. import units
 from ..topology.LAMMPSParser import DATAParser
 from ..exceptions import NoDataError
 from . import base
+from .offsets import cached_offsets
 
 btype_sections = {'bond':'Bonds', 'angle':'Angles',
                   'dihedral':'Dihedrals', 'improper':'Impropers'}
@@ -487,6 +488,13 @@ class DumpReader(base.ReaderBase):
     @property
     @cached('n_frames')
     def n_frames(self):
+        data = cached_offsets(self.filename, self._scan_offsets,
+                              reader=self.__class__.__name__,
+                              n_atoms=self.n_atoms)
+        self._offsets = data['offsets'].tolist()
+        return len(self._offsets)
+
+    def _scan_offsets(self):
         # 2(timestep) + 2(natoms info) + 4(box info) + 1(atom header) + n_atoms
         lines_per_frame = self.n_atoms + 9
         offsets = []
@@ -498,8 +506,8 @@ class DumpReader(base.ReaderBase):
                     offsets.append(f.tell())
                 line = f.readline()
                 counter += 1
-        self._offsets = offsets[:-1]  # last is EOF
-        return len(self._offsets)
+        # last is EOF
+        return {'offsets': np.array(offsets[:-1], dtype=np.int64)}
 
     def close(self):
         if hasattr(self, '_file'):
@@ -550,17 +558,14 @@ class DumpReader(base.ReaderBase):
             alpha = beta = gamma = 90.
         ts.dimensions = xlen, ylen, zlen, alpha, beta, gamma
 
-        indices = np.zeros(self.n_atoms, dtype=int)
-
         f.readline()  # ITEM ATOMS etc
-        for i in range(self.n_atoms):
-            idx, _, xs, ys, zs = f.readline().split()
-
-            indices[i] = idx
-            ts.positions[i] = xs, ys, zs
+        # id type xs ys zs, converted at once
+        atoms = util.whitespace_floats(
+            [f.readline() for _ in range(self.n_atoms)], 5)
+        indices = atoms[:, 0].astype(np.int64)
 
         order = np.argsort(indices)
-        ts.positions = ts.positions[order]
+        ts.positions = atoms[order, 2:]
         # by default coordinates are given in scaled format, undo that
         ts.positions = distances.transform_StoR(ts.positions, ts.dimensions)
 
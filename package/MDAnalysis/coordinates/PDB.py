@@ -152,6 +152,7 @@ import numpy as np
 
 from ..lib import util
 from . import base
+from .offsets import cached_offsets
 from ..topology.core import guess_atom_element
 from ..exceptions import NoDataError
 
@@ -267,14 +268,36 @@ class PDBReader(base.ReaderBase):
             self.n_atoms = top.n_atoms
 
         self.model_offset = kwargs.pop("model_offset", 0)
+        self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
+
+        # hack for streamIO
+        if isinstance(filename, util.NamedStream) and isinstance(filename.stream, StringIO):
+            filename.stream = BytesIO(filename.stream.getvalue().encode())
+
+        self._pdbfile = util.anyopen(filename, 'rb')
+
+        data = cached_offsets(filename, self._scan_offsets,
+                              reader=self.__class__.__name__)
+        self.header = str(data['header'])
+        self.title = data['title'].tolist()
+        self.compound = data['compound'].tolist()
+        self.remarks = data['remarks'].tolist()
+        # Position of the start of each frame
+        self._start_offsets = data['start_offsets'].tolist()
+        # Position of the end of each frame
+        self._stop_offsets = data['stop_offsets'].tolist()
+        self.n_frames = len(self._start_offsets)
+
+        self._read_frame(0)
+
+    def _scan_offsets(self):
+        """find the start and end of every frame and the header records"""
         # dummy/default variables as these are read
         header = ""
         title = []
         compound = []
         remarks = []
 
-        self.ts = self._Timestep(self.n_atoms, **self._ts_kwargs)
-
         # Record positions in file of CRYST and MODEL headers
         # then build frame offsets to start at the minimum of these
         # This allows CRYST to come either before or after MODEL
@@ -284,12 +307,7 @@ class PDBReader(base.ReaderBase):
         models = []
         crysts = []
 
-        # hack for streamIO
-        if isinstance(filename, util.NamedStream) and isinstance(filename.stream, StringIO):
-            filename.stream = BytesIO(filename.stream.getvalue().encode())
-
-        pdbfile = self._pdbfile = util.anyopen(filename, 'rb')
-
+        pdbfile = self._pdbfile
         line = "magical"
         while line:
             # need to use readline so tell gives end of line
@@ -315,11 +333,6 @@ class PDBReader(base.ReaderBase):
 
         end = pdbfile.tell()  # where the file ends
 
-        self.header = header
-        self.title = title
-        self.compound = compound
-        self.remarks = remarks
-
         if not models:
             # No model entries
             # so read from start of file to read first frame
@@ -328,13 +341,12 @@ class PDBReader(base.ReaderBase):
             offsets = [min(a, b) for a, b in zip(models, crysts)]
         else:
             offsets = models
-        # Position of the start of each frame
-        self._start_offsets = offsets
-        # Position of the end of each frame
-        self._stop_offsets = offsets[1:] + [end]
-        self.n_frames = len(offsets)
-
-        self._read_frame(0)
+        return {'start_offsets': np.array(offsets, dtype=np.int64),
+                'stop_offsets': np.array(offsets[1:] + [end], dtype=np.int64),
+                'header': np.array(header, dtype=str),
+                'title': np.array(title, dtype=str),
+                'compound': np.array(compound, dtype=str),
+                'remarks': np.array(remarks, dtype=str)}
 
     def Writer(self, filename, **kwargs):
         """Returns a PDBWriter for *filename*.
@@ -392,27 +404,16 @@ class PDBReader(base.ReaderBase):
         except IndexError:  # out of range of known frames
             raise IOError from None
 
-        pos = 0
-        occupancy = np.ones(self.n_atoms)
-
         # Seek to start and read until start of next frame
         self._pdbfile.seek(start)
-        chunk = self._pdbfile.read(stop - start).decode()
+        chunk = self._pdbfile.read(stop - start)
 
-        tmp_buf = []
+        atoms = []
         for line in chunk.splitlines():
-            if line[:6] in ('ATOM  ', 'HETATM'):
-                # we only care about coordinates
-                tmp_buf.append([line[30:38], line[38:46], line[46:54]])
-                # TODO import bfactors - might these change?
-                try:
-                    # does an implicit str -> float conversion
-                    occupancy[pos] = line[54:60]
-                except ValueError:
-                    # Be tolerant for ill-formated or empty occupancies
-                    pass
-                pos += 1
-            elif line[:6] == 'CRYST1':
+            if line[:6] in (b'ATOM  ', b'HETATM'):
+                atoms.append(line)
+            elif line[:6] == b'CRYST1':
+                line = line.decode()
                 # does an implicit str -> float conversion
                 try:
                     cell_dims = np.array([line[6:15], line[15:24],
@@ -433,6 +434,7 @@ class PDBReader(base.ReaderBase):
                                       " to zeros.")
                     else:
                         self.ts._unitcell[:] = cell_dims
+        pos = len(atoms)
 
         # check if atom number changed
         if pos != self.n_atoms:
@@ -443,8 +445,20 @@ class PDBReader(base.ReaderBase):
                              "atoms are currently not supported."
                              "".format(self.filename, pos, frame, self.n_atoms))
 
-        # doing the conversion from list to array at the end is faster
-        self.ts.positions = tmp_buf
+        # we only care about coordinates, all converted at once
+        # TODO import bfactors - might these change?
+        self.ts.positions = util.fixed_width_floats(
+            atoms, [(30, 38), (38, 46), (46, 54)], np.float32)
+        try:
+            occupancy = util.fixed_width_floats(atoms, [(54, 60)])[:, 0]
+        except ValueError:
+            # Be tolerant for ill-formated or empty occupancies
+            occupancy = np.ones(self.n_atoms)
+            for i, line in enumerate(atoms):
+                try:
+                    occupancy[i] = line[54:60]
+                except ValueError:
+                    pass
 
         if self.convert_units:
             # both happen inplace
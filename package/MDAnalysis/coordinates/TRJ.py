@@ -159,6 +159,7 @@ import logging
 
 import MDAnalysis
 from . import base
+from .offsets import cached_offsets
 from ..lib import util
 logger = logging.getLogger("MDAnalysis.coordinates.AMBER")
 
@@ -342,11 +343,18 @@ class TRJReader(base.ReaderBase):
             return self._n_frames
 
     def _read_trj_n_frames(self, filename):
+        data = cached_offsets(filename, self._scan_offsets,
+                              reader=self.__class__.__name__,
+                              n_atoms=self.n_atoms, periodic=self.periodic)
+        self._offsets = data['offsets'].tolist()
+        return len(self._offsets)
+
+    def _scan_offsets(self):
         lpf = self.lines_per_frame
         if self.periodic:
             lpf += 1
 
-        self._offsets = offsets = []
+        offsets = []
         counter = 0
         with util.openany(self.filename) as f:
             line = f.readline()  # ignore first line
@@ -356,7 +364,7 @@ class TRJReader(base.ReaderBase):
                 line = f.readline()
                 counter += 1
         offsets.pop()  # last offset is EOF
-        return len(offsets)
+        return {'offsets': np.array(offsets, dtype=np.int64)}
 
     @property
     def n_atoms(self):
@@ -682,6 +690,26 @@ class NCDFReader(base.ReaderBase):
         self._current_frame = frame
         return ts
 
+    def _read_block(self, start, stop, step, atom_indices, positions,
+                    dimensions):
+        """read a block of frames by slicing the netcdf variables"""
+        if self.trjfile is None:
+            raise IOError("Trajectory is closed")
+        frames = np.arange(start, stop, step)
+        index = (frames if atom_indices is None
+                 else np.ix_(frames, atom_indices))
+        positions[:] = (self.trjfile.variables['coordinates'][index] *
+                        self.scale_factors['coordinates'])
+        if self.periodic:
+            dimensions[:, :3] = (self.trjfile.variables['cell_lengths'][frames]
+                                 * self.scale_factors['cell_lengths'])
+            dimensions[:, 3:] = (self.trjfile.variables['cell_angles'][frames]
+                                 * self.scale_factors['cell_angles'])
+        if self.convert_units:
+            self.convert_pos_from_native(positions)
+            if self.periodic:
+                self.convert_pos_from_native(dimensions[:, :3])
+
     def _reopen(self):
         self._current_frame = -1
 
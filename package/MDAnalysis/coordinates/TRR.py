@@ -158,28 +158,16 @@ class TRRReader(XDRBaseReader):
             self.convert_pos_from_native(ts.dimensions[:3])
 
         if ts.has_positions:
-            if self._sub is not None:
-                ts.positions = frame.x[self._sub]
-            else:
-                ts.positions = frame.x
-            if self.convert_units:
-                self.convert_pos_from_native(ts.positions)
+            self._store_atoms(ts.positions, frame.x,
+                              self.convert_pos_from_native)
 
         if ts.has_velocities:
-            if self._sub is not None:
-                ts.velocities = frame.v[self._sub]
-            else:
-                ts.velocities = frame.v
-            if self.convert_units:
-                self.convert_velocities_from_native(ts.velocities)
+            self._store_atoms(ts.velocities, frame.v,
+                              self.convert_velocities_from_native)
 
         if ts.has_forces:
-            if self._sub is not None:
-                ts.forces = frame.f[self._sub]
-            else:
-                ts.forces = frame.f
-            if self.convert_units:
-                self.convert_forces_from_native(ts.forces)
+            self._store_atoms(ts.forces, frame.f,
+                              self.convert_forces_from_native)
 
         ts.data['lambda'] = frame.lmbda
 
@@ -40,6 +40,7 @@ from os.path import getctime, getsize, isfile, split, join
 import warnings
 
 from . import base
+from .offsets import cached_offsets, get_offsets_dir
 from ..lib.mdamath import triclinic_box
 
 
@@ -111,8 +112,16 @@ class XDRBaseReader(base.ReaderBase):
     Reader. However, the  next time the trajectory is opened,  the offsets will
     have to be rebuilt again.
 
+    If a cache directory for offsets is set (see
+    :mod:`MDAnalysis.coordinates.offsets`), the offsets are stored there
+    instead, which also works for trajectories in read-only directories and
+    is shared between processes.
+
     .. versionchanged:: 1.0.0
        XDR offsets read from trajectory if offsets file read-in fails
+    .. versionchanged:: 2.0.0
+       Offsets are kept in the shared offsets cache if a cache directory is
+       set
 
     """
     def __init__(self, filename, convert_units=True, sub=None,
@@ -144,6 +153,7 @@ class XDRBaseReader(base.ReaderBase):
             self.n_atoms = len(self._sub)
         else:
             self.n_atoms = self._xdr.n_atoms
+        self._set_restriction(None)
 
         if not refresh_offsets:
             self._load_offsets()
@@ -176,9 +186,83 @@ class XDRBaseReader(base.ReaderBase):
         """close reader"""
         self._xdr.close()
 
+    def restrict_to(self, atoms):
+        """Only read the atoms in `atoms` from now on
+
+        Positions (and velocities and forces) are only copied into the
+        :class:`Timestep` for `atoms`; the entries of all other atoms are set
+        to ``nan``.  The XTC reader also stops decompressing each frame after
+        the last atom of `atoms`, so that reading e.g. a protein stored before
+        the solvent is much faster than reading the whole system.
+
+        Parameters
+        ----------
+        atoms : AtomGroup or array_like or None
+            atoms (or their indices) to read; ``None`` reads all atoms again
+
+        Returns
+        -------
+        self : XDRBaseReader
+            the reader itself
+
+
+        .. versionadded:: 2.0.0
+        """
+        if atoms is not None:
+            atoms = np.unique(np.asarray(getattr(atoms, 'ix', atoms),
+                                         dtype=np.intp))
+            if len(atoms) and (atoms[0] < 0 or atoms[-1] >= self.n_atoms):
+                raise ValueError("atom indices must be between 0 and "
+                                 "{}".format(self.n_atoms - 1))
+        self._set_restriction(atoms)
+        ts = self.ts
+        if atoms is not None:
+            for attr in ('positions', 'velocities', 'forces'):
+                if getattr(ts, 'has_' + attr):
+                    getattr(ts, attr)[:] = np.nan
+        self._read_frame_with_aux(ts.frame)
+        return self
+
+    def _set_restriction(self, atoms):
+        """set the atoms read by :meth:`_store_atoms`"""
+        self._restrict = atoms
+        self._file_indices = None
+        self._n_decode = None
+        if atoms is not None:
+            self._file_indices = (atoms if self._sub is None
+                                  else np.asarray(self._sub)[atoms])
+            self._n_decode = (int(self._file_indices.max()) + 1
+                              if len(atoms) else 0)
+
+    def _store_atoms(self, target, source, convert):
+        """copy the atoms read from the file into the array `target` of the
+        timestep, converting them with `convert` if units are converted"""
+        if self._restrict is None:
+            target[:] = source if self._sub is None else source[self._sub]
+            if self.convert_units:
+                convert(target)
+        else:
+            values = source[self._file_indices]
+            if self.convert_units:
+                convert(values)
+            target[self._restrict] = values
+
+    def copy(self):
+        """Return independent copy of this Reader.
+
+        The copy reads the same atoms as set with :meth:`restrict_to`.
+        """
+        new = super(XDRBaseReader, self).copy()
+        new._set_restriction(self._restrict)
+        return new
+
     def _load_offsets(self):
         """load frame offsets from file, reread them from the trajectory if that
         fails"""
+        if get_offsets_dir() is not None:
+            self._cache_offsets()
+            return
+
         fname = offsets_filename(self.filename)
 
         if not isfile(fname):
@@ -219,8 +303,10 @@ class XDRBaseReader(base.ReaderBase):
 
     def _read_offsets(self, store=False):
         """read frame offsets from trajectory"""
-        offsets = self._xdr.offsets
-        if store:
+        offsets = self._get_offsets()
+        if store and get_offsets_dir() is not None:
+            self._cache_offsets(refresh=True)
+        elif store:
             ctime = getctime(self.filename)
             size = getsize(self.filename)
             try:
@@ -230,6 +316,20 @@ class XDRBaseReader(base.ReaderBase):
             except Exception as e:
                 warnings.warn("Couldn't save offsets because: {}".format(e))
 
+    def _get_offsets(self):
+        """frame offsets of the trajectory, scanned if not known yet"""
+        return self._xdr.offsets
+
+    def _cache_offsets(self, refresh=False):
+        """get the frame offsets from the shared offsets cache, see
+        :mod:`MDAnalysis.coordinates.offsets`"""
+        data = cached_offsets(self.filename,
+                              lambda: {'offsets': self._get_offsets()},
+                              refresh=refresh,
+                              reader=self.__class__.__name__,
+                              n_atoms=self._xdr.n_atoms)
+        self._xdr.set_offsets(data['offsets'])
+
     @property
     def n_frames(self):
         """number of frames in trajectory"""
@@ -267,11 +367,31 @@ class XDRBaseReader(base.ReaderBase):
             raise IOError(errno.EIO, 'trying to go over trajectory limit')
         if ts is None:
             ts = self.ts
-        frame = self._xdr.read()
+        frame = self._read_xdr_frame()
         self._frame += 1
         self._frame_to_ts(frame, ts)
         return ts
 
+    def _read_xdr_frame(self):
+        """read the next frame of the xdr file"""
+        return self._xdr.read()
+
+    def _read_block(self, start, stop, step, atom_indices, positions,
+                    dimensions):
+        """decode a block of frames straight into `positions`"""
+        indices = atom_indices
+        if self._sub is not None:
+            indices = (self._sub if atom_indices is None
+                       else self._sub[atom_indices])
+        boxes = np.empty((len(positions), 3, 3), dtype=np.float32)
+        self._xdr.read_frames(np.arange(start, stop, step), positions, boxes,
+                              indices=indices)
+        for k, box in enumerate(boxes):
+            dimensions[k] = triclinic_box(*box)
+        if self.convert_units:
+            self.convert_pos_from_native(positions)
+            self.convert_pos_from_native(dimensions[:, :3])
+
     def Writer(self, filename, n_atoms=None, **kwargs):
         """Return writer for trajectory format"""
         if n_atoms is None:
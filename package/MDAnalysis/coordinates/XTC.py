@@ -130,12 +130,44 @@ class XTCReader(XDRBaseReader):
     See :ref:`Notes on offsets <offsets-label>` for more information about
     offsets.
 
+
+    .. versionchanged:: 2.0.0
+       Added the `offset_threads` keyword to scan for offsets in parallel
     """
     format = 'XTC'
     units = {'time': 'ps', 'length': 'nm'}
     _writer = XTCWriter
     _file = XTCFile
 
+    def __init__(self, filename, offset_threads=1, **kwargs):
+        """
+        Parameters
+        ----------
+        filename : str
+            trajectory filename
+        offset_threads : int (optional)
+            number of threads used to scan the trajectory for frame offsets
+            when they are not stored yet; this mostly pays off for very large
+            files on storage with a high latency
+        **kwargs : dict
+            General reader arguments, see :class:`XDRBaseReader`.
+        """
+        self._offset_threads = offset_threads
+        super(XTCReader, self).__init__(filename, **kwargs)
+
+    def _get_offsets(self):
+        """frame offsets of the trajectory, scanned with `offset_threads`
+        threads if not known yet"""
+        if not self._xdr._has_offsets:
+            self._xdr.set_offsets(
+                self._xdr.calc_offsets(n_threads=self._offset_threads))
+        return self._xdr.offsets
+
+    def _read_xdr_frame(self):
+        """read the next frame, only decompressing the atoms needed by
+        :meth:`restrict_to`"""
+        return self._xdr.read(n_decode=self._n_decode)
+
     def _frame_to_ts(self, frame, ts):
         """convert a xtc-frame to a mda TimeStep"""
         ts.frame = self._frame
@@ -143,12 +175,8 @@ class XTCReader(XDRBaseReader):
         ts.data['step'] = frame.step
         ts.dimensions = triclinic_box(*frame.box)
 
-        if self._sub is not None:
-            ts.positions = frame.x[self._sub]
-        else:
-            ts.positions = frame.x
+        self._store_atoms(ts.positions, frame.x, self.convert_pos_from_native)
         if self.convert_units:
-            self.convert_pos_from_native(ts.positions)
             self.convert_pos_from_native(ts.dimensions[:3])
 
         return ts
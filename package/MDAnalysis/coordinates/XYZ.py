@@ -90,6 +90,7 @@ import logging
 logger = logging.getLogger('MDAnalysis.coordinates.XYZ')
 
 from . import base
+from .offsets import cached_offsets
 from ..lib import util
 from ..lib.util import cached
 from ..exceptions import NoDataError
@@ -372,6 +373,13 @@ class XYZReader(base.ReaderBase):
             return 0
 
     def _read_xyz_n_frames(self):
+        data = cached_offsets(self.filename, self._scan_offsets,
+                              reader=self.__class__.__name__,
+                              n_atoms=self.n_atoms)
+        self._offsets = data['offsets'].tolist()
+        return int(data['n_frames'])
+
+    def _scan_offsets(self):
         # the number of lines in the XYZ file will be 2 greater than the
         # number of atoms
         linesPerFrame = self.n_atoms + 2
@@ -388,8 +396,8 @@ class XYZReader(base.ReaderBase):
 
         # need to check this is an integer!
         n_frames = int(counter / linesPerFrame)
-        self._offsets = offsets
-        return n_frames
+        return {'offsets': np.array(offsets, dtype=np.int64),
+                'n_frames': np.array(n_frames)}
 
     def _read_frame(self, frame):
         self.xyzfile.seek(self._offsets[frame])
@@ -407,11 +415,16 @@ class XYZReader(base.ReaderBase):
             # we assume that there are only two header lines per frame
             f.readline()
             f.readline()
-            # convert all entries at the end once for optimal speed
-            tmp_buf = []
-            for i in range(self.n_atoms):
-                tmp_buf.append(f.readline().split()[1:4])
-            ts.positions = tmp_buf
+            # convert all entries at once for optimal speed
+            lines = [f.readline() for _ in range(self.n_atoms)]
+            if not lines or not lines[-1]:
+                raise ValueError("end of file")
+            positions = np.loadtxt(lines, dtype=np.float32,
+                                   usecols=(1, 2, 3), comments=None,
+                                   ndmin=2)
+            if len(positions) != self.n_atoms:
+                raise ValueError("blank lines in frame")
+            ts.positions = positions
             ts.frame += 1
             return ts
         except (ValueError, IndexError) as err:
@@ -165,6 +165,45 @@ case, :class:`ProtoReader` should be used.
    :members:
 
 
+Prefetching
+~~~~~~~~~~~
+
+:meth:`ProtoReader.prefetch` makes iteration over a trajectory read the
+upcoming frames in a background thread while the current frame is being
+analysed.  The background thread uses an independent copy of the reader (with
+its own file handle) and decodes up to `n_frames` frames ahead into a ring of
+:class:`Timestep` buffers; the data of each frame is then copied into the
+:class:`Timestep` of the reader.  Auxiliary data and on-the-fly
+transformations are applied in the iterating thread, as usual.  This pays off
+when decoding is done by code that releases the GIL, as the XTC and TRR
+readers do:
+
+.. code-block:: python
+
+   u = mda.Universe(TPR, XTC)
+   u.trajectory.prefetch(n_frames=8)
+   for ts in u.trajectory[::10]:
+       analyse(u.atoms.positions)
+
+
+Reading blocks of frames
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+:meth:`ProtoReader.read_block` returns the positions of a slice of the
+trajectory as one ``(n_frames, n_atoms, 3)`` array, together with the
+``(n_frames, 6)`` unit cells, optionally only for a subset of atoms and
+written into a preallocated array.  The DCD, XTC, TRR, NetCDF, H5MD and memory
+readers read the whole block natively, without going through a
+:class:`Timestep` for every frame; all other readers (and readers with
+on-the-fly transformations) fall back to reading frame by frame.  The current
+frame of the reader is unchanged afterwards.
+
+.. code-block:: python
+
+   positions, dimensions = u.trajectory.read_block(
+       0, 100, atom_indices=u.select_atoms('name CA').indices)
+
+
 
 Writers
 -------
@@ -200,6 +239,8 @@ writers share.
 import numpy as np
 import numbers
 import copy
+import queue
+import threading
 import warnings
 import weakref
 
@@ -971,6 +1012,10 @@ class FrameIteratorSliced(FrameIteratorBase):
         return range_length(self.start, self.stop, self.step)
 
     def __iter__(self):
+        if self.trajectory._prefetch_frames:
+            yield from self.trajectory._prefetched_iter(
+                range(self.start, self.stop, self.step), rewind=True)
+            return
         for i in range(self.start, self.stop, self.step):
             yield self.trajectory[i]
         self.trajectory.rewind()
@@ -1091,6 +1136,9 @@ class FrameIteratorIndices(FrameIteratorBase):
         return len(self.frames)
 
     def __iter__(self):
+        if self.trajectory._prefetch_frames:
+            yield from self.trajectory._prefetched_iter(self.frames)
+            return
         for frame in self.frames:
             yield self.trajectory._read_frame_with_aux(frame)
 
@@ -1400,6 +1448,51 @@ class _Readermeta(type):
                     _READER_HINTS[fmt_name] = classdict['_format_hint'].__func__
 
 
+def _copy_timestep(source, target):
+    """Copy the data of the :class:`Timestep` `source` into `target`
+
+    The arrays of `target` are reused, so that references to them stay valid.
+    """
+    target.frame = source.frame
+    target.data = source.data.copy()
+    target.dimensions = source.dimensions
+    for attr in ('positions', 'velocities', 'forces'):
+        has_attr = getattr(source, 'has_' + attr)
+        setattr(target, 'has_' + attr, has_attr)
+        if has_attr:
+            getattr(target, attr)[:] = getattr(source, attr)
+
+
+def _prefetch_worker(reader, frames, free, filled, stop):
+    """Read `frames` with `reader` for :meth:`ProtoReader._prefetched_iter`
+
+    Runs in a background thread. Empty :class:`Timestep` buffers are taken
+    from the `free` queue (``None`` allocates a new buffer) and put into the
+    `filled` queue once they hold a frame. An exception is passed on through
+    `filled`. The thread returns when `stop` is set.
+    """
+    previous = None
+    try:
+        for frame in frames:
+            buffer = free.get()
+            if stop.is_set():
+                return
+            if previous is not None and frame == previous + 1:
+                ts = reader._read_next_timestep()
+            else:
+                ts = reader._read_frame(frame)
+            previous = frame
+            if buffer is None:
+                buffer = ts.copy()
+            else:
+                _copy_timestep(ts, buffer)
+            filled.put(buffer)
+    except Exception as err:
+        filled.put(err)
+    finally:
+        reader.close()
+
+
 class ProtoReader(IOBase, metaclass=_Readermeta):
     """Base class for Readers, without a :meth:`__del__` method.
 
@@ -1428,6 +1521,9 @@ class ProtoReader(IOBase, metaclass=_Readermeta):
     #: :class:`MDAnalysis.coordinates.xdrfile.XTC.Timestep` for XTC.
     _Timestep = Timestep
 
+    #: number of frames read ahead while iterating, see :meth:`prefetch`
+    _prefetch_frames = 0
+
     def __init__(self):
         # initialise list to store added auxiliary readers in
         # subclasses should now call super
@@ -1555,9 +1651,97 @@ class ProtoReader(IOBase, metaclass=_Readermeta):
 
     def __iter__(self):
         """ Iterate over trajectory frames. """
+        if self._prefetch_frames:
+            return self._prefetched_iter(range(self.n_frames), rewind=True)
         self._reopen()
         return self
 
+    def prefetch(self, n_frames=8):
+        """Read frames ahead in a background thread when iterating
+
+        See the *Prefetching* section of :mod:`MDAnalysis.coordinates.base`.
+
+        Parameters
+        ----------
+        n_frames : int, optional
+            maximum number of frames read ahead of the current frame; ``0``
+            switches prefetching off
+
+        Returns
+        -------
+        self : ProtoReader
+            the reader itself
+
+        Raises
+        ------
+        ValueError
+            if `n_frames` is negative
+
+
+        .. versionadded:: 2.0.0
+        """
+        if n_frames < 0:
+            raise ValueError("n_frames must not be negative, not {}".format(
+                n_frames))
+        self._prefetch_frames = n_frames
+        return self
+
+    def _prefetch_reader(self):
+        """Independent copy of the reader, without transformations and
+        auxiliaries"""
+        transformations, auxs = self._transformations, self._auxs
+        self._transformations, self._auxs = [], {}
+        try:
+            reader = self.copy()
+        finally:
+            self._transformations, self._auxs = transformations, auxs
+        if hasattr(self, 'convert_units'):
+            reader.convert_units = self.convert_units
+        return reader
+
+    def _prefetched_iter(self, frames, rewind=False):
+        """Iterate over `frames`, reading them in a background thread
+
+        If `rewind` is set the reader is rewound after the last frame, as in
+        :meth:`next`. Otherwise, and when the iteration is stopped early, the
+        reader is left on the last frame that was iterated over.
+        """
+        free = queue.Queue()
+        filled = queue.Queue()
+        for _ in range(self._prefetch_frames):
+            free.put(None)
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=_prefetch_worker,
+            args=(self._prefetch_reader(), frames, free, filled, stop),
+            daemon=True)
+        thread.start()
+        current = None
+        completed = False
+        try:
+            for frame in frames:
+                buffer = filled.get()
+                if isinstance(buffer, Exception):
+                    raise buffer
+                _copy_timestep(buffer, self.ts)
+                free.put(buffer)
+                current = frame
+                ts = self.ts
+                for auxname in self.aux_list:
+                    ts = self._auxs[auxname].update_ts(ts)
+                yield self._apply_transformations(ts)
+            completed = True
+        finally:
+            stop.set()
+            free.put(None)
+            thread.join()
+            # only the Timestep has been updated, the file of this reader has
+            # not been moved yet
+            if rewind and completed:
+                self.rewind()
+            elif current is not None:
+                self._read_frame_with_aux(current)
+
     def _reopen(self):
         """Should position Reader to just before first frame
 
@@ -1639,6 +1823,10 @@ class ProtoReader(IOBase, metaclass=_Readermeta):
         """
         # override with an appropriate implementation e.g. using self[i] might
         # be much slower than skipping steps in a next() loop
+        if self._prefetch_frames:
+            yield from self._prefetched_iter(range(start, stop, step),
+                                             rewind=True)
+            return
         try:
             for i in range(start, stop, step):
                 yield self._read_frame_with_aux(i)
@@ -1735,6 +1923,87 @@ class ProtoReader(IOBase, metaclass=_Readermeta):
 
         return start, stop, step
 
+    def read_block(self, start=None, stop=None, step=None, atom_indices=None,
+                   out=None):
+        """Read the positions and unit cells of several frames at once
+
+        See the *Reading blocks of frames* section of
+        :mod:`MDAnalysis.coordinates.base`.
+
+        Parameters
+        ----------
+        start : int, optional
+            first frame of the block
+        stop : int, optional
+            frame at which the block ends (exclusive)
+        step : int, optional
+            step between frames
+        atom_indices : array_like, optional
+            indices of the atoms to read; all atoms if ``None``
+        out : numpy.ndarray, optional
+            C-contiguous float32 array of shape ``(n_frames, n_atoms, 3)``
+            that the positions are written to
+
+        Returns
+        -------
+        positions : numpy.ndarray
+            float32 array of shape ``(n_frames, n_atoms, 3)``; `out` if it
+            was given
+        dimensions : numpy.ndarray
+            float32 array of shape ``(n_frames, 6)`` with the unit cell of
+            every frame; frames without a unit cell are filled with zeros
+
+        Raises
+        ------
+        ValueError
+            if `out` does not have the right shape, type or memory layout
+
+
+        .. versionadded:: 2.0.0
+        """
+        start, stop, step = self.check_slice_indices(start, stop, step)
+        n_frames = len(range(start, stop, step))
+        if atom_indices is None:
+            n_atoms = self.n_atoms
+        else:
+            atom_indices = np.asarray(atom_indices, dtype=np.intp)
+            n_atoms = len(atom_indices)
+
+        shape = (n_frames, n_atoms, 3)
+        if out is None:
+            out = np.empty(shape, dtype=np.float32)
+        elif (out.shape != shape or out.dtype != np.float32
+              or not out.flags['C_CONTIGUOUS']):
+            raise ValueError("out must be a C-contiguous float32 array of "
+                             "shape {}".format(shape))
+        dimensions = np.zeros((n_frames, 6), dtype=np.float32)
+        if n_frames == 0:
+            return out, dimensions
+
+        frame = self.ts.frame
+        # the fast paths of the readers do not know about transformations
+        read = (ProtoReader._read_block if self.transformations
+                else type(self)._read_block)
+        read(self, start, stop, step, atom_indices, out, dimensions)
+        # the reader is left on the frame it was on before
+        self._read_frame_with_aux(frame)
+        return out, dimensions
+
+    def _read_block(self, start, stop, step, atom_indices, positions,
+                    dimensions):
+        """Fill `positions` and `dimensions` with the frames of a block
+
+        This implementation reads frame by frame.  Readers that can read many
+        frames at once override it; the arguments have already been checked
+        by :meth:`read_block`.
+        """
+        ix = slice(None) if atom_indices is None else atom_indices
+        for k, i in enumerate(range(start, stop, step)):
+            ts = self._read_frame_with_aux(i)
+            positions[k] = ts.positions[ix]
+            if ts.dimensions is not None:
+                dimensions[k] = ts.dimensions
+
     def __repr__(self):
         return ("<{cls} {fname} with {nframes} frames of {natoms} atoms>"
                 "".format(
@@ -43,8 +43,11 @@ interest to developers.
 import warnings
 
 import os.path
+import sys
 import bisect
 import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -52,6 +55,7 @@ from ..lib import util
 from ..lib.util import asiterable
 from . import base
 from . import core
+from . import offsets
 
 
 def multi_level_argsort(l):
@@ -137,6 +141,55 @@ def filter_times(times, dt):
     return used_idx
 
 
+def _open_segment(filename, continuous, kwargs):
+    """Open the reader of one trajectory with its metadata
+
+    The metadata are the number of frames, `dt` and, if `continuous`, the
+    times of the first and the last frame; they are kept in the cache of
+    :mod:`~MDAnalysis.coordinates.offsets` if there is one.
+
+    Returns
+    -------
+    reader : ProtoReader
+    metadata : dict
+    """
+    reader = core.reader(filename, **kwargs)
+
+    def scan():
+        data = {'n_frames': reader.n_frames, 'dt': reader.dt}
+        if continuous:
+            start = reader[0].time
+            end = reader[-1].time
+            data['times'] = [start, end]
+        return data
+
+    params = {'kwarg_' + name: value for name, value in kwargs.items()
+              if isinstance(value, (str, int, float, bool, type(None)))}
+    metadata = offsets.cached_offsets(
+        reader.filename, scan, metadata='CHAIN', reader=type(reader).__name__,
+        n_atoms=reader.n_atoms, continuous=continuous, **params)
+    return reader, metadata
+
+
+def _read_ahead(filename, stop):
+    """Have the operating system cache the file `filename`
+
+    Where available, :func:`os.posix_fadvise` asks the kernel to read the
+    file in the background; otherwise the file is read in blocks until it
+    ends or the event `stop` is set.
+    """
+    try:
+        with open(filename, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                return
+            while not stop.is_set() and f.read(1 << 20):
+                pass
+    except (IOError, OSError, TypeError):
+        # not a file on disk, which then needs no reading ahead
+        pass
+
+
 def check_allowed_filetypes(readers, allowed):
     """
     Make a check that  all readers have the same filetype and are  of the
@@ -214,11 +267,14 @@ class ChainReader(base.ProtoReader):
     .. versionchanged:: 2.0.0
        Now ChainReader can be (un)pickled. Upon unpickling,
        current timestep is retained.
+    .. versionchanged:: 2.0.0
+       Added the `open_threads` and `prefetch_next` keywords
 
     """
     format = 'CHAIN'
 
-    def __init__(self, filenames, skip=1, dt=None, continuous=False, **kwargs):
+    def __init__(self, filenames, skip=1, dt=None, continuous=False,
+                 open_threads=1, prefetch_next=False, **kwargs):
         """Set up the chain reader.
 
         Parameters
@@ -250,6 +306,19 @@ class ChainReader(base.ProtoReader):
             frames, and they are all of the same file-type. Not implemented for
             all trajectory formats! This can be used to analyze GROMACS
             simulations without concatenating them prior to analysis.
+        open_threads : int (optional)
+            number of threads opening the trajectories (and, for formats such
+            as XTC, scanning them for frames) at the same time. The number of
+            frames, `dt` and the times of the first and last frames of each
+            trajectory are kept in the offsets cache if one is set with
+            :func:`~MDAnalysis.coordinates.offsets.set_offsets_dir`.
+        prefetch_next : bool (optional)
+            have the file of the next trajectory read in the background
+            (with :func:`os.posix_fadvise` where available, otherwise in a
+            thread) while the current one is read, so that it is in the cache
+            of the operating system when it is needed; a pending read ahead
+            is cancelled when frames of another trajectory are accessed.
+            Useful for many trajectories on slow or network storage
         **kwargs : dict (optional)
             all other keyword arguments are passed on to each trajectory reader
             unchanged
@@ -262,12 +331,26 @@ class ChainReader(base.ProtoReader):
         # kwarg to a timestep which behaves differently if dt is present or not.
         if dt is not None:
             kwargs['dt'] = dt
-        self.readers = [core.reader(filename, **kwargs)
-                        for filename in filenames]
+        if open_threads > 1 and len(filenames) > 1:
+            with ThreadPoolExecutor(open_threads) as executor:
+                segments = list(executor.map(
+                    lambda fn: _open_segment(fn, continuous, kwargs),
+                    filenames))
+        else:
+            segments = [_open_segment(fn, continuous, kwargs)
+                        for fn in filenames]
+        self.readers = [reader for reader, _ in segments]
+        metadata = [data for _, data in segments]
         self.filenames = np.array([fn[0] if isinstance(fn, tuple) else fn
                                                         for fn in filenames])
         # pointer to "active" trajectory index into self.readers
         self.__active_reader_index = 0
+        self._prefetch_next = prefetch_next
+        # thread reading ahead, its pending (future, stop event) and the
+        # index of the reader it last read
+        self._read_ahead = None
+        self._read_ahead_job = None
+        self._read_ahead_index = None
 
         self.skip = skip
         self.n_atoms = self._get_same('n_atoms')
@@ -283,13 +366,13 @@ class ChainReader(base.ProtoReader):
         # trajectory i and local frame f (i.e. readers[i][f] will correspond to
         # ChainReader[k]).
         # build map 'start_frames', which is used by _get_local_frame()
-        n_frames = self._get('n_frames')
+        n_frames = [int(data['n_frames']) for data in metadata]
         # [0]: frames are 0-indexed internally
         # (see Timestep.check_slice_indices())
         self._start_frames = np.cumsum([0] + n_frames)
 
         self.n_frames = np.sum(n_frames)
-        self.dts = np.array(self._get('dt'))
+        self.dts = np.array([float(data['dt']) for data in metadata])
         self.total_times = self.dts * n_frames
 
         # calculate new start_frames to have a time continuous trajectory.
@@ -300,7 +383,7 @@ class ChainReader(base.ProtoReader):
                                    "every trajectory with continuous=True")
             # TODO: allow floating point precision in dt check
             dt = self._get_same('dt')
-            n_frames = np.asarray(self._get('n_frames'))
+            n_frames = np.asarray(n_frames)
             self.dts = np.ones(self.dts.shape) * dt
 
             # the sorting needs to happen on two levels. The first major level
@@ -310,13 +393,7 @@ class ChainReader(base.ProtoReader):
             # to
             # [0 1 2 4] [0 1 2 3 4 5 6 7 8 9]
             # after that sort the chain reader will work
-            times = []
-            for r in self.readers:
-                r[0]
-                start = r.ts.time
-                r[-1]
-                end = r.ts.time
-                times.append((start, end))
+            times = [tuple(data['times']) for data in metadata]
             # sort step
             sort_idx = multi_level_argsort(times)
             self.readers = [self.readers[i] for i in sort_idx]
@@ -419,6 +496,8 @@ class ChainReader(base.ProtoReader):
 
     def __getstate__(self):
         state = self.__dict__.copy()
+        state['_read_ahead'] = None
+        state['_read_ahead_job'] = None
         #  save ts temporarily otherwise it will be changed during rewinding.
         state['ts'] = self.ts.__deepcopy__()
 
@@ -546,8 +625,31 @@ class ChainReader(base.ProtoReader):
         # private method, not to be used by user to avoid a total mess
         if not (0 <= i < len(self.readers)):
             raise IndexError("Reader index must be 0 <= i < {0:d}".format(len(self.readers)))
+        if self._prefetch_next and self._read_ahead_index != i + 1:
+            if i + 1 < len(self.readers):
+                # the previous read ahead is either of the now active
+                # trajectory, which its reader reads anyway, or of no use
+                self._cancel_read_ahead()
+                if self._read_ahead is None:
+                    self._read_ahead = ThreadPoolExecutor(1)
+                stop = threading.Event()
+                future = self._read_ahead.submit(
+                    _read_ahead, self.readers[i + 1].filename, stop)
+                self._read_ahead_job = (future, stop)
+                self._read_ahead_index = i + 1
+            elif self._read_ahead_index != i:
+                self._cancel_read_ahead()
         self.__active_reader_index = i
 
+    def _cancel_read_ahead(self):
+        """Cancel or stop the pending read ahead, if any"""
+        if self._read_ahead_job is not None:
+            future, stop = self._read_ahead_job
+            future.cancel()
+            stop.set()
+            self._read_ahead_job = None
+        self._read_ahead_index = None
+
     @property
     def active_reader(self):
         """Reader instance from which frames are currently being read."""
@@ -599,6 +701,13 @@ class ChainReader(base.ProtoReader):
         self.__next__()
 
     def close(self):
+        if self._read_ahead is not None:
+            self._cancel_read_ahead()
+            if sys.version_info >= (3, 9):
+                self._read_ahead.shutdown(wait=False, cancel_futures=True)
+            else:
+                self._read_ahead.shutdown(wait=False)
+            self._read_ahead = None
         self._apply('close')
 
     def __iter__(self):
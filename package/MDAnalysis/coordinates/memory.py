@@ -172,6 +172,66 @@ to, for instance, write out a new trajectory or perform fast analysis
 on the sub-system.
 
 
+.. _out-of-core-memory-label:
+
+Out-of-core trajectories
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+The arrays of a :class:`MemoryReader` do not have to be held in memory: any
+:class:`numpy.memmap` works, so that trajectories larger than the available
+memory can be used in the same way, with the operating system keeping only
+the recently used frames in memory.  The `cache_file` keyword of
+:meth:`~MDAnalysis.core.universe.Universe.transfer_to_memory` writes the
+coordinates of any trajectory to a ``.npy`` file, a block of frames at a
+time, and maps it::
+
+  u = mda.Universe(PSF, DCD)
+  u.transfer_to_memory(cache_file='adk_positions.npy')
+  u.trajectory.timeseries()   # a view of the mapped file
+
+Velocities and forces, if the trajectory has them, go into files next to the
+cache file with ``_velocities`` and ``_forces`` appended to the name.
+Changes to the coordinates, including those made by transformations, are
+written to the file.  The file can be used again later without reading the
+original trajectory::
+
+  coordinates = np.load('adk_positions.npy', mmap_mode='r+')
+  u = mda.Universe(PSF, coordinates, format=MemoryReader)
+
+Mapped arrays are pickled as a reference to their file, so that a
+:class:`MemoryReader` sent to other processes maps the same file instead of
+copying the coordinates, and :meth:`MemoryReader.copy` maps the file again
+copy-on-write (``mode='c'``) instead of reading it.  The unit cells are
+always held in memory.
+
+
+.. _compressed-memory-label:
+
+Compressed trajectories in memory
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+For long trajectories, the :class:`CompressedMemoryReader` trades some time
+for memory: it keeps frames in chunks compressed with :mod:`zlib` and decodes
+a chunk when one of its frames is read, keeping the last few decoded chunks.
+With ``compression='xtc'`` positions are rounded to 0.001 Å like in the XTC
+format and stored as differences between frames, which takes several times
+less memory than the :class:`MemoryReader` (the more so the less atoms move
+between frames); ``compression='zlib'`` is lossless but saves less.
+Velocities and forces are always compressed losslessly with ``'zlib'``.
+The reader is created with the `compression` keyword of
+:meth:`~MDAnalysis.core.universe.Universe.transfer_to_memory`, which reads
+and compresses the trajectory one chunk at a time::
+
+  u = mda.Universe(PSF, DCD)
+  u.transfer_to_memory(compression='xtc')
+  u.trajectory.nbytes   # bytes of compressed coordinates
+
+Decoded frames are copied into the
+:class:`~MDAnalysis.coordinates.base.Timestep`, so, as for the readers of
+files and unlike for the :class:`MemoryReader`, changes to positions are lost
+when another frame is read.
+
+
 Classes
 =======
 
@@ -183,15 +243,197 @@ Classes
    :members:
    :inherited-members:
 
+.. autoclass:: CompressedMemoryReader
+   :members:
+
 """
 import logging
 import errno
+import mmap
+import os
+import zlib
+from collections import OrderedDict
+
 import numpy as np
 import warnings
 
 from . import base
 
 
+#: bytes of coordinates read at a time into a cache file
+_CACHE_BLOCK_BYTES = 64 << 20
+
+
+def _open_cache(filename, shape, suffix=''):
+    """create the ``.npy`` file `filename` for a float32 array and map it
+
+    `suffix` is inserted before the extension of `filename`.
+    """
+    root, ext = os.path.splitext(filename)
+    return np.lib.format.open_memmap(root + suffix + ext, mode='w+',
+                                     dtype=np.float32, shape=shape)
+
+
+def _mapped_state(array):
+    """how to map `array` again if it maps a file, else ``None``"""
+    if not (isinstance(array, np.memmap) and
+            isinstance(array.base, mmap.mmap) and array.filename):
+        return None
+    array.flush()
+    order = 'C' if array.flags['C_CONTIGUOUS'] else 'F'
+    # never truncate the file again
+    mode = 'r+' if array.mode == 'w+' else array.mode
+    return dict(filename=array.filename, offset=array.offset,
+                dtype=array.dtype.str, shape=array.shape, order=order,
+                mode=mode)
+
+
+def _map(state, mode=None):
+    """map the array described by :func:`_mapped_state`"""
+    return np.memmap(state['filename'], dtype=state['dtype'],
+                     mode=mode or state['mode'], offset=state['offset'],
+                     shape=state['shape'], order=state['order'])
+
+
+class _CompressedArray(object):
+    """float32 array of shape ``(n_frames, n_atoms, 3)`` kept in compressed
+    chunks of frames
+
+    With ``'xtc'`` compression the values are rounded to multiples of
+    ``1/precision`` and stored as int32, each frame of a chunk as its
+    difference to the previous one; with ``'zlib'`` the float32 values are
+    stored as they are.  In both cases the bytes of the values are shuffled
+    (all first bytes, then all second bytes, ...) before they are compressed
+    with :mod:`zlib`.  The last `cache_size` decoded chunks are kept.
+    """
+    compressions = ('xtc', 'zlib')
+
+    def __init__(self, n_atoms, compression='xtc', precision=1000.0,
+                 chunk_size=None, cache_size=4):
+        if compression not in self.compressions:
+            raise ValueError("compression must be one of {}, not {!r}".format(
+                ', '.join(self.compressions), compression))
+        self.n_atoms = n_atoms
+        self.compression = compression
+        self.precision = float(precision)
+        if chunk_size is None:
+            # about 1 MiB of decoded coordinates per chunk
+            chunk_size = max(1, (1 << 20) // (12 * max(n_atoms, 1)))
+        self.chunk_size = chunk_size
+        self.cache_size = max(1, cache_size)
+        self._chunks = []
+        # first frame of every chunk, and the number of frames at the end
+        self._starts = [0]
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return self._starts[-1]
+
+    @property
+    def shape(self):
+        return (len(self), self.n_atoms, 3)
+
+    @property
+    def nbytes(self):
+        """bytes of compressed data"""
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        return state
+
+    def copy(self):
+        """share the (immutable) chunks, but not the cache"""
+        new = self.__class__.__new__(self.__class__)
+        new.__setstate__(self.__getstate__())
+        new._chunks = list(self._chunks)
+        new._starts = list(self._starts)
+        return new
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def append(self, frames):
+        """compress the frames of the array `frames` and add them at the end"""
+        frames = np.asarray(frames, dtype=np.float32)
+        if frames.shape[1:] != (self.n_atoms, 3):
+            raise ValueError("frames must have shape (n_frames, {}, 3), not "
+                             "{}".format(self.n_atoms, frames.shape))
+        for i in range(0, len(frames), self.chunk_size):
+            chunk = frames[i:i + self.chunk_size]
+            self._chunks.append(self._encode(chunk))
+            self._starts.append(self._starts[-1] + len(chunk))
+
+    def _encode(self, frames):
+        if self.compression == 'xtc':
+            ints = np.rint(frames * self.precision)
+            # twice the differences between frames must fit into an int32
+            if len(ints) and np.abs(ints).max() >= 2**29:
+                raise ValueError("values too large to be compressed with "
+                                 "precision {}".format(self.precision))
+            ints = ints.astype(np.int32)
+            deltas = ints.copy()
+            deltas[1:] -= ints[:-1]
+            # zigzag encoding keeps small negative numbers small
+            values = (deltas << 1) ^ (deltas >> 31)
+        else:
+            values = np.ascontiguousarray(frames)
+        shuffled = values.view(np.uint8).reshape(-1, 4).T
+        return zlib.compress(shuffled.tobytes(), 1)
+
+    def _decode(self, index):
+        n_frames = self._starts[index + 1] - self._starts[index]
+        shuffled = np.frombuffer(zlib.decompress(self._chunks[index]),
+                                 dtype=np.uint8).reshape(4, -1)
+        raw = np.ascontiguousarray(shuffled.T)
+        if self.compression == 'xtc':
+            values = raw.view(np.int32).reshape(n_frames, self.n_atoms, 3)
+            deltas = (values >> 1) ^ -(values & 1)
+            frames = (np.cumsum(deltas, axis=0, dtype=np.int32) /
+                      self.precision).astype(np.float32)
+        else:
+            frames = raw.view(np.float32).reshape(n_frames, self.n_atoms, 3)
+        frames.flags.writeable = False
+        return frames
+
+    def chunk(self, index):
+        """decoded chunk `index`, from the cache if possible"""
+        try:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+        except KeyError:
+            frames = self._decode(index)
+            self._cache[index] = frames
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return frames
+
+    def __getitem__(self, frame):
+        """read-only decoded frame `frame`"""
+        index = np.searchsorted(self._starts, frame, side='right') - 1
+        return self.chunk(index)[frame - self._starts[index]]
+
+    def take(self, frames, atom_indices=None, out=None):
+        """decoded frames `frames` of the atoms `atom_indices` (all if
+        ``None``)"""
+        frames = np.asarray(frames, dtype=np.intp)
+        n_atoms = self.n_atoms if atom_indices is None else len(atom_indices)
+        if out is None:
+            out = np.empty((len(frames), n_atoms, 3), dtype=np.float32)
+        if not len(frames):
+            return out
+        indices = np.searchsorted(self._starts, frames, side='right') - 1
+        # one decoded chunk for each run of frames in the same chunk
+        bounds = np.flatnonzero(np.diff(indices)) + 1
+        for begin, end in zip(np.r_[0, bounds], np.r_[bounds, len(frames)]):
+            index = indices[begin]
+            chunk = self.chunk(index)[frames[begin:end] - self._starts[index]]
+            out[begin:end] = (chunk if atom_indices is None
+                              else chunk[:, atom_indices])
+        return out
+
+
 class Timestep(base.Timestep):
     """Timestep for the :class:`MemoryReader`
 
@@ -428,16 +670,33 @@ class MemoryReader(base.ProtoReader):
         # assume filename is a numpy array
         return filename.shape[order.find('a')]
 
+    @staticmethod
+    def _copy_array(array):
+        """copy `array`, as a copy-on-write map if it maps a file"""
+        if array is None:
+            return None
+        state = _mapped_state(array)
+        if state is None:
+            return array.copy()
+        return _map(state, mode='c')
+
     def copy(self):
-        """Return a copy of this Memory Reader"""
-        vels = (self.velocity_array.copy()
-                if self.velocity_array is not None else None)
-        fors = (self.force_array.copy()
-                if self.force_array is not None else None)
+        """Return a copy of this Memory Reader
+
+        Arrays that are memory mapped from a file (see
+        :ref:`out-of-core-memory-label`) are mapped again copy-on-write rather
+        than read into memory; changes to the copy are not written to the file.
+
+
+        .. versionchanged:: 2.0.0
+           Memory-mapped arrays are not read into memory
+        """
+        vels = self._copy_array(self.velocity_array)
+        fors = self._copy_array(self.force_array)
         dims = self.dimensions_array.copy()
 
         new = self.__class__(
-            self.coordinate_array.copy(),
+            self._copy_array(self.coordinate_array),
             order=self.stored_order,
             dimensions=dims,
             velocities=vels,
@@ -455,6 +714,21 @@ class MemoryReader(base.ProtoReader):
 
         return new
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # memory-mapped arrays are pickled as a reference to their file
+        for name in ('coordinate_array', 'velocity_array', 'force_array'):
+            mapped = _mapped_state(state[name])
+            if mapped is not None:
+                state[name] = mapped
+        return state
+
+    def __setstate__(self, state):
+        for name in ('coordinate_array', 'velocity_array', 'force_array'):
+            if isinstance(state[name], dict):
+                state[name] = _map(state[name])
+        super(MemoryReader, self).__setstate__(state)
+
     def set_array(self, coordinate_array, order='fac'):
         """
         Set underlying array in desired column order.
@@ -569,6 +843,18 @@ class MemoryReader(base.ProtoReader):
         ts.time = self.ts.frame * self.dt
         return ts
 
+    def _read_block(self, start, stop, step, atom_indices, positions,
+                    dimensions):
+        """copy a block of frames out of the coordinate array"""
+        # view of the coordinate array in 'fac' order
+        array = self.coordinate_array.transpose(
+            [self.stored_order.find(c) for c in 'fac'])
+        frames = np.arange(start, stop, step)
+        index = (frames if atom_indices is None
+                 else np.ix_(frames, atom_indices))
+        positions[:] = array[index]
+        dimensions[:] = self.dimensions_array[frames]
+
     def _read_frame(self, i):
         """read frame i"""
         # Frame number is incremented to zero by _read_next_timestep()
@@ -627,3 +913,215 @@ class MemoryReader(base.ProtoReader):
         # to avoid applying the same transformations multiple times on each frame
 
         return ts
+
+
+class CompressedMemoryReader(base.ProtoReader):
+    """Trajectory reader holding compressed coordinates in memory
+
+    Works like the :class:`MemoryReader`, but keeps the coordinates (and
+    velocities and forces) in compressed chunks of frames, see
+    :ref:`compressed-memory-label`.  Velocities and forces are always
+    compressed losslessly.  Frames are decoded when they are read, so
+    that, unlike for the :class:`MemoryReader`, changes to the positions of a
+    :class:`~MDAnalysis.coordinates.base.Timestep` are lost when another
+    frame is read, and transformations are applied whenever a frame is read.
+
+
+    .. versionadded:: 2.0.0
+    """
+
+    format = 'MEMORY_COMPRESSED'
+
+    parse_n_atoms = MemoryReader.parse_n_atoms
+
+    def __init__(self, coordinate_array, order='fac',
+                 dimensions=None, dt=1, filename=None,
+                 velocities=None, forces=None, compression='xtc',
+                 precision=1000.0, chunk_size=None, cache_size=4,
+                 **kwargs):
+        """
+        Parameters
+        ----------
+        coordinate_array : numpy.ndarray
+            The coordinates, compressed when the reader is created.
+        order : {"afc", "acf", "caf", "fac", "fca", "cfa"} (optional)
+            the order/shape of `coordinate_array` (and of `velocities` and
+            `forces`) as for the :class:`MemoryReader`
+        dimensions : [A, B, C, alpha, beta, gamma] (optional)
+            unitcell dimensions, or an array of shape (nframes, 6)
+        dt : float (optional)
+            The time difference between frames (ps).
+        filename : string (optional)
+            The name of the file from which this instance is created.
+        velocities : numpy.ndarray (optional)
+            Atom velocities. Must match shape of coordinate_array.
+        forces : numpy.ndarray (optional)
+            Atom forces. Must match shape of coordinate_array.
+        compression : {'xtc', 'zlib'} (optional)
+            compression of the positions: ``'xtc'`` rounds them to multiples
+            of ``1/precision`` like the XTC format does; ``'zlib'`` is
+            lossless
+        precision : float (optional)
+            inverse of the resolution of ``'xtc'`` compression; the default
+            of 1000 keeps positions to 0.001 Å
+        chunk_size : int (optional)
+            frames per compressed chunk; by default about 1 MiB of coordinates
+        cache_size : int (optional)
+            number of decoded chunks that are kept
+
+        Raises
+        ------
+        ValueError
+            if `compression` is unknown, if the arrays do not match, or if a
+            value is too large for the `precision`
+        """
+        super(CompressedMemoryReader, self).__init__()
+        self.filename = filename
+        settings = dict(compression=compression, precision=precision,
+                        chunk_size=chunk_size, cache_size=cache_size)
+
+        def compressed(array, lossless=False):
+            if array is None or isinstance(array, _CompressedArray):
+                return array
+            array = np.asarray(array, dtype=np.float32)
+            if array.ndim == 2:
+                array = array[np.newaxis]
+            array = array.transpose([order.find(c) for c in 'fac'])
+            kwargs = dict(settings)
+            if lossless:
+                kwargs['compression'] = 'zlib'
+            compressed = _CompressedArray(array.shape[1], **kwargs)
+            compressed.append(array)
+            return compressed
+
+        self._positions = compressed(coordinate_array)
+        self.n_frames, self.n_atoms = self._positions.shape[:2]
+        # velocities and forces have no natural resolution to round them to
+        self._velocities = compressed(velocities, lossless=True)
+        self._forces = compressed(forces, lossless=True)
+        for name, array in (('Velocities', self._velocities),
+                            ('Forces', self._forces)):
+            if array is not None and array.shape != self._positions.shape:
+                raise ValueError('{} has wrong shape {} to match coordinates '
+                                 '{}'.format(name, array.shape,
+                                             self._positions.shape))
+
+        provided_n_atoms = kwargs.pop("n_atoms", None)
+        if (provided_n_atoms is not None and
+                provided_n_atoms != self.n_atoms):
+            raise ValueError(
+                "The provided value for n_atoms ({}) does not match the "
+                "shape of the coordinate array ({})".format(provided_n_atoms,
+                                                            self.n_atoms))
+
+        self.ts = self._Timestep(self.n_atoms,
+                                 velocities=self._velocities is not None,
+                                 forces=self._forces is not None, **kwargs)
+        self.ts.dt = dt
+        if dimensions is None:
+            dimensions = np.zeros((self.n_frames, 6), dtype=np.float32)
+        else:
+            dimensions = np.asarray(dimensions, dtype=np.float32)
+            if dimensions.shape == (6,):
+                dimensions = np.tile(dimensions, (self.n_frames, 1))
+            elif dimensions.shape != (self.n_frames, 6):
+                raise ValueError("Provided dimensions array has shape {}. "
+                                 "This must be a array of shape (6,) or "
+                                 "(n_frames, 6)".format(dimensions.shape))
+        self.dimensions_array = dimensions
+        self.ts.frame = -1
+        self.ts.time = -1
+        self._read_next_timestep()
+
+    @property
+    def nbytes(self):
+        """Bytes of compressed coordinates, velocities and forces"""
+        return sum(array.nbytes for array in
+                   (self._positions, self._velocities, self._forces)
+                   if array is not None)
+
+    def copy(self):
+        """Return a copy of this reader
+
+        The compressed data is shared with the copy.
+        """
+        copied = [None if array is None else array.copy()
+                  for array in (self._positions, self._velocities,
+                                self._forces)]
+        new = self.__class__(copied[0], velocities=copied[1],
+                             forces=copied[2],
+                             dimensions=self.dimensions_array.copy(),
+                             dt=self.ts.dt, filename=self.filename)
+        if self.transformations:
+            new.add_transformations(*self.transformations)
+        new[self.ts.frame]
+        for auxname, auxread in self._auxs.items():
+            new.add_auxiliary(auxname, auxread.copy())
+        return new
+
+    def _reopen(self):
+        """Reset iteration to first frame"""
+        self.ts.frame = -1
+        self.ts.time = -1
+
+    def _read_next_timestep(self, ts=None):
+        """decode next frame into timestep"""
+        if self.ts.frame >= self.n_frames - 1:
+            raise IOError(errno.EIO, 'trying to go over trajectory limit')
+        if ts is None:
+            ts = self.ts
+        ts.frame += 1
+        frame = ts.frame
+        ts.positions = self._positions[frame]
+        if self._velocities is not None:
+            ts.velocities = self._velocities[frame]
+        if self._forces is not None:
+            ts.forces = self._forces[frame]
+        ts.dimensions = self.dimensions_array[frame]
+        ts.time = frame * self.dt
+        return ts
+
+    def _read_frame(self, i):
+        """read frame i"""
+        self.ts.frame = i - 1
+        return self._read_next_timestep()
+
+    def _read_block(self, start, stop, step, atom_indices, positions,
+                    dimensions):
+        """decode a block of frames chunk by chunk"""
+        frames = np.arange(start, stop, step)
+        self._positions.take(frames, atom_indices, out=positions)
+        dimensions[:] = self.dimensions_array[frames]
+
+    def timeseries(self, asel=None, start=0, stop=-1, step=1, order='afc'):
+        """Return the coordinates of an AtomGroup in the desired column order
+
+        Works like :meth:`MemoryReader.timeseries` but always returns a copy.
+
+        Parameters
+        ---------
+        asel : AtomGroup (optional)
+            Atom selection. Defaults to ``None``, all atoms.
+        start : int (optional)
+        stop : int (optional)
+        step : int (optional)
+            range of trajectory to access, `start` and `stop` are *inclusive*
+        order : {"afc", "acf", "caf", "fac", "fca", "cfa"} (optional)
+            the order/shape of the return data array
+        """
+        stop_index = stop + 1
+        if stop_index == 0:
+            stop_index = None
+        frames = range(self.n_frames)[start:stop_index:step]
+        atom_indices = None if asel is None else asel.indices
+        array = self._positions.take(frames, atom_indices)
+        return array.transpose(['fac'.find(c) for c in order])
+
+    def __repr__(self):
+        """String representation"""
+        return ("<{cls} with {nframes} frames of {natoms} atoms>"
+                "".format(
+                    cls=self.__class__.__name__,
+                    nframes=self.n_frames,
+                    natoms=self.n_atoms
+                ))
@@ -0,0 +1,251 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+# doi: 10.25080/majora-629e541a-00e
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+"""
+Cache of frame offsets --- :mod:`MDAnalysis.coordinates.offsets`
+================================================================
+
+Readers of multi-frame files without a frame index (XTC, TRR, the Amber ASCII
+TRJ, XYZ, LAMMPS dump and multi-model PDB files) scan the whole file once to
+find where each frame starts.  This module keeps the result of such a scan in
+a shared cache directory, so that other processes opening the same file (for
+instance many jobs on a cluster reading trajectories from a read-only data
+store) do not have to scan it again.
+
+The cache is switched off by default; it is switched on by setting a cache
+directory with :func:`set_offsets_dir` or with the environment variable
+``MDANALYSIS_OFFSETS_DIR``::
+
+   import MDAnalysis as mda
+   from MDAnalysis.coordinates import offsets
+
+   offsets.set_offsets_dir('/scratch/me/mda_offsets')
+   u = mda.Universe(TPR, XTC)  # offsets are looked up in the cache directory
+
+Entries are keyed by a hash of the format, the reader parameters, the size of
+the file and its first and last MiB, so that copies of the same trajectory
+share an entry and a trajectory that grows gets a new one.  Because the key
+does not cover the middle of the file, each entry also records the
+modification time of the file it was scanned from; a file with another
+modification time (for instance one rewritten in place with the same size,
+or a copy that did not preserve the time) is scanned again and the entry
+replaced.  Entries are written atomically, and concurrent processes wait on a lock file for the
+first one to finish scanning instead of all scanning the same file.  Without
+a cache directory the XTC and TRR readers keep storing their offsets next to
+the trajectory (see :ref:`Notes on offsets <offsets-label>`).  The
+:class:`~MDAnalysis.coordinates.chain.ChainReader` keeps the number of frames,
+time step and start and end times of each of its trajectories in the same
+cache.
+
+.. autofunction:: set_offsets_dir
+.. autofunction:: get_offsets_dir
+.. autofunction:: cached_offsets
+.. autofunction:: offsets_key
+
+
+.. versionadded:: 2.0.0
+"""
+import hashlib
+import os
+import tempfile
+import warnings
+from contextlib import contextmanager
+
+import numpy as np
+
+from ..lib import util
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # no file locking on Windows; concurrent processes may then both scan
+    fcntl = None
+
+
+#: bytes read from the start and from the end of a file for its key
+_HASHED_BYTES = 1 << 20
+
+#: name under which the modification time of the file is kept in an entry
+_MTIME = '_mtime_ns'
+
+_offsets_dir = None
+
+
+def set_offsets_dir(path):
+    """Set the directory in which frame offsets are cached
+
+    Parameters
+    ----------
+    path : str or None
+        cache directory, created if needed; ``None`` falls back to the
+        environment variable ``MDANALYSIS_OFFSETS_DIR`` and switches the cache
+        off if that is not set either
+    """
+    global _offsets_dir
+    _offsets_dir = path
+
+
+def get_offsets_dir():
+    """Directory in which frame offsets are cached
+
+    Returns
+    -------
+    path : str or None
+        the directory set with :func:`set_offsets_dir` or in
+        ``MDANALYSIS_OFFSETS_DIR``; ``None`` if offsets are not cached
+    """
+    if _offsets_dir is not None:
+        return _offsets_dir
+    return os.environ.get('MDANALYSIS_OFFSETS_DIR') or None
+
+
+def offsets_key(filename, **params):
+    """Key of the offsets of `filename` in the cache
+
+    Parameters
+    ----------
+    filename : str
+        trajectory file
+    **params
+        reader parameters the offsets depend on, e.g. the format and the
+        number of atoms
+
+    Returns
+    -------
+    key : str
+        hex digest of the parameters, the file size and the first and last
+        MiB of the file
+    """
+    sha = hashlib.sha256()
+    for name in sorted(params):
+        sha.update('{}={};'.format(name, params[name]).encode())
+    size = os.path.getsize(filename)
+    sha.update('size={};'.format(size).encode())
+    with open(filename, 'rb') as f:
+        sha.update(f.read(_HASHED_BYTES))
+        if size > _HASHED_BYTES:
+            f.seek(max(size - _HASHED_BYTES, _HASHED_BYTES))
+            sha.update(f.read())
+    return sha.hexdigest()
+
+
+@contextmanager
+def _locked(path):
+    """hold an exclusive lock on the file `path` (created if needed)"""
+    with open(path, 'a') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _load(path, mtime):
+    """read a cache entry, ``None`` if it does not exist, is broken or was
+    scanned from a file with another modification time than `mtime`"""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            data = {k: v for k, v in data.items()}
+    except (IOError, OSError, ValueError):
+        return None
+    if _MTIME not in data or int(data.pop(_MTIME)) != mtime:
+        return None
+    return data
+
+
+def _save(path, data):
+    """atomically write the cache entry `data` to `path`"""
+    directory = os.path.dirname(path)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def cached_offsets(filename, scan, refresh=False, **params):
+    """Frame offsets of `filename`, from the cache if possible
+
+    Parameters
+    ----------
+    filename : str
+        trajectory file
+    scan : callable
+        called without arguments to scan the file if the offsets are not
+        cached; returns a dictionary of numpy arrays
+    refresh : bool (optional)
+        scan the file and replace the cache entry even if there is one
+    **params
+        reader parameters the offsets depend on, see :func:`offsets_key`
+
+    Returns
+    -------
+    offsets : dict
+        dictionary of numpy arrays as returned by `scan`
+
+    Notes
+    -----
+    An entry is only used if the modification time of `filename` is the one
+    recorded when the entry was written; otherwise `filename` is scanned
+    again.  If no cache directory is set, if `filename` is not a file on disk (for
+    instance a :class:`~MDAnalysis.lib.util.NamedStream`) or if
+    the cache directory can not be written to, `scan` is called directly.
+    """
+    directory = get_offsets_dir()
+    if (directory is None or isinstance(filename, util.NamedStream)
+            or not isinstance(filename, (str, os.PathLike))
+            or not os.path.isfile(filename)):
+        return scan()
+
+    scanning = False
+    try:
+        os.makedirs(directory, exist_ok=True)
+        mtime = os.stat(filename).st_mtime_ns
+        key = offsets_key(filename, **params)
+        path = os.path.join(directory, key + '.npz')
+        if not refresh:
+            data = _load(path, mtime)
+            if data is not None:
+                return data
+        with _locked(path + '.lock'):
+            # another process may have scanned the file while we waited
+            data = None if refresh else _load(path, mtime)
+            if data is None:
+                scanning = True
+                data = {k: np.asarray(v) for k, v in scan().items()}
+                scanning = False
+                entry = dict(data)
+                entry[_MTIME] = np.int64(mtime)
+                _save(path, entry)
+        return data
+    except (IOError, OSError) as err:
+        if scanning:
+            # the file itself could not be read, not the cache
+            raise
+        warnings.warn("Couldn't use the offsets cache in {} because: "
+                      "{}".format(directory, err))
+        return scan()
@@ -704,6 +704,67 @@ class GroupBase(_MutableBase):
         #    return ``not np.any(mask)`` here but using the following is faster:
         return not np.count_nonzero(mask)
 
+    def _compound_partition(self, compound, compound_indices):
+        """Partition of the group's :class:`Atoms<Atom>` into compounds.
+
+        The partition is computed once per `compound` and cached with the
+        group; it is only recomputed if `compound_indices` changed since.
+
+        Parameters
+        ----------
+        compound : str
+            Name of the compound type, used as cache key.
+        compound_indices : numpy.ndarray
+            Compound index of each :class:`Atom` of the group.
+
+        Returns
+        -------
+        sort_indices : numpy.ndarray or slice
+            Indices sorting the atoms of the group by compound index, or
+            ``slice(None)`` if they already are sorted.
+        starts : numpy.ndarray
+            Offset of each compound in the sorted atoms, suitable for
+            :meth:`numpy.ufunc.reduceat`. Compounds are ordered by increasing
+            compound index.
+        counts : numpy.ndarray
+            Number of atoms of each compound.
+        inverse : numpy.ndarray
+            Position (in `starts`) of the compound of each atom of the group.
+
+
+        .. versionadded:: 2.0.0
+        """
+        cache = self._cache.setdefault('compound_partition', {})
+        try:
+            cached_indices, partition = cache[compound]
+        except KeyError:
+            pass
+        else:
+            if np.array_equal(cached_indices, compound_indices):
+                return partition
+
+        compound_indices = np.asarray(compound_indices)
+        n_atoms = len(compound_indices)
+        # are we already sorted? argsorting and fancy-indexing can be expensive
+        if np.any(np.diff(compound_indices) < 0):
+            sort_indices = np.argsort(compound_indices, kind='stable')
+            sorted_indices = compound_indices[sort_indices]
+        else:
+            sort_indices = slice(None)
+            sorted_indices = compound_indices
+        if n_atoms:
+            starts = np.flatnonzero(np.diff(sorted_indices)) + 1
+            starts = np.concatenate(([0], starts)).astype(np.intp)
+        else:
+            starts = np.zeros(0, dtype=np.intp)
+        counts = np.diff(np.append(starts, n_atoms))
+        inverse = np.empty(n_atoms, dtype=np.intp)
+        inverse[sort_indices] = np.repeat(np.arange(len(starts)), counts)
+
+        partition = (sort_indices, starts, counts, inverse)
+        cache[compound] = (compound_indices.copy(), partition)
+        return partition
+
     @warn_if_not_unique
     @check_pbc_and_unwrap
     def center(self, weights, pbc=False, compound='group', unwrap=False):
@@ -780,6 +841,8 @@ class GroupBase(_MutableBase):
             compounds
         .. versionchanged:: 0.20.0 Added `unwrap` parameter
         .. versionchanged:: 1.0.0 Removed flags affecting default behaviour
+        .. versionchanged:: 2.0.0 Centers of all compounds are summed up in a
+            single pass over the group.
         """
         atoms = self.atoms
 
@@ -829,14 +892,9 @@ class GroupBase(_MutableBase):
                              "'molecules', or 'fragments'.".format(compound))
 
         # Sort positions and weights by compound index and promote to dtype if
-        # required:
-
-        # are we already sorted? argsorting and fancy-indexing can be expensive
-        if np.any(np.diff(compound_indices) < 0):
-            sort_indices = np.argsort(compound_indices)
-        else:
-            sort_indices = slice(None)
-        compound_indices = compound_indices[sort_indices]
+        # required, then sum them up compound-wise in a single pass:
+        sort_indices, starts, counts, _ = self._compound_partition(
+            comp, compound_indices)
 
         # Unwrap Atoms
         if unwrap:
@@ -844,31 +902,15 @@ class GroupBase(_MutableBase):
                                   inplace=False)[sort_indices]
         else:
             coords = atoms.positions[sort_indices]
+        coords = coords.astype(dtype, copy=False)
         if weights is None:
-            coords = coords.astype(dtype, copy=False)
+            centers = np.add.reduceat(coords, starts, axis=0)
+            centers /= counts[:, None]
         else:
-            weights = weights.astype(dtype, copy=False)
-            weights = weights[sort_indices]
-        # Get sizes of compounds:
-        unique_compound_indices, compound_sizes = np.unique(compound_indices,
-                                                            return_counts=True)
-        n_compounds = len(unique_compound_indices)
-        unique_compound_sizes = unique_int_1d(compound_sizes)
-        # Allocate output array:
-        centers = np.zeros((n_compounds, 3), dtype=dtype)
-        # Compute centers per compound for each compound size:
-        for compound_size in unique_compound_sizes:
-            compound_mask = compound_sizes == compound_size
-            _compound_indices = unique_compound_indices[compound_mask]
-            atoms_mask = np.in1d(compound_indices, _compound_indices)
-            _coords = coords[atoms_mask].reshape((-1, compound_size, 3))
-            if weights is None:
-                _centers = _coords.mean(axis=1)
-            else:
-                _weights = weights[atoms_mask].reshape((-1, compound_size))
-                _centers = (_coords * _weights[:, :, None]).sum(axis=1)
-                _centers /= _weights.sum(axis=1)[:, None]
-            centers[compound_mask] = _centers
+            weights = weights.astype(dtype, copy=False)[sort_indices]
+            centers = np.add.reduceat(coords * weights[:, None], starts,
+                                      axis=0)
+            centers /= np.add.reduceat(weights, starts)[:, None]
         if pbc:
             centers = distances.apply_PBC(centers, atoms.dimensions)
         return centers
@@ -1002,6 +1044,9 @@ class GroupBase(_MutableBase):
 
 
         .. versionadded:: 0.20.0
+        .. versionchanged:: 2.0.0
+           Sums over compounds (the default `function`) are computed in a
+           single pass over the group.
         """
 
         atoms = self.atoms
@@ -1045,22 +1090,19 @@ class GroupBase(_MutableBase):
         higher_dims = list(attribute_values.shape[1:])
 
         # Sort attribute values by compound
-        sort_indices = np.argsort(compound_indices)
-        compound_indices = compound_indices[sort_indices]
-
+        sort_indices, starts, counts, _ = self._compound_partition(
+            comp, compound_indices)
         attribute_values = attribute_values[sort_indices]
-        # Get sizes of compounds:
-        unique_compound_indices, compound_sizes = np.unique(compound_indices,
-                                                            return_counts=True)
-        n_compounds = len(unique_compound_indices)
-        unique_compound_sizes = unique_int_1d(compound_sizes)
+        if function is np.sum and attribute_values.dtype.kind in 'iuf':
+            # segmented sum over all compounds at once:
+            return np.add.reduceat(attribute_values, starts, axis=0,
+                                   dtype=np.float64)
         # Allocate output array:
-        accumulation = np.zeros([n_compounds] + higher_dims)
-        # Compute sums per compound for each compound size:
-        for compound_size in unique_compound_sizes:
-            compound_mask = compound_sizes == compound_size
-            _compound_indices = unique_compound_indices[compound_mask]
-            atoms_mask = np.in1d(compound_indices, _compound_indices)
+        accumulation = np.zeros([len(counts)] + higher_dims)
+        # Compute accumulations per compound for each compound size:
+        for compound_size in unique_int_1d(counts):
+            compound_mask = counts == compound_size
+            atoms_mask = np.repeat(compound_mask, counts)
             _elements = attribute_values[atoms_mask].reshape([-1, compound_size]
                                                              + higher_dims)
             _accumulation = function(_elements, axis=1)
@@ -1447,6 +1489,9 @@ class GroupBase(_MutableBase):
            The method only acts on atoms *belonging to the group* and returns
            the wrapped positions as a :class:`numpy.ndarray`.
            Added optional argument `inplace`.
+        .. versionchanged:: 2.0.0
+           The shifts of all compounds are applied at once instead of one
+           compound at a time.
         """
         # Try and auto detect box dimensions:
         if box is None:
@@ -1539,12 +1584,8 @@ class GroupBase(_MutableBase):
                 shifts = target - ctrpos
 
                 # apply the shifts:
-                unique_compound_indices = unique_int_1d(compound_indices)
-                shift_idx = 0
-                for i in unique_compound_indices:
-                    mask = np.where(compound_indices == i)
-                    positions[mask] += shifts[shift_idx]
-                    shift_idx += 1
+                inverse = atoms._compound_partition(comp, compound_indices)[3]
+                positions += shifts[inverse]
 
         if inplace:
             atoms.positions = positions
@@ -1616,97 +1657,29 @@ class GroupBase(_MutableBase):
         See Also
         --------
         :func:`~MDAnalysis.lib.mdamath.make_whole`,
+        :class:`~MDAnalysis.lib.mdamath.UnwrapPlan`,
         :meth:`wrap`,
         :meth:`pack_into_box`,
         :func:`~MDanalysis.lib.distances.apply_PBC`
 
 
         .. versionadded:: 0.20.0
+        .. versionchanged:: 2.0.0
+           All compounds are made whole in a single pass over their bonds and
+           shifted at once, instead of one compound after the other, see
+           :class:`~MDAnalysis.lib.mdamath.UnwrapPlan`.
         """
         atoms = self.atoms
-        # bail out early if no bonds in topology:
-        if not hasattr(atoms, 'bonds'):
+        # bail out early if no bonds in topology (u._topology.bonds is much
+        # faster to access than atoms.bonds):
+        if not hasattr(self.universe._topology, 'bonds'):
             raise NoDataError("{}.unwrap() not available; this requires Bonds"
                               "".format(self.__class__.__name__))
         unique_atoms = atoms.unique
-        if reference is not None:
-            ref = reference.lower()
-            if ref == 'com':
-                # Don't use hasattr(self, 'masses') because that's incredibly
-                # slow for ResidueGroups or SegmentGroups
-                if not hasattr(unique_atoms, 'masses'):
-                    raise NoDataError("Cannot perform unwrap with "
-                                      "reference='com', this requires masses.")
-            elif ref != 'cog':
-                raise ValueError("Unrecognized reference '{}'. Please use one "
-                                 "of 'com', 'cog', or None.".format(reference))
-        comp = compound.lower()
-        if comp not in ('fragments', 'group', 'residues', 'segments',
-                        'molecules'):
-            raise ValueError("Unrecognized compound definition '{}'. Please "
-                             "use one of 'group', 'residues', 'segments', "
-                             "'molecules', or 'fragments'.".format(compound))
-        # The 'group' needs no splitting:
-        if comp == 'group':
-            positions = mdamath.make_whole(unique_atoms, inplace=False)
-            # Apply reference shift if required:
-            if reference is not None and len(positions) > 0:
-                if ref == 'com':
-                    masses = unique_atoms.masses
-                    total_mass = masses.sum()
-                    if np.isclose(total_mass, 0.0):
-                        raise ValueError("Cannot perform unwrap with "
-                                         "reference='com' because the total "
-                                         "mass of the group is zero.")
-                    refpos = np.sum(positions * masses[:, None], axis=0)
-                    refpos /= total_mass
-                else:  # ref == 'cog'
-                    refpos = positions.mean(axis=0)
-                refpos = refpos.astype(np.float32, copy=False)
-                target = distances.apply_PBC(refpos, self.dimensions)
-                positions += target - refpos
-        # We need to split the group into compounds:
-        else:
-            if comp == 'fragments':
-                compound_indices = unique_atoms.fragindices
-            elif comp == 'residues':
-                compound_indices = unique_atoms.resindices
-            elif comp == 'segments':
-                compound_indices = unique_atoms.segindices
-            else:  # comp == 'molecules'
-                try:
-                    compound_indices = unique_atoms.molnums
-                except AttributeError:
-                    errmsg = ("Cannot use compound='molecules', this "
-                              "requires molnums.")
-                    raise NoDataError(errmsg) from None
-            # Now process every compound:
-            unique_compound_indices = unique_int_1d(compound_indices)
-            positions = unique_atoms.positions
-            for i in unique_compound_indices:
-                mask = np.where(compound_indices == i)
-                c = unique_atoms[mask]
-                positions[mask] = mdamath.make_whole(c, inplace=False)
-                # Apply reference shift if required:
-                if reference is not None:
-                    if ref == 'com':
-                        masses = c.masses
-                        total_mass = masses.sum()
-                        if np.isclose(total_mass, 0.0):
-                            raise ValueError("Cannot perform unwrap with "
-                                             "reference='com' because the "
-                                             "total mass of at least one of "
-                                             "the {} is zero.".format(comp))
-                        refpos = np.sum(positions[mask] * masses[:, None],
-                                        axis=0)
-                        refpos /= total_mass
-                    else:  # ref == 'cog'
-                        refpos = positions[mask].mean(axis=0)
-                    refpos = refpos.astype(np.float32, copy=False)
-                    target = distances.apply_PBC(refpos, self.dimensions)
-                    positions[mask] += target - refpos
-        if inplace:
-            unique_atoms.positions = positions
+        # check the reference before the plan checks the compound
+        mdamath._unwrap_reference(unique_atoms, reference)
+        plan = mdamath.UnwrapPlan(unique_atoms, compound=compound)
+        positions = plan.unwrap(reference=reference, inplace=inplace)
         if not atoms.isunique:
             positions = positions[atoms._unique_restore_mask]
         return positions
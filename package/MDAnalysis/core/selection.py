@@ -565,11 +565,29 @@ class SelgroupSelection(Selection):
         return group[mask]
 
 
+def _interned_mask(nmattr, ix, func):
+    """Boolean mask of which entries `ix` of a string attribute pass `func`
+
+    `func` is called once per distinct string in the lookup table of the
+    string attribute `nmattr`, the result is then gathered through each
+    entry's string index.  The cost therefore scales with the number of
+    distinct strings, rather than the number of atoms.
+
+    .. versionadded:: 2.0.0
+    """
+    passing = np.zeros(len(nmattr.name_lookup), dtype=bool)
+    for nm, i in nmattr.namedict.items():
+        passing[i] = func(nm)
+    return passing[nmattr.nmidx[ix]]
+
+
 class _ProtoStringSelection(Selection):
     """Selections based on text attributes
 
     .. versionchanged:: 1.0.0
         Supports multiple wildcards, based on fnmatch
+    .. versionchanged:: 2.0.0
+        Patterns are matched once per distinct string
     """
     def __init__(self, parser, tokens):
         vals = grab_not_keywords(tokens)
@@ -583,16 +601,13 @@ class _ProtoStringSelection(Selection):
         # rather than work on group.names, cheat and look at the lookup table
         nmattr = getattr(group.universe._topology, self.field)
 
-        matches = []  # list of passing indices
-        # iterate through set of known atom names, check which pass
-        for nm, ix in nmattr.namedict.items():
-            if any(fnmatch.fnmatchcase(nm, val) for val in self.values):
-                matches.append(ix)
-
-        # atomname indices for members of this group
-        nmidx = nmattr.nmidx[getattr(group, self.level)]
+        # check which of the known names pass, then gather for the group
+        mask = _interned_mask(
+            nmattr, getattr(group, self.level),
+            lambda nm: any(fnmatch.fnmatchcase(nm, val)
+                           for val in self.values))
 
-        return group[np.in1d(nmidx, matches)].unique
+        return group[mask].unique
 
 class AromaticSelection(Selection):
     """Select aromatic atoms.
@@ -964,12 +979,9 @@ class ProteinSelection(Selection):
     def apply(self, group):
         resname_attr = group.universe._topology.resnames
         # which values in resname attr are in prot_res?
-        matches = [ix for (nm, ix) in resname_attr.namedict.items()
-                   if nm in self.prot_res]
-        # index of each atom's resname
-        nmidx = resname_attr.nmidx[group.resindices]
-        # intersect atom's resname index and matches to prot_res
-        return group[np.in1d(nmidx, matches)].unique
+        mask = _interned_mask(resname_attr, group.resindices,
+                              self.prot_res.__contains__)
+        return group[mask].unique
 
 
 class NucleicSelection(Selection):
@@ -1004,11 +1016,8 @@ class NucleicSelection(Selection):
 
     def apply(self, group):
         resnames = group.universe._topology.resnames
-        nmidx = resnames.nmidx[group.resindices]
-
-        matches = [ix for (nm, ix) in resnames.namedict.items()
-                   if nm in self.nucl_res]
-        mask = np.in1d(nmidx, matches)
+        mask = _interned_mask(resnames, group.resindices,
+                              self.nucl_res.__contains__)
 
         return group[mask].unique
 
@@ -1032,16 +1041,12 @@ class BackboneSelection(ProteinSelection):
         resnames = group.universe._topology.resnames
 
         # filter by atom names
-        name_matches = [ix for (nm, ix) in atomnames.namedict.items()
-                        if nm in self.bb_atoms]
-        nmidx = atomnames.nmidx[group.ix]
-        group = group[np.in1d(nmidx, name_matches)]
+        group = group[_interned_mask(atomnames, group.ix,
+                                     self.bb_atoms.__contains__)]
 
         # filter by resnames
-        resname_matches = [ix for (nm, ix) in resnames.namedict.items()
-                           if nm in self.prot_res]
-        nmidx = resnames.nmidx[group.resindices]
-        group = group[np.in1d(nmidx, resname_matches)]
+        group = group[_interned_mask(resnames, group.resindices,
+                                     self.prot_res.__contains__)]
 
         return group.unique
 
@@ -1065,16 +1070,12 @@ class NucleicBackboneSelection(NucleicSelection):
         resnames = group.universe._topology.resnames
 
         # filter by atom names
-        name_matches = [ix for (nm, ix) in atomnames.namedict.items()
-                        if nm in self.bb_atoms]
-        nmidx = atomnames.nmidx[group.ix]
-        group = group[np.in1d(nmidx, name_matches)]
+        group = group[_interned_mask(atomnames, group.ix,
+                                     self.bb_atoms.__contains__)]
 
         # filter by resnames
-        resname_matches = [ix for (nm, ix) in resnames.namedict.items()
-                           if nm in self.nucl_res]
-        nmidx = resnames.nmidx[group.resindices]
-        group = group[np.in1d(nmidx, resname_matches)]
+        group = group[_interned_mask(resnames, group.resindices,
+                                     self.nucl_res.__contains__)]
 
         return group.unique
 
@@ -1103,16 +1104,12 @@ class BaseSelection(NucleicSelection):
         resnames = group.universe._topology.resnames
 
         # filter by atom names
-        name_matches = [ix for (nm, ix) in atomnames.namedict.items()
-                        if nm in self.base_atoms]
-        nmidx = atomnames.nmidx[group.ix]
-        group = group[np.in1d(nmidx, name_matches)]
+        group = group[_interned_mask(atomnames, group.ix,
+                                     self.base_atoms.__contains__)]
 
         # filter by resnames
-        resname_matches = [ix for (nm, ix) in resnames.namedict.items()
-                           if nm in self.nucl_res]
-        nmidx = resnames.nmidx[group.resindices]
-        group = group[np.in1d(nmidx, resname_matches)]
+        group = group[_interned_mask(resnames, group.resindices,
+                                     self.nucl_res.__contains__)]
 
         return group.unique
 
@@ -1133,16 +1130,12 @@ class NucleicSugarSelection(NucleicSelection):
         resnames = group.universe._topology.resnames
 
         # filter by atom names
-        name_matches = [ix for (nm, ix) in atomnames.namedict.items()
-                        if nm in self.sug_atoms]
-        nmidx = atomnames.nmidx[group.ix]
-        group = group[np.in1d(nmidx, name_matches)]
+        group = group[_interned_mask(atomnames, group.ix,
+                                     self.sug_atoms.__contains__)]
 
         # filter by resnames
-        resname_matches = [ix for (nm, ix) in resnames.namedict.items()
-                           if nm in self.nucl_res]
-        nmidx = resnames.nmidx[group.resindices]
-        group = group[np.in1d(nmidx, resname_matches)]
+        group = group[_interned_mask(resnames, group.resindices,
+                                     self.nucl_res.__contains__)]
 
         return group.unique
 
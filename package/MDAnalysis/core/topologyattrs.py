@@ -35,9 +35,7 @@ These are usually read by the TopologyParser.
 import Bio.Seq
 import Bio.SeqRecord
 from collections import defaultdict
-import copy
 import functools
-import itertools
 import numbers
 import numpy as np
 import warnings
@@ -628,61 +626,73 @@ class Atomids(AtomAttr):
         return np.arange(1, na + 1)
 
 
-class _AtomStringAttr(AtomAttr):
+class _StringInternerMixin(object):
+    """String interning pattern
+
+    Used for faster matching of strings (see
+    :class:`~MDAnalysis.core.selection._ProtoStringSelection`)
+
+    self.namedict (dict)
+    - maps actual string to string index (str->int)
+    self.name_lookup (array dtype object)
+    - maps string index to actual string (int->str)
+    self.nmidx (array dtype int)
+    - maps object index to string index (int->int)
+    self.values (array dtype object)
+    - the premade per-object string values
+
+    .. versionadded:: 2.0.0
+       Merged the implementations of the atom, residue and segment string
+       attributes; values are interned in bulk instead of one at a time.
+    """
     def __init__(self, vals, guessed=False):
         self._guessed = guessed
 
         self.namedict = dict()  # maps str to nmidx
-        name_lookup = []  # maps idx to str
+        self.name_lookup = np.array([], dtype=object)  # maps idx to str
         # eg namedict['O'] = 5 & name_lookup[5] = 'O'
 
-        self.nmidx = np.zeros_like(vals, dtype=int)  # the lookup for each atom
+        # the lookup for each object
         # eg Atom 5 is 'C', so nmidx[5] = 7, where name_lookup[7] = 'C'
+        self.nmidx = self._intern(vals)
+        self.values = self.name_lookup[self.nmidx]
 
-        for i, val in enumerate(vals):
-            try:
-                self.nmidx[i] = self.namedict[val]
-            except KeyError:
-                nextidx = len(self.namedict)
-                self.namedict[val] = nextidx
-                name_lookup.append(val)
+    def _intern(self, vals):
+        """String indices of `vals`, adding new strings to the lookup table"""
+        namedict = self.namedict
+        n_known = len(namedict)
+        vals = np.asarray(vals, dtype=object)
+        # a single pass over a dict is cheaper than sorting the strings
+        nmidx = np.fromiter((namedict.setdefault(val, len(namedict))
+                             for val in vals), dtype=int, count=len(vals))
+        if len(namedict) > n_known:
+            newnames = np.empty(len(namedict) - n_known, dtype=object)
+            for name, ix in namedict.items():
+                if ix >= n_known:
+                    newnames[ix - n_known] = name
+            self.name_lookup = np.concatenate([self.name_lookup, newnames])
+        return nmidx
 
-                self.nmidx[i] = nextidx
+    def _set_X(self, group, values):
+        # two possibilities, either single value given, or one per object
+        if isinstance(values, str) or np.ndim(values) == 0:
+            newidx = self._intern([values])[0]
+        else:
+            newidx = self._intern(values)
+
+        self.nmidx[group.ix] = newidx  # newidx either single value or same size array
+        # only update the values of the group
+        self.values[group.ix] = self.name_lookup[newidx]
 
-        self.name_lookup = np.array(name_lookup, dtype=object)
-        self.values = self.name_lookup[self.nmidx]
 
+class _AtomStringAttr(_StringInternerMixin, AtomAttr):
     @staticmethod
     def _gen_initial_values(na, nr, ns):
         return np.array(['' for _ in range(na)], dtype=object)
 
     @_check_length
     def set_atoms(self, ag, values):
-        newnames = []
-
-        # two possibilities, either single value given, or one per Atom
-        if isinstance(values, str):
-            try:
-                newidx = self.namedict[values]
-            except KeyError:
-                newidx = len(self.namedict)
-                self.namedict[values] = newidx
-                newnames.append(values)
-        else:
-            newidx = np.zeros_like(values, dtype=int)
-            for i, val in enumerate(values):
-                try:
-                    newidx[i] = self.namedict[val]
-                except KeyError:
-                    nextidx = len(self.namedict)
-                    self.namedict[val] = nextidx
-                    newnames.append(val)
-                    newidx[i] = nextidx
-
-        self.nmidx[ag.ix] = newidx  # newidx either single value or same size array
-        if newnames:
-            self.name_lookup = np.concatenate([self.name_lookup, newnames])
-        self.values = self.name_lookup[self.nmidx]
+        return self._set_X(ag, values)
 
 
 # TODO: update docs to property doc
@@ -1914,61 +1924,14 @@ class Resids(ResidueAttr):
         return np.arange(1, nr + 1)
 
 
-class _ResidueStringAttr(ResidueAttr):
-    def __init__(self, vals, guessed=False):
-        self._guessed = guessed
-
-        self.namedict = dict()  # maps str to nmidx
-        name_lookup = []  # maps idx to str
-        # eg namedict['O'] = 5 & name_lookup[5] = 'O'
-
-        self.nmidx = np.zeros_like(vals, dtype=int)  # the lookup for each atom
-        # eg Atom 5 is 'C', so nmidx[5] = 7, where name_lookup[7] = 'C'
-
-        for i, val in enumerate(vals):
-            try:
-                self.nmidx[i] = self.namedict[val]
-            except KeyError:
-                nextidx = len(self.namedict)
-                self.namedict[val] = nextidx
-                name_lookup.append(val)
-
-                self.nmidx[i] = nextidx
-
-        self.name_lookup = np.array(name_lookup, dtype=object)
-        self.values = self.name_lookup[self.nmidx]
-
+class _ResidueStringAttr(_StringInternerMixin, ResidueAttr):
     @staticmethod
     def _gen_initial_values(na, nr, ns):
         return np.array(['' for _ in range(nr)], dtype=object)
 
     @_check_length
     def set_residues(self, rg, values):
-        newnames = []
-
-        # two possibilities, either single value given, or one per Atom
-        if isinstance(values, str):
-            try:
-                newidx = self.namedict[values]
-            except KeyError:
-                newidx = len(self.namedict)
-                self.namedict[values] = newidx
-                newnames.append(values)
-        else:
-            newidx = np.zeros_like(values, dtype=int)
-            for i, val in enumerate(values):
-                try:
-                    newidx[i] = self.namedict[val]
-                except KeyError:
-                    nextidx = len(self.namedict)
-                    self.namedict[val] = nextidx
-                    newnames.append(val)
-                    newidx[i] = nextidx
-
-        self.nmidx[rg.ix] = newidx  # newidx either single value or same size array
-        if newnames:
-            self.name_lookup = np.concatenate([self.name_lookup, newnames])
-        self.values = self.name_lookup[self.nmidx]
+        return self._set_X(rg, values)
 
 
 # TODO: update docs to property doc
@@ -2150,61 +2113,14 @@ class SegmentAttr(TopologyAttr):
         self.values[sg.ix] = values
 
 
-class _SegmentStringAttr(SegmentAttr):
-    def __init__(self, vals, guessed=False):
-        self._guessed = guessed
-
-        self.namedict = dict()  # maps str to nmidx
-        name_lookup = []  # maps idx to str
-        # eg namedict['O'] = 5 & name_lookup[5] = 'O'
-
-        self.nmidx = np.zeros_like(vals, dtype=int)  # the lookup for each atom
-        # eg Atom 5 is 'C', so nmidx[5] = 7, where name_lookup[7] = 'C'
-
-        for i, val in enumerate(vals):
-            try:
-                self.nmidx[i] = self.namedict[val]
-            except KeyError:
-                nextidx = len(self.namedict)
-                self.namedict[val] = nextidx
-                name_lookup.append(val)
-
-                self.nmidx[i] = nextidx
-
-        self.name_lookup = np.array(name_lookup, dtype=object)
-        self.values = self.name_lookup[self.nmidx]
-
+class _SegmentStringAttr(_StringInternerMixin, SegmentAttr):
     @staticmethod
     def _gen_initial_values(na, nr, ns):
         return np.array(['' for _ in range(nr)], dtype=object)
 
     @_check_length
     def set_segments(self, sg, values):
-        newnames = []
-
-        # two possibilities, either single value given, or one per Atom
-        if isinstance(values, str):
-            try:
-                newidx = self.namedict[values]
-            except KeyError:
-                newidx = len(self.namedict)
-                self.namedict[values] = newidx
-                newnames.append(values)
-        else:
-            newidx = np.zeros_like(values, dtype=int)
-            for i, val in enumerate(values):
-                try:
-                    newidx[i] = self.namedict[val]
-                except KeyError:
-                    nextidx = len(self.namedict)
-                    self.namedict[val] = nextidx
-                    newnames.append(val)
-                    newidx[i] = nextidx
-
-        self.nmidx[sg.ix] = newidx  # newidx either single value or same size array
-        if newnames:
-            self.name_lookup = np.concatenate([self.name_lookup, newnames])
-        self.values = self.name_lookup[self.nmidx]
+        return self._set_X(sg, values)
 
 
 # TODO: update docs to property doc
@@ -2223,114 +2139,181 @@ def _check_connection_values(func):
     """
     Checks values passed to _Connection methods for:
      - appropriate number of atom indices
-     - coerces them to tuples of ints (for hashing)
+     - coerces them to an array of ints of shape ``(n, n_atoms)``
      - ensures that first value is less than last (reversibility & hashing)
 
     .. versionadded:: 1.0.0
-
+    .. versionchanged:: 2.0.0
+       Values are passed on as an array instead of a list of tuples.
     """
     @functools.wraps(func)
     def wrapper(self, values, *args, **kwargs):
-        if not all(len(x) == self._n_atoms
-                   and all(isinstance(y, (int, np.integer)) for y in x)
-                   for x in values):
-            raise ValueError(("{} must be an iterable of tuples with {}"
-                              " atom indices").format(self.attrname,
-                                                      self._n_atoms))
-        clean = []
-        for v in values:
-            if v[0] > v[-1]:
-                v = v[::-1]
-            clean.append(tuple(v))
-
-        return func(self, clean, *args, **kwargs)
+        errmsg = ("{} must be an iterable of tuples with {} atom indices"
+                  "".format(self.attrname, self._n_atoms))
+        if not isinstance(values, (list, tuple, np.ndarray)):
+            # e.g. sets or generators
+            values = list(values)
+        try:
+            arr = np.asarray(values)
+        except ValueError:  # ragged input
+            raise ValueError(errmsg) from None
+        if len(arr) == 0:
+            arr = np.zeros((0, self._n_atoms), dtype=np.int32)
+        elif (arr.ndim != 2 or arr.shape[1] != self._n_atoms or
+              arr.dtype.kind not in 'iu'):
+            if not all(len(x) == self._n_atoms
+                       and all(isinstance(y, (int, np.integer)) for y in x)
+                       for x in values):
+                raise ValueError(errmsg)
+            arr = np.array([[int(y) for y in x] for x in values])
+        arr = arr.astype(np.int32)
+        flip = arr[:, 0] > arr[:, -1]
+        arr[flip] = arr[flip, ::-1]
+
+        return func(self, arr, *args, **kwargs)
     return wrapper
 
 
+def _object_array(values, n):
+    """1d object array of length `n` holding `values` (``None`` if not given)"""
+    arr = np.empty(n, dtype=object)
+    if values is None:
+        return arr
+    if not isinstance(values, (list, tuple, np.ndarray)):
+        values = list(values)
+    try:
+        arr[:] = values
+    except ValueError:
+        # sequences (e.g. tuples of atom types) as values
+        for i, value in enumerate(values):
+            arr[i] = value
+    return arr
+
+
+def _rows_in(rows, other):
+    """Boolean mask of the `rows` that are also rows of `other`"""
+    if len(rows) == 0 or len(other) == 0:
+        return np.zeros(len(rows), dtype=bool)
+    void = np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))
+    return np.isin(np.ascontiguousarray(rows).view(void).ravel(),
+                   np.ascontiguousarray(other).view(void).ravel())
+
+
 class _Connection(AtomAttr):
     """Base class for connectivity between atoms
 
+    The atom indices of all connections are stored in a single integer array
+    of shape ``(n_connections, n_atoms)``, which is indexed by atom through a
+    lazily built compressed sparse row (CSR) table.
+
     .. versionchanged:: 1.0.0
         Added type checking to atom index values.
+    .. versionchanged:: 2.0.0
+        Connections are stored as arrays instead of lists of tuples.
     """
 
     @_check_connection_values
     def __init__(self, values, types=None, guessed=False, order=None):
-        self.values = values
-        if types is None:
-            types = [None] * len(values)
-        self.types = types
-        if guessed in (True, False):
+        n_values = len(values)
+        self._bix = values
+        self._types = _object_array(types, n_values)
+        if np.ndim(guessed) == 0:
             # if single value passed, multiply this across
             # all bonds
-            guessed = [guessed] * len(values)
-        self._guessed = guessed
-        if order is None:
-            order = [None] * len(values)
-        self.order = order
+            self._guessed = np.full(n_values, guessed, dtype=bool)
+        else:
+            self._guessed = np.array(guessed, dtype=bool)
+        self._order = _object_array(order, n_values)
         self._cache = dict()
 
+    @property
+    def values(self):
+        """List of tuples of the atom indices of all connections"""
+        return [tuple(v) for v in self._bix.tolist()]
+
+    @property
+    def types(self):
+        """List of the types of all connections"""
+        return self._types.tolist()
+
+    @property
+    def order(self):
+        """List of the orders of all connections"""
+        return self._order.tolist()
+
+    @property
+    def is_guessed(self):
+        """List of bools of if each connection is a guess"""
+        return self._guessed.tolist()
+
     def copy(self):
         """Return a deepcopy of this attribute"""
-        return self.__class__(copy.copy(self.values),
-                              copy.copy(self.types),
-                              copy.copy(self._guessed),
-                              copy.copy(self.order))
+        return self.__class__(self._bix.copy(),
+                              self._types.copy(),
+                              self._guessed.copy(),
+                              self._order.copy())
 
     def __len__(self):
-        return len(self._bondDict)
+        # number of atoms with at least one connection
+        indptr = self._atom_connections[0]
+        return np.count_nonzero(indptr[1:] - indptr[:-1])
 
     @property
     @cached('bd')
-    def _bondDict(self):
-        """Lazily built mapping of atoms:bonds"""
-        bd = defaultdict(list)
+    def _atom_connections(self):
+        """Lazily built CSR table of the connections of each atom
 
-        for b, t, g, o in zip(self.values, self.types,
-                              self._guessed, self.order):
-            for a in b:
-                bd[a].append((b, t, g, o))
-        return bd
+        The connections of atom ``i`` are
+        ``connections[indptr[i]:indptr[i + 1]]``; one more (empty) row than
+        the largest connected atom index is kept for all other atoms.
+        """
+        ix = self._bix.ravel()
+        n_rows = ix.max() + 2 if len(ix) else 1
+        indptr = np.zeros(n_rows + 1, dtype=np.intp)
+        np.cumsum(np.bincount(ix, minlength=n_rows), out=indptr[1:])
+        connections = np.argsort(ix, kind='stable') // self._n_atoms
+        return indptr, connections.astype(np.int32)
 
     def set_atoms(self, ag):
         return NotImplementedError("Cannot set bond information")
 
     def get_atoms(self, ag):
-        try:
-            unique_bonds = set(itertools.chain(
-                *[self._bondDict[a] for a in ag.ix]))
-        except TypeError:
-            # maybe we got passed an Atom
-            unique_bonds = self._bondDict[ag.ix]
-        bond_idx, types, guessed, order = np.hsplit(
-            np.array(sorted(unique_bonds), dtype=object), 4)
-        bond_idx = np.array(bond_idx.ravel().tolist(), dtype=np.int32)
-        types = types.ravel()
-        guessed = guessed.ravel()
-        order = order.ravel()
-        return TopologyGroup(bond_idx, ag.universe,
+        indptr, connections = self._atom_connections
+        # an Atom has a single index
+        ix = np.minimum(np.atleast_1d(ag.ix), len(indptr) - 2)
+        starts = indptr[ix]
+        counts = indptr[ix + 1] - starts
+        # positions of all connections of all atoms in `connections`
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        positions = offsets + np.arange(len(offsets))
+        if len(positions) < len(self._bix) // 8:
+            # few connections: cheaper to sort them than to mask all of them
+            ix = np.unique(connections[positions])
+        else:
+            ix = np.zeros(len(self._bix), dtype=bool)
+            ix[connections[positions]] = True
+        return TopologyGroup(self._bix[ix], ag.universe,
                              self.singular[:-1],
-                             types,
-                             guessed,
-                             order)
+                             self._types[ix],
+                             self._guessed[ix],
+                             self._order[ix])
 
     @_check_connection_values
     def _add_bonds(self, values, types=None, guessed=True, order=None):
-        if types is None:
-            types = itertools.cycle((None,))
-        if guessed in (True, False):
-            guessed = itertools.cycle((guessed,))
-        if order is None:
-            order = itertools.cycle((None,))
-
-        existing = set(self.values)
-        for v, t, g, o in zip(values, types, guessed, order):
-            if v not in existing:
-                self.values.append(v)
-                self.types.append(t)
-                self._guessed.append(g)
-                self.order.append(o)
-        # kill the old cache of bond Dict
+        n_values = len(values)
+        types = _object_array(types, n_values)
+        if np.ndim(guessed) == 0:
+            guessed = np.full(n_values, guessed, dtype=bool)
+        else:
+            guessed = np.array(guessed, dtype=bool)
+        order = _object_array(order, n_values)
+
+        new = ~_rows_in(values, self._bix)
+        self._bix = np.concatenate([self._bix, values[new]])
+        self._types = np.concatenate([self._types, types[new]])
+        self._guessed = np.concatenate([self._guessed, guessed[new]])
+        self._order = np.concatenate([self._order, order[new]])
+        # kill the old cache of the atom to connection table
         try:
             del self._cache['bd']
         except KeyError:
@@ -2341,25 +2324,18 @@ class _Connection(AtomAttr):
         """
         .. versionadded:: 1.0.0
         """
-
-        to_check = set(values)
-        self_values = set(self.values)
-        if not to_check.issubset(self_values):
-            missing = to_check-self_values
+        found = _rows_in(values, self._bix)
+        if not found.all():
+            missing = set(tuple(v) for v in values[~found].tolist())
             indices = ', '.join(map(str, missing))
             raise ValueError(('Cannot delete nonexistent '
                               '{attrname} with atom indices:'
                               '{indices}').format(attrname=self.attrname,
                                                   indices=indices))
-        idx = [self.values.index(v) for v in to_check]
-        for i in sorted(idx, reverse=True):
-            del self.values[i]
-
-        for attr in ('types', '_guessed', 'order'):
-            arr = np.array(getattr(self, attr), dtype='object')
-            new = np.delete(arr, idx)
-            setattr(self, attr, list(new))
-        # kill the old cache of bond Dict
+        keep = ~_rows_in(self._bix, values)
+        for attr in ('_bix', '_types', '_guessed', '_order'):
+            setattr(self, attr, getattr(self, attr)[keep])
+        # kill the old cache of the atom to connection table
         try:
             del self._cache['bd']
         except KeyError:
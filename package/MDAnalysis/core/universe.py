@@ -112,12 +112,22 @@ def _check_file_like(topology):
     return topology
 
 def _topology_from_file_like(topology_file, topology_format=None,
-                             **kwargs):
+                             topology_cache=None, **kwargs):
     parser = get_parser_for(topology_file, format=topology_format)
 
-    try:
+    def parse():
         with parser(topology_file) as p:
-            topology = p.parse(**kwargs)
+            return p.parse(**kwargs)
+
+    try:
+        if topology_cache is None:
+            topology = parse()
+        else:
+            from ..topology.cache import cached_topology
+            topology = cached_topology(
+                topology_file, parse, topology_cache,
+                parser='{}.{}'.format(parser.__module__, parser.__qualname__),
+                **kwargs)
     except (IOError, OSError) as err:
         # There are 2 kinds of errors that might be raised here:
         # one because the file isn't present
@@ -243,6 +253,11 @@ class Universe(object):
         the file extension. Can also pass a subclass of
         :class:`MDAnalysis.topology.base.TopologyReaderBase` to define a custom
         reader to be used on the topology file.
+    topology_cache: str, ``None``, default ``None``
+        Directory in which the parsed topology is cached. If a snapshot of the
+        same topology file is found there it is loaded instead of parsing the
+        file, otherwise the parsed topology is stored for the next Universe;
+        see :mod:`MDAnalysis.topology.cache`. ``None`` always parses the file.
     format: str, ``None``, default ``None``
         Provide the file format of the coordinate or trajectory file; ``None``
         guesses it from the file extension. Note that this keyword has no
@@ -301,11 +316,12 @@ class Universe(object):
         Universe now can be (un)pickled.
         ``topology`` and ``trajectory`` are reserved
         upon unpickle.
+        Added the `topology_cache` keyword.
     """
     def __init__(self, topology=None, *coordinates, all_coordinates=False,
                  format=None, topology_format=None, transformations=None,
                  guess_bonds=False, vdwradii=None, in_memory=False,
-                 in_memory_step=1, **kwargs):
+                 in_memory_step=1, topology_cache=None, **kwargs):
 
         self._trajectory = None  # managed attribute holding Reader
         self._cache = {}
@@ -322,7 +338,8 @@ class Universe(object):
             'in_memory_step': in_memory_step,
             'format': format,
             'topology_format': topology_format,
-            'all_coordinates': all_coordinates
+            'all_coordinates': all_coordinates,
+            'topology_cache': topology_cache
         }
         self._kwargs.update(kwargs)
 
@@ -333,6 +350,7 @@ class Universe(object):
             self.filename = _check_file_like(topology)
             topology = _topology_from_file_like(self.filename,
                                                 topology_format=topology_format,
+                                                topology_cache=topology_cache,
                                                 **kwargs)
 
         if topology is not None:
@@ -560,7 +578,8 @@ class Universe(object):
         return self
 
     def transfer_to_memory(self, start=None, stop=None, step=None,
-                           verbose=False):
+                           verbose=False, cache_file=None,
+                           compression=None):
         """Transfer the trajectory to in memory representation.
 
         Replaces the current trajectory reader object with one of type
@@ -578,45 +597,136 @@ class Universe(object):
         verbose: bool, optional
             Will print the progress of loading trajectory to memory, if
             set to True. Default value is False.
+        cache_file: str, optional
+            keep the coordinates in this ``.npy`` file, memory mapped, instead
+            of in memory (see :ref:`out-of-core-memory-label`); velocities and
+            forces go into files next to it with ``_velocities`` and
+            ``_forces`` appended to the name. Existing files are overwritten.
+        compression: {'xtc', 'zlib'}, optional
+            keep the coordinates in memory in compressed chunks of frames
+            with a :class:`~MDAnalysis.coordinates.memory.CompressedMemoryReader`
+            (see :ref:`compressed-memory-label`); ``'xtc'`` keeps positions to
+            0.001 Å, ``'zlib'`` is lossless. Velocities and forces are always
+            stored losslessly. Can not be combined with `cache_file`.
 
 
         .. versionadded:: 0.16.0
+        .. versionchanged:: 2.0.0
+           Trajectories without velocities and forces are read with
+           :meth:`~MDAnalysis.coordinates.base.ProtoReader.read_block`
+           unless `verbose` is set.
+        .. versionchanged:: 2.0.0
+           Added the `cache_file` and `compression` keywords
         """
-        from ..coordinates.memory import MemoryReader
-
-        if not isinstance(self.trajectory, MemoryReader):
-            n_frames = len(range(
-                *self.trajectory.check_slice_indices(start, stop, step)
-            ))
+        from ..coordinates.memory import (MemoryReader, _open_cache,
+                                          _CACHE_BLOCK_BYTES,
+                                          _CompressedArray,
+                                          CompressedMemoryReader)
+
+        if cache_file is not None and compression is not None:
+            raise ValueError("cache_file and compression can not be "
+                             "combined")
+
+        if not isinstance(self.trajectory,
+                          (MemoryReader, CompressedMemoryReader)):
+            frames = range(
+                *self.trajectory.check_slice_indices(start, stop, step))
+            n_frames = len(frames)
             n_atoms = len(self.atoms)
-            coordinates = np.zeros((n_frames, n_atoms, 3), dtype=np.float32)
             ts = self.trajectory.ts
             has_vels = ts.has_velocities
             has_fors = ts.has_forces
             has_dims = ts.dimensions is not None
 
-            velocities = np.zeros_like(coordinates) if has_vels else None
-            forces = np.zeros_like(coordinates) if has_fors else None
-            dimensions = (np.zeros((n_frames, 6), dtype=np.float32)
-                          if has_dims else None)
-
-            for i, ts in enumerate(ProgressBar(self.trajectory[start:stop:step],
-                                               verbose=verbose,
-                                               desc="Loading frames")):
-                np.copyto(coordinates[i], ts.positions)
-                if has_vels:
-                    np.copyto(velocities[i], ts.velocities)
-                if has_fors:
-                    np.copyto(forces[i], ts.forces)
-                if has_dims:
-                    np.copyto(dimensions[i], ts.dimensions)
+            shape = (n_frames, n_atoms, 3)
+            if compression is not None:
+                # frames are read and compressed one chunk at a time
+                coordinates = _CompressedArray(n_atoms, compression)
+                # velocities and forces are kept losslessly
+                velocities = (_CompressedArray(n_atoms, 'zlib')
+                              if has_vels else None)
+                forces = (_CompressedArray(n_atoms, 'zlib')
+                          if has_fors else None)
+                block = coordinates.chunk_size
+            elif cache_file is not None:
+                coordinates = _open_cache(cache_file, shape)
+                velocities = (_open_cache(cache_file, shape, '_velocities')
+                              if has_vels else None)
+                forces = (_open_cache(cache_file, shape, '_forces')
+                          if has_fors else None)
+                block = max(1, _CACHE_BLOCK_BYTES // (12 * max(n_atoms, 1)))
+            else:
+                block = None
+
+            if not (has_vels or has_fors or verbose):
+                if block is None:
+                    # only positions and boxes: read them as one block
+                    coordinates, dimensions = self.trajectory.read_block(
+                        start, stop, step)
+                else:
+                    # read a few blocks into the file or the chunks
+                    dimensions = np.zeros((n_frames, 6), dtype=np.float32)
+                    for i in range(0, n_frames, block):
+                        part = frames[i:i + block]
+                        out = (None if compression is not None
+                               else coordinates[i:i + len(part)])
+                        # a reversed range may end before the first frame
+                        positions, dimensions[i:i + len(part)] = \
+                            self.trajectory.read_block(
+                                part.start,
+                                part.stop if part.stop >= 0 else None,
+                                part.step, out=out)
+                        if compression is not None:
+                            coordinates.append(positions)
+                if not has_dims:
+                    dimensions = None
+                velocities = forces = None
+            else:
+                if block is None:
+                    coordinates = np.zeros(shape, dtype=np.float32)
+                    velocities = (np.zeros_like(coordinates) if has_vels
+                                  else None)
+                    forces = np.zeros_like(coordinates) if has_fors else None
+                dimensions = (np.zeros((n_frames, 6), dtype=np.float32)
+                              if has_dims else None)
+                if compression is not None:
+                    # frames of the current chunk
+                    buffers = [np.zeros((block, n_atoms, 3), dtype=np.float32)
+                               if array is not None else None for array in
+                               (coordinates, velocities, forces)]
+                else:
+                    buffers = [coordinates, velocities, forces]
+
+                for i, ts in enumerate(ProgressBar(
+                        self.trajectory[start:stop:step],
+                        verbose=verbose, desc="Loading frames")):
+                    k = i if compression is None else i % block
+                    np.copyto(buffers[0][k], ts.positions)
+                    if has_vels:
+                        np.copyto(buffers[1][k], ts.velocities)
+                    if has_fors:
+                        np.copyto(buffers[2][k], ts.forces)
+                    if has_dims:
+                        np.copyto(dimensions[i], ts.dimensions)
+                    if compression is not None and (k == block - 1 or
+                                                    i == n_frames - 1):
+                        for array, buf in zip(
+                                (coordinates, velocities, forces), buffers):
+                            if array is not None:
+                                array.append(buf[:k + 1])
+
+            for array in (coordinates, velocities, forces):
+                if isinstance(array, np.memmap):
+                    array.flush()
 
             # Overwrite trajectory in universe with an MemoryReader
             # object, to provide fast access and allow coordinates
             # to be manipulated
             if step is None:
                 step = 1
-            self.trajectory = MemoryReader(
+            reader = (MemoryReader if compression is None
+                      else CompressedMemoryReader)
+            self.trajectory = reader(
                 coordinates,
                 dimensions=dimensions,
                 dt=self.trajectory.ts.dt * step,
@@ -32,11 +32,13 @@ from MDAnalysis import NoDataError
 from libcpp.set cimport set as cset
 from libcpp.map cimport map as cmap
 from libcpp.vector cimport vector
+from libcpp.algorithm cimport sort
 from cython.operator cimport dereference as deref
 
 
 __all__ = ['unique_int_1d', 'make_whole', 'find_fragments',
-           '_sarrus_det_single', '_sarrus_det_multiple']
+           '_sarrus_det_single', '_sarrus_det_multiple',
+           '_unwrap_order', '_make_whole_ordered']
 
 cdef extern from "calc_distances.h":
     ctypedef float coordinate[3]
@@ -313,6 +315,199 @@ def make_whole(atomgroup, reference_atom=None, inplace=True):
     return np.array(newpos)
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _unwrap_order(compounds, bonds):
+    """Order in which :func:`_make_whole_ordered` places the atoms of several
+    compounds.
+
+    Each compound is traversed breadth-first along its bonds, starting from
+    its first atom, in the same order as :func:`make_whole` does for a single
+    compound.
+
+    Parameters
+    ----------
+    compounds : numpy.ndarray
+        1D array of the compound (any integer label) of each atom
+    bonds : numpy.ndarray
+        2D array of bonds, as pairs of indices into `compounds`. Bonds between
+        different compounds are ignored.
+
+    Returns
+    -------
+    order : numpy.ndarray
+        indices of the atoms; the first atom of each compound comes first,
+        followed by the other atoms of the compound in traversal order
+    parents : numpy.ndarray
+        index of the atom each atom is placed relative to, ``-1`` for the
+        first atom of each compound and ``-2`` for atoms that can't be reached
+        from it along bonds (the compound is not contiguous)
+
+
+    .. versionadded:: 2.0.0
+    """
+    cdef np.intp_t[::1] labels, by_compound, neighbors, indptr
+    cdef np.intp_t[::1] order_view, parents_view
+    cdef np.uint8_t[::1] visited
+    cdef vector[np.intp_t] level, next_level
+    cdef np.intp_t n, i, j, k, m, root, atom, other, label
+
+    compounds = np.ascontiguousarray(compounds, dtype=np.intp)
+    n = compounds.shape[0]
+    order = np.empty(n, dtype=np.intp)
+    parents = np.full(n, -1, dtype=np.intp)
+    if n == 0:
+        return order, parents
+
+    # adjacency of the bonds within each compound, sorted neighbors per atom
+    bonds = np.asarray(bonds, dtype=np.intp).reshape(-1, 2)
+    bonds = bonds[(compounds[bonds[:, 0]] == compounds[bonds[:, 1]]) &
+                  (bonds[:, 0] != bonds[:, 1])]
+    src = np.concatenate([bonds[:, 0], bonds[:, 1]])
+    dst = np.concatenate([bonds[:, 1], bonds[:, 0]])
+    sorted_idx = np.lexsort((dst, src))
+    neighbors = np.ascontiguousarray(dst[sorted_idx])
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(src, minlength=n))]
+                            ).astype(np.intp)
+
+    labels = compounds
+    # atoms grouped by compound, in their order within each compound
+    by_compound = np.argsort(compounds, kind='stable')
+    visited = np.zeros(n, dtype=np.uint8)
+    order_view = order
+    parents_view = parents
+
+    k = 0
+    label = -1
+    for m in range(n):
+        root = by_compound[m]
+        if visited[root]:
+            continue
+        if m > 0 and labels[root] == label:
+            # not reachable from the first atom of the compound
+            parents_view[root] = -2
+        label = labels[root]
+        visited[root] = 1
+        order_view[k] = root
+        k += 1
+        # level by level, each level in increasing order, like make_whole
+        level.clear()
+        level.push_back(root)
+        while not level.empty():
+            next_level.clear()
+            for i in range(<np.intp_t> level.size()):
+                atom = level[i]
+                for j in range(indptr[atom], indptr[atom + 1]):
+                    other = neighbors[j]
+                    if not visited[other]:
+                        visited[other] = 1
+                        parents_view[other] = atom
+                        next_level.push_back(other)
+            sort(next_level.begin(), next_level.end())
+            for i in range(<np.intp_t> next_level.size()):
+                order_view[k] = next_level[i]
+                k += 1
+            level.swap(next_level)
+
+    return order, parents
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _make_whole_ordered(float[:, ::1] positions, np.intp_t[::1] order,
+                        np.intp_t[::1] parents, box):
+    """Make several compounds whole in place, following the traversal order
+    computed by :func:`_unwrap_order`.
+
+    Every atom is moved to the periodic image closest to the atom it is
+    placed relative to. As in :func:`make_whole`, compounds which fit within
+    half an orthorhombic box around their first atom are left untouched.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        ``(n, 3)`` float32 coordinates, modified in place
+    order : numpy.ndarray
+        traversal order of the atoms
+    parents : numpy.ndarray
+        index of the atom each atom is placed relative to, ``-1`` for the
+        first atom of each compound
+    box : numpy.ndarray
+        unit cell dimensions ``[lx, ly, lz, alpha, beta, gamma]``, none of the
+        lengths may be zero
+
+    Raises
+    ------
+    ValueError
+        If a compound that has to be made whole is not contiguous.
+
+
+    .. versionadded:: 2.0.0
+    """
+    cdef np.intp_t n, i, j, k, start, atom, parent, root
+    cdef bint ortho, is_unwrapped
+    cdef float[:] box_view
+    cdef float[:, :] tri_box
+    cdef float half_box[3]
+    cdef float inverse_box[3]
+    cdef double vec[3]
+
+    box_view = np.asarray(box, dtype=np.float32)
+    ortho = True
+    for i in range(3, 6):
+        if box_view[i] != 90.0:
+            ortho = False
+    if ortho:
+        for i in range(3):
+            half_box[i] = 0.5 * box_view[i]
+            inverse_box[i] = 1.0 / box_view[i]
+    else:
+        from .mdamath import triclinic_vectors
+        tri_box = triclinic_vectors(box_view)
+
+    n = order.shape[0]
+    k = 0
+    while k < n:
+        # the compound starting at order[k]
+        start = k
+        root = order[k]
+        k += 1
+        while k < n and parents[order[k]] != -1:
+            k += 1
+
+        if ortho:
+            # If the compound is already unwrapped, leave it alone
+            is_unwrapped = True
+            for i in range(start + 1, k):
+                atom = order[i]
+                for j in range(3):
+                    if fabs(positions[atom, j] - positions[root, j]) >= half_box[j]:
+                        is_unwrapped = False
+                        break
+                if not is_unwrapped:
+                    break
+            if is_unwrapped:
+                continue
+
+        for i in range(start + 1, k):
+            atom = order[i]
+            parent = parents[atom]
+            if parent < 0:
+                raise ValueError("AtomGroup was not contiguous from bonds, "
+                                 "process failed")
+            # Draw vector from parent to atom
+            for j in range(3):
+                vec[j] = positions[atom, j] - positions[parent, j]
+            # Apply periodic boundary conditions to this vector
+            if ortho:
+                minimum_image(&vec[0], &box_view[0], &inverse_box[0])
+            else:
+                minimum_image_triclinic(&vec[0], &tri_box[0, 0])
+            # Then define position of atom based on this vector
+            for j in range(3):
+                positions[atom, j] = positions[parent, j] + vec[j]
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef float _dot(float * a, float * b):
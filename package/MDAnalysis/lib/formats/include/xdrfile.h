@@ -550,6 +550,32 @@ extern "C"
 								   XDRFILE *   xfp);
 
 
+	/*! \brief Decompress only the first coordinates of a frame
+	 *
+	 *  Like xdrfile_decompress_coord_float(), but decoding stops once
+	 *  \a ndecode coordinate triplets have been decompressed; the file is
+	 *  still positioned after the compressed data of the frame.  A few
+	 *  coordinates after the first \a ndecode may be written as well, so
+	 *  \a ptr must have room for all coordinates of the frame.
+	 *
+	 *  \param ptr       Pointer to coordinates to decompress (output)
+	 *  \param ncoord    Max number of coordinate triplets to read on input,
+	 *                   actual number of coordinates in the frame on output.
+	 *  \param precision The precision used in the compression (output)
+	 *  \param ndecode   Number of coordinate triplets to decompress; a
+	 *                   negative value decompresses all of them.
+	 *  \param xfp       Handle to portable binary file
+	 *
+	 *  \return          Same as xdrfile_decompress_coord_float()
+	 */
+	int
+	xdrfile_decompress_coord_float_partial(float *     ptr,
+										   int *	   ncoord,
+										   float *     precision,
+										   int         ndecode,
+										   XDRFILE *   xfp);
+
+
 
 
 	/*! \brief Compress coordiates in a double array to XDR file
@@ -53,6 +53,11 @@ extern int read_xtc_natoms(char *fn, int *natoms);
 extern int read_xtc(XDRFILE * xd, int natoms, int *step, float *time,
                     matrix box, rvec *x, float *prec);
 
+/* Read one frame of an open xtc file, decompressing only the positions of
+ * the first ndecode atoms; x must still have room for natoms atoms */
+extern int read_xtc_partial(XDRFILE * xd, int natoms, int ndecode, int *step,
+                            float *time, matrix box, rvec *x, float *prec);
+
 /* Write a frame to xtc file */
 extern int write_xtc(XDRFILE * xd, int natoms, int step, float time,
                        matrix box, rvec *x, float prec);
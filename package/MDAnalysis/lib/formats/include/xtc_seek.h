@@ -27,6 +27,15 @@ extern "C" {
 extern int read_xtc_n_frames(char *fn, int *n_frames, int *est_nframes,
                              int64_t **offsets);
 
+/* Index the frames starting in the byte range [start, stop) of a trajectory
+ * of natoms (>= 10) atoms. The first frame is found by looking for a frame
+ * header; next is set to the offset of the first frame after the range (the
+ * file size at the end of the file). Ranges can be scanned concurrently. */
+extern int read_xtc_range_offsets(char *fn, int natoms, int64_t start,
+                                  int64_t stop, int *n_frames,
+                                  int *est_nframes, int64_t **offsets,
+                                  int64_t *next);
+
 /* XTC header fields until coord floats: *** only for trajectories of less than
  * 10 atoms! ***  */
 /* magic natoms step time DIM*DIM_box_vecs natoms */
@@ -38,6 +47,12 @@ extern int read_xtc_n_frames(char *fn, int *n_frames, int *est_nframes,
 /* magic natoms step time DIM*DIM_box_vecs natoms prec DIM_min_xyz DIM_max_xyz
  * smallidx */
 #define XTC_HEADER_SIZE (DIM * DIM * 4 + DIM * 2 + 46)
+/* Magic number at the start of every XTC frame */
+#define XTC_MAGIC 1995
+/* Position (in 32-bit integers) of the second natoms field of the header */
+#define XTC_NATOMS2_INT (4 + DIM * DIM)
+/* Integers read at a time while looking for a frame header */
+#define XTC_SCAN_INTS 65536
 
 #ifdef __cplusplus
 }
@@ -693,7 +693,9 @@ cdef class DCDFile:
             raise ValueError("unkown order '{}'".format(order))
 
         cdef np.ndarray[FLOAT_T, ndim=3] xyz = np.empty(shape, dtype=FLOAT)
+        # same unitcell as read() for frames that do not store one
         cdef np.ndarray[DOUBLE_T, ndim=2] box = np.empty((n, 6))
+        box[:] = [0.0, 90.0, 0.0, 90.0, 90.0, 0.0]
 
 
         cdef np.ndarray xyz_tmp = np.empty((self.natoms, self.ndims), dtype=FLOAT, order='F')
@@ -83,7 +83,10 @@ cdef extern from 'include/xdrfile.h':
 cdef extern from 'include/xdrfile_xtc.h':
     int read_xtc_natoms(char * fname, int * natoms)
     int read_xtc(XDRFILE * xfp, int natoms, int * step, float * time, matrix box,
-                 rvec * x, float * prec)
+                 rvec * x, float * prec) nogil
+    int read_xtc_partial(XDRFILE * xd, int natoms, int ndecode, int * step,
+                         float * time, matrix box, rvec * x,
+                         float * prec) nogil
     int write_xtc(XDRFILE * xfp, int natoms, int step, float time, matrix box,
                   rvec * x, float prec)
 
@@ -92,13 +95,16 @@ cdef extern from 'include/xdrfile_xtc.h':
 cdef extern from 'include/xdrfile_trr.h':
     int read_trr_natoms(char *fname, int *natoms)
     int read_trr(XDRFILE *xfp, int natoms, int *step, float *time, float *_lambda,
-                 matrix box, rvec *x, rvec *v, rvec *f, int *has_prop)
+                 matrix box, rvec *x, rvec *v, rvec *f, int *has_prop) nogil
     int write_trr(XDRFILE *xfp, int natoms, int step, float time, float _lambda,
                   matrix box, rvec *x, rvec *v, rvec *f)
 
 
 cdef extern from 'include/xtc_seek.h':
     int read_xtc_n_frames(char *fn, int *n_frames, int *est_nframes, int64_t **offsets)
+    int read_xtc_range_offsets(char *fn, int natoms, int64_t start, int64_t stop,
+                               int *n_frames, int *est_nframes, int64_t **offsets,
+                               int64_t *next) nogil
 
 
 cdef extern from 'include/trr_seek.h':
@@ -127,8 +133,9 @@ error_message = ['OK', 'header', 'string', 'double', 'integer',
 
 import cython
 import numpy as np
-from os.path import exists
+from os.path import exists, getsize
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 np.import_array()
 
@@ -425,6 +432,24 @@ cdef class _XDRFile:
         """Low-level call to xdr_tell to get current byte offset."""
         return xdr_tell(self.xfp)
 
+    def _check_read_frames(self, n_frames, xyz, box, indices):
+        """check the state of the file and the output buffers of
+        :meth:`read_frames`"""
+        if not self.is_open:
+            raise IOError('No file opened')
+        if self.mode != 'r':
+            raise IOError('File opened in mode: {}. Reading only allow '
+                               'in mode "r"'.format(self.mode))
+        n_atoms = self.n_atoms if indices is None else len(indices)
+        if (xyz.shape != (n_frames, n_atoms, DIMS) or xyz.dtype != DTYPE
+            or not xyz.flags['C_CONTIGUOUS']):
+            raise ValueError('xyz must be a C-contiguous float32 array of '
+                             'shape {}'.format((n_frames, n_atoms, DIMS)))
+        if (box.shape != (n_frames, DIMS, DIMS) or box.dtype != DTYPE
+            or not box.flags['C_CONTIGUOUS']):
+            raise ValueError('box must be a C-contiguous float32 array of '
+                             'shape {}'.format((n_frames, DIMS, DIMS)))
+
 
 TRRFrame = namedtuple('TRRFrame', 'x v f box step time lmbda hasx hasv hasf')
 
@@ -520,12 +545,20 @@ cdef class TRRFile(_XDRFile):
         cdef np.ndarray forces = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
         cdef np.ndarray box = np.empty((DIMS, DIMS), dtype=DTYPE)
 
-        return_code = read_trr(self.xfp, self.n_atoms, <int*> &step,
-                                      &time, &lmbda, <matrix>box.data,
-                                      <rvec*>xyz.data,
-                                      <rvec*>velocity.data,
-                                      <rvec*>forces.data,
-                                      <int*> &has_prop)
+        cdef XDRFILE *xfp = self.xfp
+        cdef int n_atoms = self.n_atoms
+        cdef float *box_ptr = <float*> box.data
+        cdef rvec *xyz_ptr = <rvec*> xyz.data
+        cdef rvec *velocity_ptr = <rvec*> velocity.data
+        cdef rvec *forces_ptr = <rvec*> forces.data
+
+        # release the GIL while decoding so that other threads (e.g. the
+        # analysis of the previous frame) can run concurrently
+        with nogil:
+            return_code = read_trr(xfp, n_atoms, <int*> &step,
+                                   &time, &lmbda, <matrix>box_ptr,
+                                   xyz_ptr, velocity_ptr, forces_ptr,
+                                   <int*> &has_prop)
         # trr are a bit weird. Reading after the last frame always always
         # results in an integer error while reading. I tried it also with trr
         # produced by different codes (Gromacs, ...).
@@ -550,6 +583,82 @@ cdef class TRRFile(_XDRFile):
         return TRRFrame(xyz, velocity, forces, box, step, time, lmbda,
                         has_x, has_v, has_f)
 
+    def read_frames(self, frames, np.ndarray xyz, np.ndarray box,
+                    indices=None):
+        """read_frames(frames, xyz, box, indices=None)
+
+        Read the positions and boxes of several frames into preallocated
+        arrays.
+
+        The frames are decoded straight into `xyz` without creating a
+        :class:`TRRFrame` for each of them. Consecutive frames are read
+        without seeking.
+
+        Parameters
+        ----------
+        frames : array_like
+            indices of the frames to read
+        xyz : numpy.ndarray
+            C-contiguous float32 array of shape ``(len(frames), n, 3)`` that
+            the positions are written to; ``n`` is either `n_atoms` or the
+            number of `indices`
+        box : numpy.ndarray
+            C-contiguous float32 array of shape ``(len(frames), 3, 3)`` that
+            the box vectors are written to
+        indices : array_like (optional)
+            only store the positions of these atoms
+
+        Raises
+        ------
+        IOError
+        ValueError
+            if `xyz` or `box` do not have the right shape or type
+
+
+        .. versionadded:: 2.0.0
+        """
+        cdef np.int64_t[::1] c_frames = np.ascontiguousarray(frames,
+                                                             dtype=np.int64)
+        cdef Py_ssize_t i
+        cdef int n_frames = c_frames.shape[0]
+        self._check_read_frames(n_frames, xyz, box, indices)
+        if indices is not None:
+            indices = np.asarray(indices, dtype=np.intp)
+
+        return_code = 1
+        cdef int step = 0
+        cdef float time = 0
+        cdef float lmbda = 0
+        cdef int has_prop = 0
+        cdef np.ndarray buffer = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
+
+        cdef XDRFILE *xfp = self.xfp
+        cdef int n_atoms = self.n_atoms
+        cdef float *box_ptr
+        cdef rvec *xyz_ptr = <rvec*> buffer.data
+
+        for i in range(n_frames):
+            if c_frames[i] != self.current_frame:
+                self.seek(c_frames[i])
+            box_ptr = <float*> box.data + i * DIMS * DIMS
+            if indices is None:
+                xyz_ptr = <rvec*> xyz.data + i * n_atoms
+            # velocities and forces are skipped by passing NULL
+            with nogil:
+                return_code = read_trr(xfp, n_atoms, <int*> &step,
+                                       &time, &lmbda, <matrix>box_ptr,
+                                       xyz_ptr, NULL, NULL,
+                                       <int*> &has_prop)
+            if return_code != EOK:
+                raise IOError('TRR read error = {}'.format(
+                    error_message[return_code]))
+            self.current_frame += 1
+            if not has_prop & HASX:
+                raise IOError('TRR frame {} has no positions'.format(
+                    c_frames[i]))
+            if indices is not None:
+                xyz[i] = buffer[indices]
+
     def write(self, xyz, velocity, forces, box, int step, float time,
               float _lambda, int natoms):
         """write one frame into TRR file.
@@ -680,10 +789,35 @@ cdef class XTCFile(_XDRFile):
         return return_code, n_atoms
 
 
-    def calc_offsets(self):
-        """Calculate offsets from XTC file directly"""
+    def calc_offsets(self, n_threads=1):
+        """calc_offsets(n_threads=1)
+
+        Calculate offsets from XTC file directly
+
+        Parameters
+        ----------
+        n_threads : int (optional)
+            number of threads scanning the file. With more than one thread the
+            file is split into byte ranges; each thread looks for the first
+            frame header in its range and indexes the frames from there on.
+            The results are checked to join up and the file is scanned
+            sequentially if they do not.
+
+        Returns
+        -------
+        offsets : numpy.ndarray
+            byte offset of every frame
+
+
+        .. versionchanged:: 2.0.0
+           Added the `n_threads` keyword
+        """
         if not self.is_open:
             return np.array([])
+        if n_threads > 1 and self.n_atoms >= 10:
+            parallel_offsets = self._calc_offsets_parallel(n_threads)
+            if parallel_offsets is not None:
+                return parallel_offsets
         cdef int n_frames = 0
         cdef int est_nframes = 0
         cdef int64_t* offsets = NULL
@@ -700,13 +834,67 @@ cdef class XTCFile(_XDRFile):
         cdef np.ndarray nd_offsets = ptr_to_ndarray(<void*> offsets, dims, np.NPY_INT64)
         return nd_offsets[:n_frames]
 
-    def read(self):
-        """Read next frame in the XTC file
+    def _calc_offsets_range(self, int64_t start, int64_t stop):
+        """offsets of the frames starting in the byte range [start, stop) and
+        of the first frame after it"""
+        cdef int n_frames = 0
+        cdef int est_nframes = 0
+        cdef int64_t* offsets = NULL
+        cdef int64_t next_offset = 0
+        cdef int natoms = self.n_atoms
+        cdef bytes fname = self.fname
+        cdef char* c_fname = fname
+        cdef int ok
+        with nogil:
+            ok = read_xtc_range_offsets(c_fname, natoms, start, stop,
+                                        &n_frames, &est_nframes, &offsets,
+                                        &next_offset)
+        if ok != EOK:
+            raise IOError("XTC couldn't calculate offsets. "
+                          "XDR error = {}".format(error_message[ok]))
+        if offsets == NULL:
+            return np.array([], dtype=np.int64), next_offset
+        cdef np.ndarray dims = np.array([est_nframes], dtype=np.int64)
+        cdef np.ndarray nd_offsets = ptr_to_ndarray(<void*> offsets, dims, np.NPY_INT64)
+        return nd_offsets[:n_frames], next_offset
+
+    def _calc_offsets_parallel(self, n_threads):
+        """scan byte ranges of the file concurrently, ``None`` if the ranges
+        don't join up"""
+        size = getsize(self.fname)
+        bounds = [(size * i // n_threads) & ~3 for i in range(n_threads)]
+        bounds.append(size)
+        ranges = list(zip(bounds[:-1], bounds[1:]))
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            results = list(executor.map(lambda r: self._calc_offsets_range(*r),
+                                        ranges))
+        # each range continues where the previous one said the next frame is
+        expected = 0
+        for (start, stop), (offsets, next_offset) in zip(ranges, results):
+            if len(offsets):
+                if offsets[0] != expected:
+                    return None
+                expected = next_offset
+            elif expected < stop:
+                return None
+        return np.concatenate([offsets for offsets, _ in results])
+
+    def read(self, n_decode=None):
+        """read(n_decode=None)
+
+        Read next frame in the XTC file
+
+        Parameters
+        ----------
+        n_decode : int (optional)
+            only decompress the positions of the first `n_decode` atoms; the
+            rest of the compressed frame is skipped
 
         Returns
         -------
         frame : libmdaxdr.XTCFrame
-            namedtuple with frame information
+            namedtuple with frame information; `x` has `n_decode` rows if
+            `n_decode` is given
 
         See Also
         --------
@@ -732,9 +920,19 @@ cdef class XTCFile(_XDRFile):
         cdef np.ndarray xyz = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
         cdef np.ndarray box = np.empty((DIMS, DIMS), dtype=DTYPE)
 
-        return_code = read_xtc(self.xfp, self.n_atoms, <int*> &step,
-                                      &time, <matrix>box.data,
-                                      <rvec*>xyz.data, <float*> &prec)
+        cdef XDRFILE *xfp = self.xfp
+        cdef int n_atoms = self.n_atoms
+        cdef int c_n_decode = -1 if n_decode is None else n_decode
+        cdef float *box_ptr = <float*> box.data
+        cdef rvec *xyz_ptr = <rvec*> xyz.data
+
+        # release the GIL while decompressing so that other threads (e.g. the
+        # analysis of the previous frame) can run concurrently
+        with nogil:
+            return_code = read_xtc_partial(xfp, n_atoms, c_n_decode,
+                                           <int*> &step, &time,
+                                           <matrix>box_ptr, xyz_ptr,
+                                           <float*> &prec)
         if return_code != EOK and return_code != EENDOFFILE:
             raise IOError('XTC read error = {}'.format(
                 error_message[return_code]))
@@ -745,8 +943,85 @@ cdef class XTCFile(_XDRFile):
 
         if return_code == EOK:
             self.current_frame += 1
+        if n_decode is not None:
+            xyz = xyz[:n_decode]
         return XTCFrame(xyz, box, step, time, prec)
 
+    def read_frames(self, frames, np.ndarray xyz, np.ndarray box,
+                    indices=None):
+        """read_frames(frames, xyz, box, indices=None)
+
+        Read the positions and boxes of several frames into preallocated
+        arrays.
+
+        The frames are decoded straight into `xyz` without creating a
+        :class:`XTCFrame` for each of them. Consecutive frames are read
+        without seeking.
+
+        Parameters
+        ----------
+        frames : array_like
+            indices of the frames to read
+        xyz : numpy.ndarray
+            C-contiguous float32 array of shape ``(len(frames), n, 3)`` that
+            the positions are written to; ``n`` is either `n_atoms` or the
+            number of `indices`
+        box : numpy.ndarray
+            C-contiguous float32 array of shape ``(len(frames), 3, 3)`` that
+            the box vectors are written to
+        indices : array_like (optional)
+            only store the positions of these atoms
+
+        Raises
+        ------
+        IOError
+        ValueError
+            if `xyz` or `box` do not have the right shape or type
+
+
+        .. versionadded:: 2.0.0
+        """
+        cdef np.int64_t[::1] c_frames = np.ascontiguousarray(frames,
+                                                             dtype=np.int64)
+        cdef Py_ssize_t i
+        cdef int n_frames = c_frames.shape[0]
+        self._check_read_frames(n_frames, xyz, box, indices)
+        if indices is not None:
+            indices = np.asarray(indices, dtype=np.intp)
+
+        return_code = 1
+        cdef int step = 0
+        cdef float time = 0
+        cdef float prec = 0
+        cdef np.ndarray buffer = np.empty((self.n_atoms, DIMS), dtype=DTYPE)
+
+        cdef XDRFILE *xfp = self.xfp
+        cdef int n_atoms = self.n_atoms
+        # atoms after the last requested one need not be decompressed
+        cdef int n_decode = -1
+        if indices is not None and len(indices) > 0:
+            n_decode = indices.max() + 1
+        cdef float *box_ptr
+        cdef rvec *xyz_ptr = <rvec*> buffer.data
+
+        for i in range(n_frames):
+            if c_frames[i] != self.current_frame:
+                self.seek(c_frames[i])
+            box_ptr = <float*> box.data + i * DIMS * DIMS
+            if indices is None:
+                xyz_ptr = <rvec*> xyz.data + i * n_atoms
+            with nogil:
+                return_code = read_xtc_partial(xfp, n_atoms, n_decode,
+                                               <int*> &step, &time,
+                                               <matrix>box_ptr, xyz_ptr,
+                                               <float*> &prec)
+            if return_code != EOK:
+                raise IOError('XTC read error = {}'.format(
+                    error_message[return_code]))
+            self.current_frame += 1
+            if indices is not None:
+                xyz[i] = buffer[indices]
+
     def write(self, xyz, box, int step, float time, float precision=1000):
         """write one frame to the XTC file
 
@@ -786,6 +786,17 @@ xdrfile_decompress_coord_float(float     *ptr,
 							   int       *size,
 							   float     *precision,
 							   XDRFILE*   xfp)
+{
+	return xdrfile_decompress_coord_float_partial(ptr, size, precision, -1,
+												  xfp);
+}
+
+int
+xdrfile_decompress_coord_float_partial(float     *ptr,
+									   int       *size,
+									   float     *precision,
+									   int        ndecode,
+									   XDRFILE*   xfp)
 {
 	int minint[3], maxint[3], *lip;
 	int smallidx, minidx, maxidx;
@@ -882,12 +893,18 @@ xdrfile_decompress_coord_float(float     *ptr,
 		return 0;
 	buf2[0] = buf2[1] = buf2[2] = 0;
 
+	/* the compressed data of the whole frame has been read, so decoding can
+	 * stop early without losing the position in the file
+	 */
+	if (ndecode < 0 || ndecode > lsize)
+		ndecode = lsize;
+
 	lfp = ptr;
 	inv_precision = 1.0 / * precision;
 	run = 0;
 	i = 0;
 	lip = buf1;
-	while ( i < lsize )
+	while ( i < ndecode )
     {
 		thiscoord = (int *)(lip) + i * 3;
 
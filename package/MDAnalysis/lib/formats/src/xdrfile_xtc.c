@@ -61,7 +61,7 @@ int xtc_header(XDRFILE *xd, int *natoms, int *step, float *time,
 }
 
 static int xtc_coord(XDRFILE *xd, int *natoms, matrix box, rvec *x, float *prec,
-                     mybool bRead) {
+                     int ndecode, mybool bRead) {
   int result;
 
   /* box */
@@ -70,7 +70,8 @@ static int xtc_coord(XDRFILE *xd, int *natoms, matrix box, rvec *x, float *prec,
     return exdrFLOAT;
   else {
     if (bRead) {
-      result = xdrfile_decompress_coord_float(x[0], natoms, prec, xd);
+      result = xdrfile_decompress_coord_float_partial(x[0], natoms, prec,
+                                                      ndecode, xd);
       if (result != *natoms)
         return exdr3DX;
     } else {
@@ -105,7 +106,22 @@ int read_xtc(XDRFILE *xd, int natoms, int *step, float *time, matrix box,
   if ((result = xtc_header(xd, &natoms, step, time, TRUE)) != exdrOK)
     return result;
 
-  if ((result = xtc_coord(xd, &natoms, box, x, prec, 1)) != exdrOK)
+  if ((result = xtc_coord(xd, &natoms, box, x, prec, -1, 1)) != exdrOK)
+    return result;
+
+  return exdrOK;
+}
+
+int read_xtc_partial(XDRFILE *xd, int natoms, int ndecode, int *step,
+                     float *time, matrix box, rvec *x, float *prec)
+/* Read subsequent frames, decompressing only the first ndecode atoms */
+{
+  int result;
+
+  if ((result = xtc_header(xd, &natoms, step, time, TRUE)) != exdrOK)
+    return result;
+
+  if ((result = xtc_coord(xd, &natoms, box, x, prec, ndecode, 1)) != exdrOK)
     return result;
 
   return exdrOK;
@@ -121,7 +137,7 @@ int write_xtc(XDRFILE *xd, int natoms, int step, float time, matrix box,
   if ((result = xtc_header(xd, &natoms, &step, &time, FALSE)) != exdrOK)
     return result;
 
-  if ((result = xtc_coord(xd, &natoms, box, x, &prec, 0)) != exdrOK)
+  if ((result = xtc_coord(xd, &natoms, box, x, &prec, -1, 0)) != exdrOK)
     return result;
 
   return exdrOK;
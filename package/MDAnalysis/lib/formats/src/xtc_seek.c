@@ -125,3 +125,130 @@ int read_xtc_n_frames(char *fn, int *n_frames, int *est_nframes,
     return exdrOK;
   }
 }
+
+/* Size of the compressed coordinates of the frame starting at pos, rounded to
+ * the next 32-bit boundary. Returns FALSE if it cannot be read. */
+static int xtc_frame_bytes(XDRFILE *xd, int64_t pos, int *framebytes) {
+  if (xdr_seek(xd, pos + (int64_t)XTC_HEADER_SIZE, SEEK_SET) != exdrOK)
+    return FALSE;
+  if (xdrfile_read_int(framebytes, 1, xd) == 0)
+    return FALSE;
+  *framebytes = (*framebytes + 3) & ~0x03;
+  return TRUE;
+}
+
+/* Check that a frame of natoms atoms starts at pos: its size has to lead to
+ * the end of the file or to the header of another frame. */
+static int xtc_is_frame(XDRFILE *xd, int64_t pos, int natoms,
+                        int64_t filesize) {
+  int framebytes, header[2];
+  int64_t next;
+
+  if (!xtc_frame_bytes(xd, pos, &framebytes) || framebytes < 0)
+    return FALSE;
+  next = pos + (int64_t)(XTC_HEADER_SIZE + 4 + framebytes);
+  if (next >= filesize)
+    return TRUE;
+  if (xdr_seek(xd, next, SEEK_SET) != exdrOK)
+    return FALSE;
+  if (xdrfile_read_int(header, 2, xd) != 2)
+    return FALSE;
+  return header[0] == XTC_MAGIC && header[1] == natoms;
+}
+
+int read_xtc_range_offsets(char *fn, int natoms, int64_t start, int64_t stop,
+                           int *n_frames, int *est_nframes, int64_t **offsets,
+                           int64_t *next) {
+  XDRFILE *xd;
+  int *buf, i, n, framebytes;
+  int64_t filesize, pos, chunk;
+
+  *n_frames = 0;
+  *est_nframes = 0;
+  *offsets = NULL;
+
+  if ((xd = xdrfile_open(fn, "r")) == NULL)
+    return exdrFILENOTFOUND;
+  if (xdr_seek(xd, 0L, SEEK_END) != exdrOK) {
+    xdrfile_close(xd);
+    return exdrNR;
+  }
+  filesize = xdr_tell(xd);
+  if (stop > filesize)
+    stop = filesize;
+  *next = stop;
+
+  /* Find the first frame in the range. Frames are 32-bit aligned and their
+   * header holds the magic number, natoms and, XTC_NATOMS2_INT integers
+   * later, natoms again; candidates are confirmed with xtc_is_frame. */
+  pos = -1;
+  if (start == 0) {
+    pos = 0;
+  } else {
+    if ((buf = malloc(sizeof(int) * (XTC_SCAN_INTS + XTC_NATOMS2_INT))) ==
+        NULL) {
+      xdrfile_close(xd);
+      return exdrNOMEM;
+    }
+    chunk = (start + 3) & ~(int64_t)0x03;
+    while (pos < 0 && chunk < stop) {
+      n = XTC_SCAN_INTS + XTC_NATOMS2_INT;
+      if (chunk + 4 * (int64_t)n > filesize)
+        n = (int)((filesize - chunk) / 4);
+      if (n <= XTC_NATOMS2_INT)
+        break;
+      if (xdr_seek(xd, chunk, SEEK_SET) != exdrOK ||
+          xdrfile_read_int(buf, n, xd) != n) {
+        free(buf);
+        xdrfile_close(xd);
+        return exdrNR;
+      }
+      for (i = 0; i < XTC_SCAN_INTS && i + XTC_NATOMS2_INT < n; i++) {
+        if (chunk + 4 * (int64_t)i >= stop)
+          break;
+        if (buf[i] == XTC_MAGIC && buf[i + 1] == natoms &&
+            buf[i + XTC_NATOMS2_INT] == natoms &&
+            xtc_is_frame(xd, chunk + 4 * (int64_t)i, natoms, filesize)) {
+          pos = chunk + 4 * (int64_t)i;
+          break;
+        }
+      }
+      chunk += 4 * (int64_t)XTC_SCAN_INTS;
+    }
+    free(buf);
+    if (pos < 0) {
+      xdrfile_close(xd);
+      return exdrOK;
+    }
+  }
+
+  /* From there on follow the frame sizes as read_xtc_n_frames does */
+  *est_nframes = 16;
+  if ((*offsets = malloc(sizeof(int64_t) * *est_nframes)) == NULL) {
+    xdrfile_close(xd);
+    return exdrNOMEM;
+  }
+  while (pos < stop) {
+    if (!xtc_frame_bytes(xd, pos, &framebytes)) {
+      pos = filesize;
+      break;
+    }
+    if (*n_frames == *est_nframes) {
+      int64_t *grown;
+      *est_nframes += *est_nframes / 2;
+      if ((grown = realloc(*offsets, sizeof(int64_t) * *est_nframes)) ==
+          NULL) {
+        free(*offsets);
+        *offsets = NULL;
+        xdrfile_close(xd);
+        return exdrNOMEM;
+      }
+      *offsets = grown;
+    }
+    (*offsets)[(*n_frames)++] = pos;
+    pos += (int64_t)(XTC_HEADER_SIZE + 4 + framebytes);
+  }
+  *next = pos;
+  xdrfile_close(xd);
+  return exdrOK;
+}
@@ -37,6 +37,8 @@ Helper functions for common mathematical operations
 .. autofunction:: triclinic_vectors
 .. autofunction:: box_volume
 .. autofunction:: make_whole
+.. autoclass:: UnwrapPlan
+   :members:
 .. autofunction:: find_fragments
 
 .. versionadded:: 0.11.0
@@ -48,7 +50,7 @@ import numpy as np
 from ..exceptions import NoDataError
 from . import util
 from ._cutil import (make_whole, find_fragments, _sarrus_det_single,
-                     _sarrus_det_multiple)
+                     _sarrus_det_multiple, _unwrap_order, _make_whole_ordered)
 
 # geometric functions
 
@@ -422,3 +424,203 @@ def box_volume(dimensions):
         tri_vecs = triclinic_vectors(dim, dtype=np.float64)
         volume = tri_vecs[0, 0] * tri_vecs[1, 1] * tri_vecs[2, 2]
     return volume
+
+
+def _unwrap_reference(atoms, reference):
+    """Checked, lower case `reference` for unwrapping `atoms`
+
+    Shared by :class:`UnwrapPlan` and
+    :meth:`~MDAnalysis.core.groups.AtomGroup.unwrap`.
+    """
+    if reference is None:
+        return None
+    ref = reference.lower()
+    if ref == 'com':
+        # Don't use hasattr(self, 'masses') of a ResidueGroup or
+        # SegmentGroup because that's incredibly slow
+        if not hasattr(atoms, 'masses'):
+            raise NoDataError("Cannot perform unwrap with "
+                              "reference='com', this requires masses.")
+    elif ref != 'cog':
+        raise ValueError("Unrecognized reference '{}'. Please use one "
+                         "of 'com', 'cog', or None.".format(reference))
+    return ref
+
+
+def _unwrap_compound_indices(atoms, compound):
+    """Checked, lower case `compound` and the compound of each of `atoms`
+
+    Shared by :class:`UnwrapPlan` and
+    :meth:`~MDAnalysis.core.groups.AtomGroup.unwrap`.
+    """
+    comp = compound.lower()
+    if comp == 'group':
+        compound_indices = np.zeros(len(atoms), dtype=np.intp)
+    elif comp == 'fragments':
+        compound_indices = atoms.fragindices
+    elif comp == 'residues':
+        compound_indices = atoms.resindices
+    elif comp == 'segments':
+        compound_indices = atoms.segindices
+    elif comp == 'molecules':
+        try:
+            compound_indices = atoms.molnums
+        except AttributeError:
+            errmsg = ("Cannot use compound='molecules', this "
+                      "requires molnums.")
+            raise NoDataError(errmsg) from None
+    else:
+        raise ValueError("Unrecognized compound definition '{}'. Please "
+                         "use one of 'group', 'residues', 'segments', "
+                         "'molecules', or 'fragments'.".format(compound))
+    return comp, compound_indices
+
+
+class UnwrapPlan(object):
+    """Reusable plan to make the compounds of an AtomGroup whole
+
+    Building the plan finds the compounds of the group and the order in which
+    their atoms are placed along their bonds, which only depends on the
+    topology. :meth:`unwrap` then makes all compounds whole in the current
+    frame with a single sweep over this order, so that a plan built once can
+    be used for every frame of a trajectory::
+
+        from MDAnalysis.lib.mdamath import UnwrapPlan
+
+        plan = UnwrapPlan(u.atoms, compound='fragments')
+        for ts in u.trajectory:
+            plan.unwrap(reference='com')
+
+    The plan gives the same positions as
+    :meth:`~MDAnalysis.core.groups.AtomGroup.unwrap`, which builds a new plan
+    on every call.
+
+    Parameters
+    ----------
+    atomgroup : AtomGroup
+        The :class:`MDAnalysis.core.groups.AtomGroup` to work with; duplicate
+        atoms are only unwrapped once.
+    compound : {'group', 'segments', 'residues', 'molecules', \
+                'fragments'}, optional
+        Which type of component to make whole. All atoms within each compound
+        must be interconnected by bonds.
+
+    Raises
+    ------
+    NoDataError
+        If the topology does not contain bonds, or if `compound` is
+        ``'molecules'`` but the topology does not contain molecule
+        information.
+    ValueError
+        If `compound` is not one of the values above.
+
+    Note
+    ----
+    The plan is only valid as long as the bonds and the compounds of the
+    topology don't change.
+
+
+    .. versionadded:: 2.0.0
+    """
+    def __init__(self, atomgroup, compound='fragments'):
+        atoms = atomgroup.atoms
+        # u._topology.bonds is much faster to access than atoms.bonds
+        if not hasattr(atoms.universe._topology, 'bonds'):
+            raise NoDataError("Unwrapping requires Bonds")
+        atoms = atoms.unique
+        comp, compound_indices = _unwrap_compound_indices(atoms, compound)
+        self.atoms = atoms
+        self.compound = comp
+        # number the compounds from 0
+        self.compound_indices = np.unique(compound_indices,
+                                          return_inverse=True)[1].ravel()
+        self.n_compounds = (self.compound_indices.max() + 1
+                            if len(atoms) else 0)
+
+        # bonds between atoms of the group, as indices into atoms
+        bonds = atoms.universe._topology.bonds._bix.astype(np.intp)
+        ix = atoms.ix
+        if len(ix) > 0:
+            sorter = np.argsort(ix)
+            local = np.searchsorted(ix, bonds, sorter=sorter)
+            local = sorter[np.minimum(local, len(ix) - 1)]
+            bonds = local[np.all(ix[local] == bonds, axis=1)]
+        self._order, self._parents = _unwrap_order(self.compound_indices,
+                                                   bonds)
+
+    def unwrap(self, reference=None, inplace=True):
+        """Make the compounds whole in the current frame
+
+        Parameters
+        ----------
+        reference : {'com', 'cog', None}, optional
+            If ``'com'`` (center of mass) or ``'cog'`` (center of geometry),
+            the unwrapped compounds will be shifted so that their individual
+            reference point lies within the primary unit cell.
+            If ``None``, no such shift is performed.
+        inplace : bool, optional
+            If ``True``, coordinates are modified in place.
+
+        Returns
+        -------
+        coords : numpy.ndarray
+            Unwrapped coordinates of :attr:`atoms`, of shape ``(n, 3)``.
+
+        Raises
+        ------
+        NoDataError
+            If `reference` is ``'com'`` but the topology does not contain
+            masses.
+        ValueError
+            If `reference` is not one of ``'com'``, ``'cog'``, or ``None``,
+            if `reference` is ``'com'`` and the total mass of any compound is
+            zero, if the unit cell has a zero dimension, or if a compound that
+            has to be made whole is not contiguous.
+        """
+        from .distances import apply_PBC
+
+        atoms = self.atoms
+        ref = _unwrap_reference(atoms, reference)
+
+        n_compounds = self.n_compounds
+        compound_indices = self.compound_indices
+        positions = atoms.positions
+        # Make all compounds whole in a single pass over their bonds:
+        if n_compounds < len(atoms):
+            box = atoms.dimensions
+            if box is None or np.any(box[:3] == 0.0):
+                raise ValueError("One or more dimensions was zero.  You can "
+                                 "set dimensions using "
+                                 "'atomgroup.dimensions='")
+            _make_whole_ordered(positions, self._order, self._parents, box)
+        # Apply reference shift if required:
+        if reference is not None and n_compounds > 0:
+            if ref == 'com':
+                masses = atoms.masses
+                total = np.bincount(compound_indices, weights=masses,
+                                    minlength=n_compounds)
+                if np.any(np.isclose(total, 0.0)):
+                    if self.compound == 'group':
+                        raise ValueError("Cannot perform unwrap with "
+                                         "reference='com' because the total "
+                                         "mass of the group is zero.")
+                    raise ValueError("Cannot perform unwrap with "
+                                     "reference='com' because the total "
+                                     "mass of at least one of the {} is "
+                                     "zero.".format(self.compound))
+                weights = masses
+            else:  # ref == 'cog'
+                total = np.bincount(compound_indices, minlength=n_compounds)
+                weights = np.ones(len(positions))
+            refpos = np.empty((n_compounds, 3), dtype=np.float64)
+            for i in range(3):
+                refpos[:, i] = np.bincount(compound_indices,
+                                           weights=positions[:, i] * weights,
+                                           minlength=n_compounds)
+            refpos /= total[:, None]
+            refpos = refpos.astype(np.float32, copy=False)
+            target = apply_PBC(refpos, atoms.dimensions)
+            positions += (target - refpos)[compound_indices]
+        if inplace:
+            atoms.positions = positions
+        return positions
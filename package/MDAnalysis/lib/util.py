@@ -131,6 +131,8 @@ File parsing
 
 .. autoclass:: FORTRANReader
    :members:
+.. autofunction:: whitespace_floats
+.. autofunction:: fixed_width_floats
 .. autodata:: FORTRAN_format_regex
 
 Data manipulation and handling
@@ -1255,6 +1257,121 @@ class FORTRANReader(object):
         return self.__class__.__name__ + "(" + ",".join(self.fmt) + ")"
 
 
+def _parse_floats(text, n_values, dtype):
+    """parse `n_values` whitespace separated numbers of `text` in one go"""
+    with warnings.catch_warnings():
+        # numpy warns (or raises in later versions) on unparsable text
+        warnings.simplefilter('ignore', DeprecationWarning)
+        try:
+            values = np.fromstring(text, dtype=dtype, sep=' ')
+        except ValueError:
+            values = None
+    if values is None or values.size != n_values:
+        raise ValueError("could not convert the fields to {} numbers"
+                         "".format(n_values))
+    return values
+
+
+def whitespace_floats(lines, n_columns, dtype=np.float64):
+    """Parse lines of whitespace separated numbers into an array.
+
+    All lines are converted at once in C instead of splitting them one by one,
+    which is much faster for the large blocks of lines of text trajectory and
+    topology files.
+
+    Parameters
+    ----------
+    lines : list of str or bytes
+        lines with `n_columns` numbers each
+    n_columns : int
+        number of numbers on each line
+    dtype : numpy.dtype (optional)
+        type of the returned array
+
+    Returns
+    -------
+    numpy.ndarray
+        array of shape ``(len(lines), n_columns)``
+
+    Raises
+    ------
+    ValueError
+        if the lines do not contain ``len(lines) * n_columns`` numbers
+
+    Note
+    ----
+    Only the total number of values is checked, not how they are distributed
+    over the lines.
+
+
+    .. versionadded:: 2.0.0
+    """
+    text = (b'' if lines and isinstance(lines[0], bytes) else '').join(lines)
+    values = _parse_floats(text, len(lines) * n_columns, dtype)
+    return values.reshape(len(lines), n_columns)
+
+
+def fixed_width_floats(lines, columns, dtype=np.float64):
+    """Parse numbers in fixed columns of lines into an array.
+
+    The characters of all lines are gathered in an array and the columns are
+    cut out of it as a whole, so that fields without white space between them
+    (as in GRO or PDB files) are converted at once in C.
+
+    Parameters
+    ----------
+    lines : list of str or bytes
+        lines of fixed-width fields
+    columns : list of tuple
+        ``(start, stop)`` of each field, 0-based with `stop` excluded as in
+        ``line[start:stop]``
+    dtype : numpy.dtype (optional)
+        type of the returned array
+
+    Returns
+    -------
+    numpy.ndarray
+        array of shape ``(len(lines), len(columns))``
+
+    Raises
+    ------
+    ValueError
+        if a field is blank, missing or not a number
+
+
+    .. versionadded:: 2.0.0
+    """
+    width = max(stop for _, stop in columns)
+    chars = _char_codes(lines, width)
+    # a blank between all fields so that they are separated
+    blank = np.full((len(chars), 1), ord(' '), dtype=chars.dtype)
+    fields = []
+    for start, stop in columns:
+        fields.extend((chars[:, start:stop], blank))
+    text = np.concatenate(fields, axis=1)
+    text[text == 0] = ord(' ')
+    if text.size and text.max() > 127:
+        raise ValueError("non-ASCII characters in numeric fields")
+    values = _parse_floats(text.astype(np.uint8).tobytes(),
+                           len(chars) * len(columns), dtype)
+    return values.reshape(len(chars), len(columns))
+
+
+def _char_codes(lines, width):
+    """characters of `lines` as an array of shape ``(len(lines), width)``
+
+    Lines are cut at or padded with NUL to `width` characters; ASCII lines
+    are stored as ``uint8`` (a quarter of the memory) and others as
+    ``uint32`` code points.
+    """
+    try:
+        chars = np.array(lines, dtype='S{}'.format(width))
+    except UnicodeEncodeError:
+        chars = np.array(lines, dtype='U{}'.format(width))
+    return chars.view(np.uint8 if chars.dtype.kind == 'S' else np.uint32
+                      ).reshape(len(chars), width)
+
+
 def fixedwidth_bins(delta, xmin, xmax):
     """Return bins of width `delta` that cover `xmin`, `xmax` (or a larger range).
 
@@ -152,6 +152,101 @@ def hy36decode(width, s):
     raise ValueError("invalid number literal.")
 
 
+def _decode_decimal(s):
+    """Vectorised :func:`int` of an array of strings
+
+    Parameters
+    ----------
+    s : numpy.ndarray
+        array of strings of numpy dtype ``U<width>``
+
+    Returns
+    -------
+    values : numpy.ndarray
+        the integers, undefined where `valid` is ``False``
+    valid : numpy.ndarray
+        ``True`` where :func:`int` reads the string
+    """
+    width = s.dtype.itemsize // 4
+    codes = np.ascontiguousarray(s).view(np.uint32).reshape(len(s), width)
+    n, width = codes.shape
+    rows = np.arange(n)
+    blank = (codes == 0) | (codes == ord(' '))
+    digit = (codes >= ord('0')) & (codes <= ord('9'))
+    first = np.argmin(blank, axis=1)
+    last = width - 1 - np.argmin(blank[:, ::-1], axis=1)
+    lead = codes[rows, first]
+    signed = (lead == ord('-')) | (lead == ord('+'))
+    # a sign and digits without blanks between the first and last character
+    body = ~blank
+    body[rows, first] &= ~signed
+    valid = (~blank.all(axis=1) & body.any(axis=1)
+             & ((~blank).sum(axis=1) == last - first + 1)
+             & (digit | ~body).all(axis=1))
+    values = np.zeros(n, dtype=np.int64)
+    for j in range(width):
+        values = np.where(digit[:, j], 10 * values + codes[:, j] - ord('0'),
+                          values)
+    values[lead == ord('-')] *= -1
+    return values, valid
+
+
+def _decode_pure_codes(codes, offset):
+    """values of fields of base-36 digits ``0-9`` and letters starting at
+    the code `offset`, ``(values, valid)``"""
+    digit = (codes >= ord('0')) & (codes <= ord('9'))
+    letter = (codes >= offset) & (codes < offset + 26)
+    digits = np.where(digit, codes - ord('0'), codes - offset + 10)
+    values = np.zeros(len(codes), dtype=np.int64)
+    for j in range(codes.shape[1]):
+        values = 36 * values + digits[:, j]
+    return values, (digit | letter).all(axis=1)
+
+
+def hy36decode_array(width, s):
+    """
+    Vectorised :func:`hy36decode` of many strings at once.
+
+    Parameters
+    ----------
+    width: int
+        The number of columns in the pdb file store atom index.
+    s: array_like of str
+        The contents of the pdb index columns of all atoms.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Base-10 integers corresponding to hybrid36; undefined where `valid`
+        is ``False``.
+    valid : numpy.ndarray
+        ``False`` where :func:`hy36decode` can not decode the string.
+
+
+    .. versionadded:: 2.0.0
+    """
+    s = np.asarray(s, dtype=str)
+    valid = np.char.str_len(s) == width
+    s = s.astype('U{}'.format(width))
+    codes = np.ascontiguousarray(s).view(np.uint32).reshape(len(s), width)
+    f = codes[:, 0]
+    decimal = ((f == ord('-')) | (f == ord(' '))
+               | ((f >= ord('0')) & (f <= ord('9'))))
+    upper = (f >= ord('A')) & (f <= ord('Z'))
+    lower = (f >= ord('a')) & (f <= ord('z'))
+
+    values, ok = _decode_decimal(s)
+    valid &= ~decimal | ok
+    for case, offset, shift in ((upper, ord('A'), -10),
+                                (lower, ord('a'), 16)):
+        if case.any():
+            pure, ok = _decode_pure_codes(codes[case], offset)
+            values[case] = pure + shift * 36 ** (width - 1) + 10 ** width
+            valid[case] &= ok
+    valid &= decimal | upper | lower
+    return values, valid
+
+
 class PDBParser(TopologyReaderBase):
     """Parser that obtains a list of atoms from a standard PDB file.
 
@@ -210,25 +305,9 @@ class PDBParser(TopologyReaderBase):
 
     def _parseatoms(self):
         """Create the initial Topology object"""
-        resid_prev = 0  # resid looping hack
-
-        record_types = []
-        serials = []
-        names = []
-        altlocs = []
-        chainids = []
-        icodes = []
-        tempfactors = []
-        occupancies = []
-
-        resids = []
-        resnames = []
-
-        segids = []
-        elements = []
-
         self._wrapped_serials = False  # did serials go over 100k?
         last_wrapped_serial = 100000  # if serials wrap, start from here
+        lines = []
         with util.openany(self.filename) as f:
             for line in f:
                 line = line.strip()  # Remove extra spaces
@@ -236,52 +315,60 @@ class PDBParser(TopologyReaderBase):
                     continue
                 if line.startswith('END'):
                     break
-                if not line.startswith(('ATOM', 'HETATM')):
-                    continue
+                if line.startswith(('ATOM', 'HETATM')):
+                    lines.append(line)
+
+        # the fields of all atoms are cut out column by column
+        record_types = [line[:6].strip() for line in lines]
+        names = [line[12:16].strip() for line in lines]
+        altlocs = [line[16:17].strip() for line in lines]
+        resnames = [line[17:21].strip() for line in lines]
+        chainids = [line[21:22].strip() for line in lines]
+        icodes = [line[26:27].strip() for line in lines]
+        segids = [line[66:76].strip() for line in lines]
+        elements = [line[76:78].strip() for line in lines]
+
+        serials, ok = _decode_decimal(np.array([line[6:11] for line in lines],
+                                               dtype='U5'))
+        if not ok.all():
+            fields = [line[6:11] for line, valid in zip(lines, ok)
+                      if not valid]
+            hy36, valid = hy36decode_array(5, fields)
+            # serial can become '***' when they get too high
+            self._wrapped_serials = not valid.all()
+            hy36[~valid] = last_wrapped_serial + np.arange(
+                np.count_nonzero(~valid))
+            serials[~ok] = hy36
+
+        # Resids are optional
+        if self.format == "XPDB":  # fugly but keeps code DRY
+            # extended non-standard format used by VMD
+            resids, ok = _decode_decimal(np.array(
+                [line[22:27] for line in lines], dtype='U5'))
+        else:
+            resids, ok = _decode_decimal(np.array(
+                [line[22:26] for line in lines], dtype='U4'))
+            # Wrapping: 10000 is added to each resid that is more than 5000
+            # below the previous one (an offset that can not drop below 0)
+            valid_resids = resids[ok]
+            previous = np.concatenate([[0], valid_resids[:-1]])
+            offsets = np.cumsum(
+                -10000 * ((valid_resids - previous + 5000) // 10000))
+            offsets -= np.minimum(np.minimum.accumulate(offsets), 0)
+            resids[ok] = valid_resids + offsets
+        if not ok.all():
+            warnings.warn("PDB file is missing resid information.  "
+                          "Defaulted to '1'")
+            resids[~ok] = 1
 
-                record_types.append(line[:6].strip())
-                try:
-                    serial = int(line[6:11])
-                except:
-                    try:
-                        serial = hy36decode(5, line[6:11])
-                    except ValueError:
-                        # serial can become '***' when they get too high
-                        self._wrapped_serials = True
-                        serial = last_wrapped_serial
-                        last_wrapped_serial += 1
-                finally:
-                    serials.append(serial)
-
-                names.append(line[12:16].strip())
-                altlocs.append(line[16:17].strip())
-                resnames.append(line[17:21].strip())
-                chainids.append(line[21:22].strip())
-                elements.append(line[76:78].strip())
-
-                # Resids are optional
-                try:
-                    if self.format == "XPDB":  # fugly but keeps code DRY
-                        # extended non-standard format used by VMD
-                        resid = int(line[22:27])
-                    else:
-                        resid = int(line[22:26])
-                        # Wrapping
-                        while resid - resid_prev < -5000:
-                            resid += 10000
-                        resid_prev = resid
-                except ValueError:
-                    warnings.warn("PDB file is missing resid information.  "
-                                  "Defaulted to '1'")
-                    resid = 1
-                finally:
-                    resids.append(resid)
-                    icodes.append(line[26:27].strip())
-
-                occupancies.append(float_or_default(line[54:60], 0.0))
-                tempfactors.append(float_or_default(line[60:66], 1.0))  # AKA bfactor
-
-                segids.append(line[66:76].strip())
+        try:
+            occupancies, tempfactors = util.fixed_width_floats(
+                lines, [(54, 60), (60, 66)]).T
+        except ValueError:
+            occupancies = [float_or_default(line[54:60], 0.0)
+                           for line in lines]
+            tempfactors = [float_or_default(line[60:66], 1.0)  # AKA bfactor
+                           for line in lines]
 
         # Warn about wrapped serials
         if self._wrapped_serials:
@@ -320,17 +407,19 @@ class PDBParser(TopologyReaderBase):
             atomtypes = elements
             attrs.append(Atomtypes(np.array(elements, dtype=object)))
 
-            validated_elements = []
-            for elem in elements:
+            # each distinct element is validated once
+            validated = {}
+            for elem in sorted(set(elements)):
                 if elem.capitalize() in SYMB2Z:
-                    validated_elements.append(elem.capitalize())
+                    validated[elem] = elem.capitalize()
                 else:
                     wmsg = (f"Unknown element {elem} found for some atoms. "
                             f"These have been given an empty element record. "
                             f"If needed they can be guessed using "
                             f"MDAnalysis.topology.guessers.")
                     warnings.warn(wmsg)
-                    validated_elements.append('')
+                    validated[elem] = ''
+            validated_elements = [validated[elem] for elem in elements]
             attrs.append(Elements(np.array(validated_elements, dtype=object)))
 
         masses = guess_masses(atomtypes)
@@ -44,10 +44,11 @@ Classes
 
 """
 import logging
-import functools
+import itertools
 from math import ceil
 import numpy as np
 
+from ..lib import util
 from ..lib.util import openany
 from . import guessers
 from .base import TopologyReaderBase, squash_by, change_squash
@@ -70,6 +71,30 @@ from ..core.topology import Topology
 
 logger = logging.getLogger("MDAnalysis.topology.PSF")
 
+# slices of the id, segid, resid, resname, name, type, charge and mass fields
+# of the atom lines of the fixed column formats
+_ATOM_COLUMNS = {
+    'STANDARD': ((0, 8), (9, 13), (14, 18), (19, 23), (24, 28), (29, 33),
+                 (34, 48), (48, 62)),
+    # l[62:70], l[70:84], l[84:98] ignore IMOVE, ECH and EHA,
+    'EXTENDED': ((0, 10), (11, 19), (20, 28), (29, 37), (38, 46), (47, 51),
+                 (52, 66), (66, 70)),
+    # l[70:78],  l[78:84], l[84:98] ignore IMOVE, ECH and EHA,
+}
+
+# how to partition the line into the individual atom components
+_ATOM_PARSERS = {
+    'STANDARD': lambda l:
+    (l[:8], l[9:13].strip() or "SYSTEM", l[14:18],
+     l[19:23].strip(), l[24:28].strip(),
+     l[29:33].strip(), l[34:48], l[48:62]),
+    'EXTENDED': lambda l:
+    (l[:10], l[11:19].strip() or "SYSTEM", l[20:28],
+     l[29:37].strip(), l[38:46].strip(),
+     l[47:51].strip(), l[52:66], l[66:70]),
+    'NAMD': lambda l: l.split()[:8],
+}
+
 
 class PSFParser(TopologyReaderBase):
     """Read topology information from a CHARMM/NAMD/XPLOR PSF_ file.
@@ -129,8 +154,13 @@ class PSFParser(TopologyReaderBase):
                          "".format(self.filename, self._format))
 
             # Atoms first and mandatory
-            top = self._parse_sec(
-                psffile, ('NATOM', 1, 1, self._parseatoms))
+            try:
+                top = self._parse_sec(
+                    psffile, ('NATOM', 1, 1, self._parseatoms))
+            except StopIteration:
+                err = f"{self.filename} is not valid PSF file"
+                logger.error(err)
+                raise ValueError(err) from None
             # Then possibly other sections
             sections = (
                 #("atoms", ("NATOM", 1, 1, self._parseatoms)),
@@ -179,10 +209,13 @@ class PSFParser(TopologyReaderBase):
         # Now figure out how many lines to read
         numlines = int(ceil(num/per_line))
 
-        psffile_next = functools.partial(next, psffile)
-        return parsefunc(psffile_next, atoms_per, numlines)
+        lines = list(itertools.islice(psffile, numlines))
+        if len(lines) < numlines:
+            # the file ends within the section
+            raise StopIteration
+        return parsefunc(lines, atoms_per, int(num))
 
-    def _parseatoms(self, lines, atoms_per, numlines):
+    def _parseatoms(self, lines, atoms_per, num):
         """Parses atom section in a Charmm PSF file.
 
         Normal (standard) and extended (EXT) PSF format are
@@ -232,25 +265,6 @@ class PSFParser(TopologyReaderBase):
         take the same approach.
 
         """
-        # how to partition the line into the individual atom components
-        atom_parsers = {
-            'STANDARD': lambda l:
-            (l[:8], l[9:13].strip() or "SYSTEM", l[14:18],
-             l[19:23].strip(), l[24:28].strip(),
-             l[29:33].strip(), l[34:48], l[48:62]),
-            # l[62:70], l[70:84], l[84:98] ignore IMOVE, ECH and EHA,
-            'EXTENDED': lambda l:
-            (l[:10], l[11:19].strip() or "SYSTEM", l[20:28],
-             l[29:37].strip(), l[38:46].strip(),
-             l[47:51].strip(), l[52:66], l[66:70]),
-            # l[70:78],  l[78:84], l[84:98] ignore IMOVE, ECH and EHA,
-            'NAMD': lambda l: l.split()[:8],
-        }
-        atom_parser = atom_parsers[self._format]
-        # once partitioned, assigned each component the correct type
-        set_type = lambda x: (int(x[0]) - 1, x[1] or "SYSTEM", int(x[2]), x[3],
-                              x[4], x[5], float(x[6]), float(x[7]))
-
         # Oli: I don't think that this is the correct OUTPUT format:
         #   psf_atom_format = "   %5d %4s %4d %4s %-4s %-4s %10.6f      %7.4f%s\n"
         # It should be rather something like:
@@ -261,7 +275,108 @@ class PSFParser(TopologyReaderBase):
         #   II,LSEGID,LRESID,LRES,TYPE(I),IAC(I),CG(I),AMASS(I),IMOVE(I),ECH(I),EHA(I)
         #  (I8,1X,A4, 1X,A4,  1X,A4,  1X,A4,  1X,I4,  1X,2G14.6,     I8,   2G14.6)
         #   0:8   9:13   14:18   19:23   24:28   29:33   34:48 48:62 62:70 70:84 84:98
+        try:
+            columns = self._atom_columns(lines, self._format)
+        except ValueError:
+            # some lines don't fit the format: go through them one by one
+            columns = self._atom_columns_by_line(lines)
+        (atomids, segids, resids, resnames,
+         atomnames, atomtypes, charges, masses) = columns
+
+        # Atom
+        atomids = Atomids(atomids)
+        atomnames = Atomnames(atomnames)
+        atomtypes = Atomtypes(atomtypes)
+        charges = Charges(charges)
+        masses = Masses(masses)
+
+        # Residue
+        # resids, resnames
+        residx, (new_resids, new_resnames, perres_segids) = change_squash(
+            (resids, resnames, segids),
+            (resids, resnames, segids))
+        # transform from atom:Rid to atom:Rix
+        residueids = Resids(new_resids)
+        residuenums = Resnums(new_resids.copy())
+        residuenames = Resnames(new_resnames)
+
+        # Segment
+        segidx, perseg_segids = squash_by(perres_segids)[:2]
+        segids = Segids(perseg_segids)
+
+        top = Topology(len(atomids), len(new_resids), len(segids),
+                       attrs=[atomids, atomnames, atomtypes,
+                              charges, masses,
+                              residueids, residuenums, residuenames,
+                              segids],
+                       atom_resindex=residx,
+                       residue_segindex=segidx)
+
+        return top
+
+    def _parsesection(self, lines, atoms_per, num):
+        try:
+            # Subtract 1 from each number to ensure zero-indexing for the atoms
+            fields = _to_array(''.join(lines).split(), np.int64) - 1
+            if len(fields) != num * atoms_per:
+                raise ValueError("wrong number of atom indices")
+        except ValueError:
+            # the section doesn't match its header: split it line by line
+            section = []
+            for line in lines:
+                fields = np.int64(line.split()) - 1
+                for j in range(0, len(fields), atoms_per):
+                    section.append(tuple(fields[j:j+atoms_per]))
+            return section
+        return fields.reshape(num, atoms_per)
+
+    def _atom_columns(self, lines, psf_format):
+        """Split the atom lines into columns and convert them all at once
+
+        Raises
+        ------
+        ValueError
+            if a field can't be converted
+        """
+        if psf_format == 'NAMD':
+            # splitting all lines at once is much cheaper than keeping a
+            # list of fields for each line
+            tokens = ''.join(lines).split()
+            n_fields = len(lines[0].split()) if lines else 8
+            if n_fields < 8 or len(tokens) != len(lines) * n_fields:
+                raise ValueError("atom lines with different numbers of "
+                                 "fields")
+            columns = [tokens[i::n_fields] for i in range(8)]
+        else:
+            slices = _ATOM_COLUMNS[psf_format]
+            columns = [[l[start:stop] for l in lines]
+                       for start, stop in slices]
+            for i in (3, 4, 5):
+                columns[i] = [f.strip() for f in columns[i]]
+        ids, segids, resids, resnames, names, types, charges, masses = columns
+
+        return (_to_array(ids, np.int32) - 1,
+                np.array([s.strip() or "SYSTEM" for s in segids],
+                         dtype=object),
+                _to_array(resids, np.int32),
+                np.array(resnames, dtype=object),
+                np.array(names, dtype=object),
+                np.array(types, dtype=object),
+                _to_array(charges, np.float64).astype(np.float32),
+                _to_array(masses, np.float64))
+
+    def _atom_columns_by_line(self, lines):
+        """Convert the atom lines one by one
+
+        Switches to the space separated NAMD format at the first line that
+        does not fit the fixed columns.
+        """
+        atom_parser = _ATOM_PARSERS[self._format]
+        # once partitioned, assigned each component the correct type
+        set_type = lambda x: (int(x[0]) - 1, x[1] or "SYSTEM", int(x[2]), x[3],
+                              x[4], x[5], float(x[6]), float(x[7]))
 
+        numlines = len(lines)
         # Allocate arrays
         atomids = np.zeros(numlines, dtype=np.int32)
         segids = np.zeros(numlines, dtype=object)
@@ -272,25 +387,25 @@ class PSFParser(TopologyReaderBase):
         charges = np.zeros(numlines, dtype=np.float32)
         masses = np.zeros(numlines, dtype=np.float64)
 
-        for i in range(numlines):
-            try:
-                line = lines()
-            except StopIteration:
-                err = f"{self.filename} is not valid PSF file"
-                logger.error(err)
-                raise ValueError(err) from None
+        for i, line in enumerate(lines):
             try:
                 vals = set_type(atom_parser(line))
             except ValueError:
                 # last ditch attempt: this *might* be a NAMD/VMD
                 # space-separated "PSF" file from VMD version < 1.9.1
-                atom_parser = atom_parsers['NAMD']
+                atom_parser = _ATOM_PARSERS['NAMD']
                 vals = set_type(atom_parser(line))
                 logger.warning("Guessing that this is actually a"
                                " NAMD-type PSF file..."
                                " continuing with fingers crossed!")
                 logger.debug("First NAMD-type line: {0}: {1}"
                              "".format(i, line.rstrip()))
+                if i == 0:
+                    # all lines are NAMD-type lines
+                    try:
+                        return self._atom_columns(lines, 'NAMD')
+                    except ValueError:
+                        pass
 
             atomids[i] = vals[0]
             segids[i] = vals[1]
@@ -301,43 +416,13 @@ class PSFParser(TopologyReaderBase):
             charges[i] = vals[6]
             masses[i] = vals[7]
 
-        # Atom
-        atomids = Atomids(atomids)
-        atomnames = Atomnames(atomnames)
-        atomtypes = Atomtypes(atomtypes)
-        charges = Charges(charges)
-        masses = Masses(masses)
-
-        # Residue
-        # resids, resnames
-        residx, (new_resids, new_resnames, perres_segids) = change_squash(
-            (resids, resnames, segids),
-            (resids, resnames, segids))
-        # transform from atom:Rid to atom:Rix
-        residueids = Resids(new_resids)
-        residuenums = Resnums(new_resids.copy())
-        residuenames = Resnames(new_resnames)
-
-        # Segment
-        segidx, perseg_segids = squash_by(perres_segids)[:2]
-        segids = Segids(perseg_segids)
+        return (atomids, segids, resids, resnames,
+                atomnames, atomtypes, charges, masses)
 
-        top = Topology(len(atomids), len(new_resids), len(segids),
-                       attrs=[atomids, atomnames, atomtypes,
-                              charges, masses,
-                              residueids, residuenums, residuenames,
-                              segids],
-                       atom_resindex=residx,
-                       residue_segindex=segidx)
-
-        return top
 
-    def _parsesection(self, lines, atoms_per, numlines):
-        section = []
-
-        for i in range(numlines):
-            # Subtract 1 from each number to ensure zero-indexing for the atoms
-            fields = np.int64(lines().split()) - 1
-            for j in range(0, len(fields), atoms_per):
-                section.append(tuple(fields[j:j+atoms_per]))
-        return section
+def _to_array(fields, dtype):
+    """Convert a list of numbers as strings to an array in one go"""
+    if not fields:
+        return np.array([], dtype=dtype)
+    return util.whitespace_floats([' '.join(fields)], len(fields),
+                                  dtype=dtype)[0]
@@ -0,0 +1,358 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+# doi: 10.25080/majora-629e541a-00e
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+"""
+Cache of parsed topologies --- :mod:`MDAnalysis.topology.cache`
+===============================================================
+
+Parsing a large topology file (PSF, TPR, PDB, ...) can take much longer than
+everything else a short analysis job does.  This module stores the
+:class:`~MDAnalysis.core.topology.Topology` built by a parser in a compact
+binary snapshot, so that the next :class:`~MDAnalysis.core.universe.Universe`
+created from the same file loads the snapshot instead of parsing the file
+again::
+
+   import MDAnalysis as mda
+
+   # the first job parses the PSF and writes a snapshot to the cache directory,
+   # all later jobs load the snapshot
+   u = mda.Universe(PSF, DCD, topology_cache='/scratch/me/mda_topologies')
+
+Snapshots are keyed by a hash of the whole topology file, the parser, its
+keyword arguments and the MDAnalysis version, so that copies of the same file
+share a snapshot and an edited file or a new release of MDAnalysis gets a new
+one.  Snapshots are written atomically and concurrent processes wait on a lock
+file for the first one to finish parsing, as in
+:mod:`MDAnalysis.coordinates.offsets`.
+
+A snapshot holds a JSON header followed by the raw arrays of all
+TopologyAttrs, the residue and segment indices and the bonds, angles,
+dihedrals, ... of the topology.  The numerical arrays are memory mapped
+(copy-on-write) when a snapshot is loaded; string attributes are stored as a
+table of distinct values and an index array.
+
+.. autofunction:: cached_topology
+.. autofunction:: topology_key
+.. autofunction:: save_topology
+.. autofunction:: load_topology
+
+
+.. versionadded:: 2.0.0
+"""
+import hashlib
+import importlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import warnings
+
+import numpy as np
+
+import MDAnalysis
+from ..core.topology import Topology
+from ..core.topologyattrs import (TopologyAttr, _Connection, Atomindices,
+                                  Resindices, Segindices)
+from ..coordinates.offsets import _locked
+from ..lib import util
+
+
+#: first bytes of a snapshot, including the version of the layout
+_MAGIC = b'MDATOP01'
+#: data arrays start at multiples of this many bytes
+_ALIGN = 64
+_CHUNK = 1 << 20
+
+
+def topology_key(filename, **params):
+    """Key of the topology parsed from `filename` in the cache
+
+    Parameters
+    ----------
+    filename : str
+        topology file
+    **params
+        parameters the topology depends on, e.g. the parser and its keyword
+        arguments
+
+    Returns
+    -------
+    key : str
+        hex digest of the parameters, the MDAnalysis version and the content
+        of the file
+    """
+    sha = hashlib.sha256(_MAGIC)
+    sha.update('version={};'.format(MDAnalysis.__version__).encode())
+    for name in sorted(params):
+        sha.update('{}={!r};'.format(name, params[name]).encode())
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _factorize(values):
+    """distinct values in order of appearance and the index of each value"""
+    table = {}
+    codes = np.fromiter((table.setdefault(v, len(table)) for v in values),
+                        dtype=np.int32, count=len(values))
+    return list(table), codes
+
+
+def _encode(value):
+    """JSON representation of a bond type or order"""
+    if isinstance(value, tuple):
+        return [_encode(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    raise TypeError("can't store {!r} in a topology snapshot".format(value))
+
+
+def _decode(value):
+    if isinstance(value, list):
+        return tuple(_decode(v) for v in value)
+    return value
+
+
+def _expand(table, codes):
+    """object array of the values in `table` at `codes`"""
+    lookup = np.empty(len(table), dtype=object)
+    lookup[:] = [_decode(v) for v in table]
+    return lookup[codes]
+
+
+def _describe(attr, arrays):
+    """header entry for `attr`; its arrays are appended to `arrays`"""
+    cls = type(attr)
+    entry = {'class': [cls.__module__, cls.__qualname__],
+             'attrname': attr.attrname}
+
+    def add(name, array):
+        entry[name] = len(arrays)
+        arrays.append(np.ascontiguousarray(array))
+
+    if isinstance(attr, _Connection):
+        entry['kind'] = 'connection'
+        add('values', attr._bix)
+        add('guessed', attr._guessed)
+        for name in ('types', 'order'):
+            table, codes = _factorize(getattr(attr, '_' + name))
+            entry[name] = [_encode(v) for v in table]
+            add(name + '_codes', codes)
+        return entry
+
+    entry['guessed'] = bool(attr._guessed)
+    values = np.asarray(attr.values)
+    if values.dtype != object:
+        entry['kind'] = 'array'
+        add('values', values)
+        return entry
+    flat = values.ravel()
+    if not all(isinstance(v, str) for v in flat):
+        raise TypeError("can't store the values of {} in a topology "
+                        "snapshot".format(attr.attrname))
+    entry['kind'] = 'strings'
+    entry['table'], codes = _factorize(flat)
+    add('codes', codes.reshape(values.shape))
+    return entry
+
+
+def save_topology(topology, filename):
+    """Write a snapshot of `topology` to `filename`
+
+    Parameters
+    ----------
+    topology : :class:`~MDAnalysis.core.topology.Topology`
+        topology to store
+    filename : str
+        snapshot file, overwritten if it exists
+
+    Raises
+    ------
+    TypeError
+        if a TopologyAttr holds values that can't be stored, e.g. objects
+        that are not strings
+    """
+    arrays = [topology.tt._AR, topology.tt._RS]
+    attrs = [_describe(attr, arrays) for attr in topology.attrs
+             if not isinstance(attr, (Atomindices, Resindices, Segindices))]
+
+    layout = []
+    offset = 0
+    for array in arrays:
+        offset = -(-offset // _ALIGN) * _ALIGN
+        layout.append({'dtype': array.dtype.str, 'shape': array.shape,
+                       'offset': offset})
+        offset += array.nbytes
+    header = json.dumps({'n_atoms': topology.n_atoms,
+                         'n_residues': topology.n_residues,
+                         'n_segments': topology.n_segments,
+                         'attrs': attrs,
+                         'arrays': layout}).encode()
+    start = -(-(len(_MAGIC) + 8 + len(header)) // _ALIGN) * _ALIGN
+
+    with open(filename, 'wb') as f:
+        f.write(_MAGIC + struct.pack('<Q', len(header)) + header)
+        for array, spec in zip(arrays, layout):
+            f.seek(start + spec['offset'])
+            f.write(array.tobytes())
+        f.truncate(start + offset)
+
+
+def load_topology(filename):
+    """Read a snapshot written by :func:`save_topology`
+
+    Parameters
+    ----------
+    filename : str
+        snapshot file
+
+    Returns
+    -------
+    topology : :class:`~MDAnalysis.core.topology.Topology`
+        the stored topology; its numerical arrays are copy-on-write memory
+        maps of `filename`
+
+    Raises
+    ------
+    ValueError
+        if `filename` is not a topology snapshot
+    """
+    with open(filename, 'rb') as f:
+        magic = f.read(len(_MAGIC))
+        if magic != _MAGIC:
+            raise ValueError("{} is not a topology snapshot".format(filename))
+        size, = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(size).decode())
+        start = -(-(len(_MAGIC) + 8 + size) // _ALIGN) * _ALIGN
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    arrays = [np.ndarray(tuple(spec['shape']), dtype=spec['dtype'],
+                         buffer=buf, offset=start + spec['offset'])
+              for spec in header['arrays']]
+
+    attrs = []
+    for entry in header['attrs']:
+        module, name = entry['class']
+        cls = importlib.import_module(module)
+        for part in name.split('.'):
+            cls = getattr(cls, part)
+        if not (isinstance(cls, type) and issubclass(cls, TopologyAttr)):
+            raise ValueError("{} is not a TopologyAttr".format(name))
+
+        if entry['kind'] == 'connection':
+            attr = cls(arrays[entry['values']],
+                       types=_expand(entry['types'],
+                                     arrays[entry['types_codes']]),
+                       guessed=arrays[entry['guessed']],
+                       order=_expand(entry['order'],
+                                     arrays[entry['order_codes']]))
+        elif entry['kind'] == 'strings':
+            attr = cls(_expand(entry['table'], arrays[entry['codes']]),
+                       guessed=entry['guessed'])
+        else:
+            attr = cls(arrays[entry['values']], guessed=entry['guessed'])
+        attrs.append(attr)
+
+    return Topology(header['n_atoms'], header['n_residues'],
+                    header['n_segments'], attrs=attrs,
+                    atom_resindex=arrays[0], residue_segindex=arrays[1])
+
+
+def _load(path):
+    """read a snapshot, ``None`` if it does not exist or is broken"""
+    try:
+        return load_topology(path)
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def cached_topology(filename, parse, directory, refresh=False, **params):
+    """Topology of `filename`, from the cache if possible
+
+    Parameters
+    ----------
+    filename : str
+        topology file
+    parse : callable
+        called without arguments to parse the file if there is no snapshot
+        of it; returns a :class:`~MDAnalysis.core.topology.Topology`
+    directory : str
+        cache directory, created if needed
+    refresh : bool (optional)
+        parse the file and replace the snapshot even if there is one
+    **params
+        parameters the topology depends on, see :func:`topology_key`
+
+    Returns
+    -------
+    topology : :class:`~MDAnalysis.core.topology.Topology`
+
+    Notes
+    -----
+    If `filename` is not a file on disk (for instance a
+    :class:`~MDAnalysis.lib.util.NamedStream`), `parse` is called directly.
+    If the cache directory can not be used or the topology can not be stored
+    in a snapshot, a warning is issued and the parsed topology is returned.
+    """
+    if (isinstance(filename, util.NamedStream)
+            or not isinstance(filename, (str, os.PathLike))
+            or not os.path.isfile(filename)):
+        return parse()
+
+    topology = None
+    parsing = False
+    try:
+        os.makedirs(directory, exist_ok=True)
+        key = topology_key(filename, **params)
+        path = os.path.join(directory, key + '.top')
+        if not refresh:
+            cached = _load(path)
+            if cached is not None:
+                return cached
+        with _locked(path + '.lock'):
+            # another process may have parsed the file while we waited
+            cached = None if refresh else _load(path)
+            if cached is not None:
+                return cached
+            parsing = True
+            topology = parse()
+            parsing = False
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            os.close(fd)
+            try:
+                save_topology(topology, tmp)
+                os.replace(tmp, path)
+            except BaseException:
+                os.remove(tmp)
+                raise
+        return topology
+    except (IOError, OSError, TypeError) as err:
+        if parsing:
+            # the topology file itself could not be parsed, not the cache
+            raise
+        warnings.warn("Couldn't use the topology cache in {} because: "
+                      "{}".format(directory, err))
+        return topology if topology is not None else parse()
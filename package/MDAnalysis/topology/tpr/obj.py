@@ -32,6 +32,9 @@ Class definitions for the TPRParser
 
 """
 from collections import namedtuple
+
+import numpy as np
+
 from ..tables import Z2SYMB
 
 TpxHeader = namedtuple(
@@ -75,33 +78,6 @@ class MoleculeKind(object):
     def number_of_residues(self):
         return len({a.resid for a in self.atomkinds})
 
-    # remap_ method returns [tuple(), tuple(), ..] or []
-    # Note: in MDAnalysis, bonds, angles, etc are represented as tuple and not as list
-    def remap_bonds(self, atom_start_ndx):
-        if self.bonds:
-            return [tuple(i + atom_start_ndx for i in b) for b in self.bonds]
-        else:
-            return []
-
-    def remap_angles(self, atom_start_ndx):
-        if self.angles:
-            return [tuple(i + atom_start_ndx for i in a) for a in self.angles]
-        else:
-            return []
-
-    def remap_dihe(self, atom_start_ndx):
-        if self.dihe:
-            return [tuple(i + atom_start_ndx for i in a) for a in self.dihe]
-        else:
-            return []
-
-    def remap_impr(self, atom_start_ndx):
-        # improper
-        if self.impr:
-            return [tuple(i + atom_start_ndx for i in a) for a in self.impr]
-        else:
-            return []
-
 
 class AtomKind(object):
     def __init__(
@@ -151,5 +127,5 @@ class InteractionKind(object):
     def process(self, atom_ndx):
         # The format for all record is (type, atom1, atom2, ...)
         # but we are only interested in the atoms.
-        for cursor in range(0, len(atom_ndx), self.natoms + 1):
-            yield atom_ndx[cursor + 1: cursor + 1 + self.natoms]
+        atom_ndx = np.asarray(atom_ndx)
+        return atom_ndx.reshape(-1, self.natoms + 1)[:, 1:]
@@ -35,11 +35,12 @@ Function calling order::
    (TPRParser.py call do_mtop)
    do_mtop -> do_symtab
            -> do_ffparams -> do_iparams
-           -> do_moltype  -> do_atoms  -> do_atom
+           -> do_moltype  -> do_atoms  -> atom_dtype
                                        -> do_resinfo
                           -> do_ilists
                           -> do_block
                           -> do_blocka
+           -> _moltype_atom_arrays
            -> do_molblock
 
 Then compose the stuffs in the format :class:`MDAnalysis.Universe` reads in.
@@ -77,6 +78,10 @@ class TPXUnpacker(xdrlib.Unpacker):
     """
     Extend the standard XDR unpacker for the specificity of TPX files.
     """
+    # numpy types of the unsigned shorts and chars, stored as unsigned ints
+    ushort_dtype = np.dtype('>u4')
+    uchar_dtype = np.dtype('>u4')
+
     def __init__(self, data):
         super().__init__(data)
         self._buf = self.get_buffer()
@@ -106,6 +111,38 @@ class TPXUnpacker(xdrlib.Unpacker):
     def unpack_uint64(self):
         return self._unpack_value(8, '>Q')
 
+    def unpack_array(self, dtype, n):
+        """Unpack `n` consecutive values of type `dtype` at once
+
+        Parameters
+        ----------
+        dtype : numpy.dtype
+            big-endian, possibly structured, type of each value
+        n : int
+            number of values
+
+        Returns
+        -------
+        numpy.ndarray
+            read-only array of the values in the buffer
+        """
+        dtype = np.dtype(dtype)
+        if n < 0:
+            raise ValueError('Number of values cannot be negative.')
+        start_position = self._pos
+        end_position = start_position + dtype.itemsize * n
+        if end_position > len(self._buf):
+            raise EOFError
+        self._pos = end_position
+        return np.frombuffer(self._buf, dtype=dtype, count=n,
+                             offset=start_position)
+
+    @property
+    def real_dtype(self):
+        """numpy type of the reals, depending on the precision of the file"""
+        return np.dtype('>f8' if self.unpack_real == self.unpack_double
+                        else '>f4')
+
     def unpack_ushort(self):
         return self.unpack_uint()
 
@@ -136,6 +173,9 @@ class TPXUnpacker2020(TPXUnpacker):
     gromacs 2020, changes le meaning of some types in the file body (the header
     keep using the previous implementation of the serializer).
     """
+    ushort_dtype = np.dtype('>u2')
+    uchar_dtype = np.dtype('>u1')
+
     @classmethod
     def from_unpacker(cls, unpacker):
         new_unpacker = cls(unpacker.get_buffer())
@@ -178,13 +218,13 @@ class TPXUnpacker2020(TPXUnpacker):
 
 
 def ndo_int(data, n):
-    """mimic of gmx_fio_ndo_real in gromacs"""
-    return [data.unpack_int() for i in range(n)]
+    """mimic of gmx_fio_ndo_int in gromacs"""
+    return data.unpack_array('>i4', n).astype(np.int64)
 
 
 def ndo_real(data, n):
     """mimic of gmx_fio_ndo_real in gromacs"""
-    return [data.unpack_real() for i in range(n)]
+    return data.unpack_array(data.real_dtype, n).astype(np.float64)
 
 
 def do_rvec(data):
@@ -193,12 +233,12 @@ def do_rvec(data):
 
 def ndo_rvec(data, n):
     """mimic of gmx_fio_ndo_rvec in gromacs"""
-    return [data.unpack_farray(setting.DIM, data.unpack_real) for i in range(n)]
+    return ndo_real(data, n * setting.DIM).reshape(n, setting.DIM)
 
 
 def ndo_ivec(data, n):
-    """mimic of gmx_fio_ndo_rvec in gromacs"""
-    return [data.unpack_farray(setting.DIM, data.unpack_int) for i in range(n)]
+    """mimic of gmx_fio_ndo_ivec in gromacs"""
+    return ndo_int(data, n * setting.DIM).reshape(n, setting.DIM)
 
 
 def fileVersion_err(fver):
@@ -300,22 +340,12 @@ def do_mtop(data, fver):
 
     mtop = obj.Mtop(nmoltype, moltypes, nmolblock)
 
-    bonds = []
-    angles = []
-    dihedrals = []
-    impropers = []
-
-    atomids = []
-    segids = []
-    resids = []
-    resnames = []
-    atomnames = []
-    atomtypes = []
-    moltypes = []
-    molnums = []
-    charges = []
-    masses = []
-    elements = []
+    # per-atom arrays of each molecule type, repeated for every molecule of
+    # the molblocks using it
+    moltype_atoms = [_moltype_atom_arrays(mt) for mt in mtop.moltypes]
+
+    blocks = []
+    connections = {'bonds': [], 'angles': [], 'dihe': [], 'impr': []}
 
     atom_start_ndx = 0
     res_start_ndx = 0
@@ -323,34 +353,39 @@ def do_mtop(data, fver):
     for i in range(mtop.nmolblock):
         # molb_type is just an index for moltypes/molecule_types
         mb = do_molblock(data)
+        mt = mtop.moltypes[mb.molb_type]  # mt: molecule type
+        atoms = moltype_atoms[mb.molb_type]
         # segment is made to correspond to the molblock as in gromacs, the
         # naming is kind of arbitrary
-        molblock = mtop.moltypes[mb.molb_type].name.decode('utf-8')
+        molblock = mt.name.decode('utf-8')
         segid = f"seg_{i}_{molblock}"
-        for j in range(mb.molb_nmol):
-            mt = mtop.moltypes[mb.molb_type]  # mt: molecule type
-            for atomkind in mt.atomkinds:
-                atomids.append(atomkind.id + atom_start_ndx)
-                segids.append(segid)
-                resids.append(atomkind.resid + res_start_ndx)
-                resnames.append(atomkind.resname.decode())
-                atomnames.append(atomkind.name.decode())
-                atomtypes.append(atomkind.type.decode())
-                moltypes.append(molblock)
-                molnums.append(molnum)
-                charges.append(atomkind.charge)
-                masses.append(atomkind.mass)
-                elements.append(atomkind.element_symbol)
-            molnum += 1
-
-            # remap_ method returns [blah, blah, ..] or []
-            bonds.extend(mt.remap_bonds(atom_start_ndx))
-            angles.extend(mt.remap_angles(atom_start_ndx))
-            dihedrals.extend(mt.remap_dihe(atom_start_ndx))
-            impropers.extend(mt.remap_impr(atom_start_ndx))
-
-            atom_start_ndx += mt.number_of_atoms()
-            res_start_ndx += mt.number_of_residues()
+
+        nmol = mb.molb_nmol
+        n_atoms = mt.number_of_atoms()
+        n_residues = mt.number_of_residues()
+        mols = np.arange(nmol)
+        atom_offsets = atom_start_ndx + n_atoms * mols
+        res_offsets = res_start_ndx + n_residues * mols
+
+        block = {name: np.tile(values, nmol)
+                 for name, values in atoms.items()}
+        block['atomids'] = (atoms['atomids'] +
+                            atom_offsets[:, None]).ravel()
+        block['resids'] = (atoms['resids'] + res_offsets[:, None]).ravel()
+        block['segids'] = np.full(nmol * n_atoms, segid, dtype=object)
+        block['moltypes'] = np.full(nmol * n_atoms, molblock, dtype=object)
+        block['molnums'] = np.repeat(molnum + mols, n_atoms)
+        blocks.append(block)
+
+        for name, connection in connections.items():
+            indices = getattr(mt, name)
+            if indices is not None and nmol:
+                connection.append((indices + atom_offsets[:, None, None])
+                                  .reshape(-1, indices.shape[1]))
+
+        molnum += nmol
+        atom_start_ndx += nmol * n_atoms
+        res_start_ndx += nmol * n_residues
 
     # not useful here
 
@@ -361,17 +396,23 @@ def do_mtop(data, fver):
     # mtop_ffparams_cmap_grid_cmapdata     = 'NULL'
     # do_groups(data, symtab)
 
-    atomids = Atomids(np.array(atomids, dtype=np.int32))
-    atomnames = Atomnames(np.array(atomnames, dtype=object))
-    atomtypes = Atomtypes(np.array(atomtypes, dtype=object))
-    charges = Charges(np.array(charges, dtype=np.float32))
-    masses = Masses(np.array(masses, dtype=np.float32))
-
-    moltypes = np.array(moltypes, dtype=object)
-    molnums = np.array(molnums, dtype=np.int32)
-    segids = np.array(segids, dtype=object)
-    resids = np.array(resids, dtype=np.int32)
-    resnames = np.array(resnames, dtype=object)
+    def concatenate(name, dtype):
+        if not blocks:
+            return np.array([], dtype=dtype)
+        return np.concatenate([block[name] for block in blocks]).astype(dtype)
+
+    atomids = Atomids(concatenate('atomids', np.int32))
+    atomnames = Atomnames(concatenate('atomnames', object))
+    atomtypes = Atomtypes(concatenate('atomtypes', object))
+    charges = Charges(concatenate('charges', np.float32))
+    masses = Masses(concatenate('masses', np.float32))
+
+    moltypes = concatenate('moltypes', object)
+    molnums = concatenate('molnums', np.int32)
+    segids = concatenate('segids', object)
+    resids = concatenate('resids', np.int32)
+    resnames = concatenate('resnames', object)
+    elements = concatenate('elements', object)
     (residx, new_resids,
      (new_resnames,
       new_moltypes,
@@ -399,20 +440,40 @@ def do_mtop(data, fver):
                           segids],
                    atom_resindex=residx,
                    residue_segindex=segidx)
-    top.add_TopologyAttr(Bonds([bond for bond in bonds if bond]))
-    top.add_TopologyAttr(Angles([angle for angle in angles if angle]))
-    top.add_TopologyAttr(Dihedrals([dihedral for dihedral in dihedrals
-                                    if dihedral]))
-    top.add_TopologyAttr(Impropers([improper for improper in impropers
-                                    if improper]))
+    for attr, name in ((Bonds, 'bonds'), (Angles, 'angles'),
+                       (Dihedrals, 'dihe'), (Impropers, 'impr')):
+        values = connections[name]
+        values = np.concatenate(values) if values else []
+        top.add_TopologyAttr(attr(values))
 
     if any(elements):
-        elements = Elements(np.array(elements, dtype=object))
+        elements = Elements(elements)
         top.add_TopologyAttr(elements)
 
     return top
 
 
+def _moltype_atom_arrays(moltype):
+    """per-atom arrays of one molecule of `moltype`, as used by do_mtop"""
+    atomkinds = moltype.atomkinds
+
+    def values(func, dtype=object):
+        array = np.empty(len(atomkinds), dtype=dtype)
+        array[:] = [func(a) for a in atomkinds]
+        return array
+
+    return {
+        'atomids': values(lambda a: a.id, np.int64),
+        'resids': values(lambda a: a.resid, np.int64),
+        'resnames': values(lambda a: a.resname.decode(), object),
+        'atomnames': values(lambda a: a.name.decode(), object),
+        'atomtypes': values(lambda a: a.type.decode(), object),
+        'charges': values(lambda a: a.charge, np.float64),
+        'masses': values(lambda a: a.mass, np.float64),
+        'elements': values(lambda a: a.element_symbol, object),
+    }
+
+
 def do_symstr(data, symtab):
     # do_symstr: get a string based on index from the symtab
     ndx = data.unpack_int()
@@ -688,18 +749,15 @@ def do_moltype(data, symtab, fver):
     atoms_obj = do_atoms(data, symtab, fver)
 
     #### start: MDAnalysis specific
-    atomkinds = []
-    for k, a in enumerate(atoms_obj.atoms):
-        atomkinds.append(obj.AtomKind(
-            k,
-            atoms_obj.atomnames[k],
-            atoms_obj.type[k],
-            a.resind,
-            atoms_obj.resnames[a.resind],
-            a.m,
-            a.q,
-            a.atomnumber,
-        ))
+    atoms = atoms_obj.atoms
+    atomkinds = [
+        obj.AtomKind(k, name, tp, resind, atoms_obj.resnames[resind],
+                     m, q, atomnumber)
+        for k, (name, tp, resind, m, q, atomnumber) in enumerate(zip(
+            atoms_obj.atomnames, atoms_obj.type, atoms['resind'].tolist(),
+            atoms['m'].tolist(), atoms['q'].tolist(),
+            atoms['atomnumber'].tolist()))
+    ]
     #### end: MDAnalysis specific
 
     # key info: about bonds, angles, dih, improp dih.
@@ -719,16 +777,16 @@ def do_moltype(data, symtab, fver):
                                'CONNBONDS', 'HARMONIC', 'FENEBONDS',
                                'RESTRAINTPOT', 'CONSTR', 'CONSTRNC',
                                'TABBONDS', 'TABBONDSNC']:
-                bonds += list(ik_obj.process(ias))
+                bonds.append(ik_obj.process(ias))
             elif ik_obj.name in ['ANGLES', 'G96ANGLES', 'CROSS_BOND_BOND',
                                  'CROSS_BOND_ANGLE', 'UREY_BRADLEY', 'QANGLES',
                                  'RESTRANGLES', 'TABANGLES']:
-                angles += list(ik_obj.process(ias))
+                angles.append(ik_obj.process(ias))
             elif ik_obj.name in ['PDIHS', 'RBDIHS', 'RESTRDIHS', 'CBTDIHS',
                                  'FOURDIHS', 'TABDIHS']:
-                dihs += list(ik_obj.process(ias))
+                dihs.append(ik_obj.process(ias))
             elif ik_obj.name in ['IDIHS', 'PIDIHS']:
-                impr += list(ik_obj.process(ias))
+                impr.append(ik_obj.process(ias))
             elif ik_obj.name == 'SETTLE':
                 # SETTLE interactions are optimized triangular constraints for
                 # water molecules. They should be counted as a pair of bonds
@@ -738,26 +796,22 @@ def do_moltype(data, symtab, fver):
                 if len(ias) == 2:
                     # Old format. Only the first atom is specified.
                     base_atom = ias[1]
-                    bonds += [
-                        [base_atom, base_atom + 1],
-                        [base_atom, base_atom + 2],
-                    ]
+                    bonds.append(np.array([[base_atom, base_atom + 1],
+                                           [base_atom, base_atom + 2]]))
                 else:
                     all_settle = ik_obj.process(ias)
-                    for settle in all_settle:
-                        base_atom = settle[0]
-                        bonds += [
-                            [settle[0], settle[1]],
-                            [settle[0], settle[2]],
-                        ]
+                    # two bonds per settle, in the order of the settles
+                    bonds.append(np.stack([all_settle[:, [0, 1]],
+                                           all_settle[:, [0, 2]]],
+                                          axis=1).reshape(-1, 2))
             else:
                 # other interaction types are not interested at the moment
                 pass
 
-    bonds = bonds if bonds else None
-    angles = angles if angles else None
-    dihs = dihs if dihs else None
-    impr = impr if impr else None
+    bonds = np.concatenate(bonds) if bonds else None
+    angles = np.concatenate(angles) if angles else None
+    dihs = np.concatenate(dihs) if dihs else None
+    impr = np.concatenate(impr) if impr else None
     moltype = obj.MoleculeKind(molname, atomkinds, bonds, angles, dihs, impr)
     #### end: MDAnalysis specific
 
@@ -772,10 +826,8 @@ def do_atoms(data, symtab, fver):
     nr = data.unpack_int()  # number of atoms in a particular molecule
     nres = data.unpack_int()  # number of residues in a particular molecule
 
-    atoms = []
-    for i in range(nr):
-        A = do_atom(data, fver)
-        atoms.append(A)
+    # all the atoms at once, as a record array with the fields of obj.Atom
+    atoms = data.unpack_array(atom_dtype(data), nr)
 
     # do_strstr
     atomnames = [symtab[i] for i in ndo_int(data, nr)]
@@ -791,27 +843,24 @@ def do_resinfo(data, symtab, fver, nres):
     if fver < 63:
         resnames = [symtab[i] for i in ndo_int(data, nres)]
     else:
-        resnames = []
-        for i in range(nres):
-            resnames.append(symtab[data.unpack_int()])
-            data.unpack_int()
-            data.unpack_uchar()
+        resinfo = data.unpack_array([('name', '>i4'), ('nr', '>i4'),
+                                     ('ic', data.uchar_dtype)], nres)
+        resnames = [symtab[i] for i in resinfo['name'].tolist()]
     return resnames
 
 
-def do_atom(data, fver):
-    m = data.unpack_real()  # mass
-    q = data.unpack_real()  # charge
-    mB = data.unpack_real()
-    qB = data.unpack_real()
-    tp = data.unpack_ushort()  # type is a keyword in python
-    typeB = data.unpack_ushort()
-    ptype = data.unpack_int()  # regular atom, virtual site or others
-    resind = data.unpack_int()  # index of residue
+def atom_dtype(data):
+    """numpy type of the atom records read by do_atoms
 
-    atomnumber = data.unpack_int()  # index of atom type
-
-    return obj.Atom(m, q, mB, qB, tp, typeB, ptype, resind, atomnumber)
+    The fields are the ones of :class:`obj.Atom`: the mass, charge, mass B,
+    charge B (reals), type, type B (unsigned shorts), particle type, residue
+    index and atomic number (ints).
+    """
+    real = data.real_dtype
+    ushort = data.ushort_dtype
+    return np.dtype(list(zip(obj.Atom._fields,
+                             [real, real, real, real, ushort, ushort,
+                              '>i4', '>i4', '>i4'])))
 
 
 def do_ilists(data, fver):
@@ -830,10 +879,7 @@ def do_ilists(data, fver):
             # do_ilist
             n = data.unpack_int()
             nr.append(n)
-            l_ = []
-            for i in range(n):
-                l_.append(data.unpack_int())
-            iatoms.append(l_)
+            iatoms.append(ndo_int(data, n))
 
     return [
         obj.Ilist(n, it, i)
@@ -34,7 +34,9 @@ atoms of each molecule so that bons don't split over images.
 
 """
 
-from ..lib._cutil import make_whole
+import numpy as np
+
+from ..lib.mdamath import UnwrapPlan
 
 
 class wrap(object):
@@ -137,17 +139,22 @@ class unwrap(object):
 
     .. versionchanged:: 2.0.0
         The transformation was changed from a function/closure to a class
-        with ``__call__``.
+        with ``__call__``. The fragments and the traversal of their bonds are
+        computed once in an :class:`~MDAnalysis.lib.mdamath.UnwrapPlan`
+        instead of for every frame.
     """
     def __init__(self, ag):
         self.ag = ag
 
         try:
-            self.ag.fragments
+            fragments = self.ag.fragments
         except AttributeError:
             raise AttributeError("{} has no fragments".format(self.ag))
+        # whole fragments, including their atoms outside of ag
+        ix = [fragment.ix for fragment in fragments]
+        atoms = self.ag.universe.atoms[np.concatenate(ix) if ix else []]
+        self._plan = UnwrapPlan(atoms, compound='fragments')
 
     def __call__(self, ts):
-        for frag in self.ag.fragments:
-            make_whole(frag)
+        self._plan.unwrap()
         return ts
@@ -637,6 +637,7 @@ if __name__ == '__main__':
                   'sklearn',  # For clustering and dimensionality reduction
                               # functionality in encore
                   'tidynamics>=1.0.0', # For MSD analysis method
+                  'dask',  # for the dask backend of AnalysisBase.run
               ],
           },
           test_suite="MDAnalysisTests",
@@ -20,6 +20,8 @@
 # MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
 # J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
 #
+import shutil
+
 import pytest
 
 import numpy as np
@@ -123,6 +125,248 @@ def test_old_api(u):
     OldAPIAnalysis(u.trajectory).run()
 
 
+class CombinableFrameAnalysis(FrameAnalysis):
+    def _prepare(self):
+        self.found_frames = []
+
+    def _combine(self, blocks):
+        for block in blocks:
+            self.found_frames.extend(block.found_frames)
+
+
+@pytest.mark.parametrize('run_kwargs,frames', [
+    ({}, np.arange(98)),
+    ({'start': 20, 'stop': 50}, np.arange(20, 50)),
+    ({'step': 10}, np.arange(0, 98, 10)),
+    ({'start': 90}, np.arange(90, 98)),
+])
+@pytest.mark.parametrize('backend', ['serial', 'multiprocessing'])
+def test_parallel_backends(u, run_kwargs, frames, backend):
+    an = CombinableFrameAnalysis(u.trajectory).run(backend=backend,
+                                                   n_workers=3,
+                                                   **run_kwargs)
+    assert an.n_frames == len(frames)
+    assert_equal(an.found_frames, frames)
+    assert_equal(an.frames, frames, err_msg=FRAMES_ERR)
+    assert_almost_equal(an.times, frames+1, decimal=4, err_msg=TIMES_ERR)
+
+
+def test_parallel_dask(u):
+    pytest.importorskip('dask')
+    an = CombinableFrameAnalysis(u.trajectory).run(backend='dask',
+                                                   n_workers=2, step=5)
+    assert_equal(an.found_frames, np.arange(0, 98, 5))
+
+
+def test_parallel_more_workers_than_frames(u):
+    an = CombinableFrameAnalysis(u.trajectory).run(stop=3, n_workers=8)
+    assert_equal(an.found_frames, [0, 1, 2])
+
+
+def test_parallel_not_implemented(u):
+    with pytest.raises(NotImplementedError, match="_combine"):
+        FrameAnalysis(u.trajectory).run(backend='multiprocessing')
+
+
+def test_unknown_backend(u):
+    with pytest.raises(ValueError, match="backend"):
+        FrameAnalysis(u.trajectory).run(backend='mpi')
+
+
+class BatchFrameAnalysis(CombinableFrameAnalysis):
+    def __init__(self, reader, atoms=None, **kwargs):
+        super(BatchFrameAnalysis, self).__init__(reader, **kwargs)
+        self.atoms = atoms
+
+    def _prepare(self):
+        super(BatchFrameAnalysis, self)._prepare()
+        self._batch_atoms = self.atoms
+        self.batch_indices = []
+        self.positions = []
+
+    def _batch_frames(self, positions, boxes):
+        assert len(positions) == len(boxes)
+        n = len(positions)
+        self.batch_indices.append(self._frame_index)
+        self.found_frames.extend(
+            self.frames[self._frame_index:self._frame_index + n])
+        self.positions.extend(positions.copy())
+
+
+@pytest.mark.parametrize('batch_size', [1, 7, 98, 200])
+def test_batch_frames(u, batch_size):
+    an = BatchFrameAnalysis(u.trajectory).run(batch_size=batch_size)
+    assert_equal(an.found_frames, np.arange(98))
+    assert_equal(an.batch_indices, np.arange(0, 98, batch_size))
+    assert an.positions[0].shape == (u.atoms.n_atoms, 3)
+
+
+def test_batch_frames_atoms(u):
+    atoms = u.atoms[[20, 3, 10]]
+    an = BatchFrameAnalysis(u.trajectory, atoms=atoms).run(step=10,
+                                                          batch_size=4)
+    assert_equal(an.batch_indices, [0, 4, 8])
+    for ts, positions in zip(u.trajectory[::10], an.positions):
+        assert_equal(positions, atoms.positions)
+
+
+def test_batch_frames_parallel(u):
+    an = BatchFrameAnalysis(u.trajectory).run(start=5, batch_size=10,
+                                              n_workers=3)
+    assert_equal(an.found_frames, np.arange(5, 98))
+
+
+def test_batch_frames_not_implemented(u):
+    with pytest.raises(NotImplementedError, match="_batch_frames"):
+        FrameAnalysis(u.trajectory).run(batch_size=10)
+
+
+def test_batch_size_VE(u):
+    with pytest.raises(ValueError, match="batch_size"):
+        BatchFrameAnalysis(u.trajectory).run(batch_size=0)
+
+
+class KilledFrameAnalysis(CombinableFrameAnalysis):
+    """Dies when reaching frame `kill_at`, like a pre-empted job"""
+
+    def __init__(self, reader, kill_at=None, **kwargs):
+        super(KilledFrameAnalysis, self).__init__(reader, **kwargs)
+        self.kill_at = kill_at
+        self.n_single_frames = 0
+
+    def _prepare(self):
+        super(KilledFrameAnalysis, self)._prepare()
+        self.atoms = mda.Universe(PSF, DCD).atoms
+
+    def _single_frame(self):
+        if self._ts.frame == self.kill_at:
+            raise RuntimeError("killed")
+        self.n_single_frames += 1
+        super(KilledFrameAnalysis, self)._single_frame()
+
+
+@pytest.mark.parametrize('run_kwargs,frames,n_done', [
+    ({}, np.arange(98), 50),
+    ({'start': 5, 'step': 3}, np.arange(5, 98, 3), 10),
+])
+def test_checkpoint_resume(u, tmpdir, run_kwargs, frames, n_done):
+    checkpoint = str(tmpdir.join('checkpoint.npz'))
+    with pytest.raises(RuntimeError, match="killed"):
+        KilledFrameAnalysis(u.trajectory, kill_at=50).run(
+            checkpoint=checkpoint, checkpoint_every=10, **run_kwargs)
+
+    an = KilledFrameAnalysis(u.trajectory).run(
+        checkpoint=checkpoint, checkpoint_every=10, resume=True,
+        **run_kwargs)
+    assert_equal(an.found_frames, frames)
+    assert_equal(an.frames, frames, err_msg=FRAMES_ERR)
+    assert_almost_equal(an.times, frames+1, decimal=4, err_msg=TIMES_ERR)
+    # only the frames after the last checkpoint were analysed again
+    assert an.n_single_frames == len(frames) - n_done
+
+
+def test_checkpoint_resume_no_file(u, tmpdir):
+    checkpoint = str(tmpdir.join('checkpoint.npz'))
+    an = KilledFrameAnalysis(u.trajectory).run(
+        checkpoint=checkpoint, checkpoint_every=7, resume=True)
+    assert_equal(an.found_frames, np.arange(98))
+    assert an.n_single_frames == 98
+
+    # a finished run is not analysed again
+    an = KilledFrameAnalysis(u.trajectory).run(
+        checkpoint=checkpoint, checkpoint_every=7, resume=True)
+    assert_equal(an.found_frames, np.arange(98))
+    assert an.n_single_frames == 0
+
+
+def test_checkpoint_resume_other_frames(u, tmpdir):
+    checkpoint = str(tmpdir.join('checkpoint.npz'))
+    FrameAnalysis(u.trajectory).run(checkpoint=checkpoint, stop=10)
+    with pytest.raises(ValueError, match="frames"):
+        FrameAnalysis(u.trajectory).run(checkpoint=checkpoint, resume=True)
+
+
+class AtomsFrameAnalysis(FrameAnalysis):
+    def __init__(self, atoms, **kwargs):
+        super(AtomsFrameAnalysis, self).__init__(
+            atoms.universe.trajectory, **kwargs)
+        self._ag = atoms
+
+
+@pytest.mark.parametrize('other, match', [
+    (lambda u, dcd: KilledFrameAnalysis(u.trajectory), 'analysis'),
+    (lambda u, dcd: AtomsFrameAnalysis(mda.Universe(PSF, dcd).atoms[:10]),
+     'trajectory'),
+    (lambda u, dcd: AtomsFrameAnalysis(u.atoms[10:20]), 'atoms'),
+])
+def test_checkpoint_resume_other_analysis(u, tmpdir, other, match):
+    checkpoint = str(tmpdir.join('checkpoint.npz'))
+    dcd = str(tmpdir.join('copy.dcd'))
+    shutil.copy(DCD, dcd)
+    AtomsFrameAnalysis(u.atoms[:10]).run(checkpoint=checkpoint, stop=10)
+    an = other(u, dcd)
+    with pytest.raises(ValueError, match=match):
+        an.run(checkpoint=checkpoint, stop=10, resume=True)
+    # nothing of the checkpoint was restored
+    assert an.found_frames == []
+
+
+@pytest.mark.parametrize('run_kwargs', [
+    {'n_workers': 2},
+    {'backend': 'multiprocessing'},
+    {'checkpoint_every': 0},
+])
+def test_checkpoint_invalid(u, tmpdir, run_kwargs):
+    with pytest.raises(ValueError):
+        CombinableFrameAnalysis(u.trajectory).run(
+            checkpoint=str(tmpdir.join('checkpoint.npz')), **run_kwargs)
+
+
+def _identity_transformation(ts):
+    return ts
+
+
+@pytest.mark.parametrize('run_kwargs', [
+    {},
+    {'step': 3},
+    {'n_workers': 3},
+    {'batch_size': 4},
+])
+def test_profile(run_kwargs, caplog):
+    u = mda.Universe(PSF, DCD)
+    u.trajectory.add_transformations(_identity_transformation)
+    caplog.set_level('INFO', logger='MDAnalysis.analysis.base')
+    an = BatchFrameAnalysis(u.trajectory).run(profile=True, **run_kwargs)
+
+    assert set(an.timings) >= {'prepare', 'read', 'transformations',
+                               'single_frame', 'conclude', 'total'}
+    for phase in base.FRAME_PHASES:
+        assert an.frame_timings[phase].shape == (an.n_frames,)
+        assert np.all(an.frame_timings[phase] > 0)
+        assert_almost_equal(an.timings[phase],
+                            an.frame_timings[phase].sum())
+    if 'n_workers' not in run_kwargs:
+        assert an.timings['total'] >= sum(
+            t for phase, t in an.timings.items() if phase != 'total')
+    # the reader is left untouched
+    assert '_apply_transformations' not in vars(u.trajectory)
+    assert "Timings of BatchFrameAnalysis" in caplog.text
+
+
+def test_profile_checkpoint(u, tmpdir):
+    an = FrameAnalysis(u.trajectory).run(
+        profile=True, checkpoint=str(tmpdir.join('checkpoint.npz')),
+        checkpoint_every=20)
+    assert an.timings['checkpoint'] > 0
+    assert np.all(an.frame_timings['read'] > 0)
+
+
+def test_no_profile(u):
+    an = FrameAnalysis(u.trajectory).run()
+    assert not hasattr(an, 'timings')
+    assert '_apply_transformations' not in vars(u.trajectory)
+
+
 def test_filter_baseanalysis_kwargs_VE():
     def bad_f(mobile, verbose=2):
         pass
@@ -181,6 +425,15 @@ def test_AnalysisFromFunction(u, start, stop, step, nframes):
         assert_equal(results, ana.results)
 
 
+def test_AnalysisFromFunction_parallel(u):
+    ana = base.AnalysisFromFunction(simple_function, u.atoms)
+    ana.run(step=3, backend='multiprocessing', n_workers=4)
+
+    results = np.asarray([simple_function(u.atoms)
+                          for ts in u.trajectory[::3]])
+    assert_almost_equal(ana.results, results)
+
+
 def mass_xyz(atomgroup1, atomgroup2, masses):
     return atomgroup1.positions * masses
 
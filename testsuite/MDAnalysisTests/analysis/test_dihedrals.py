@@ -58,6 +58,33 @@ class TestDihedral(object):
                             err_msg="error: dihedral angles should "
                             "match test vales")
 
+    def test_dihedral_parallel(self, atomgroup):
+        dihedral = Dihedral([atomgroup]).run(backend='multiprocessing',
+                                             n_workers=2)
+        test_dihedral = np.load(DihedralArray)
+
+        assert_almost_equal(dihedral.angles, test_dihedral, 5,
+                            err_msg="error: dihedral angles should "
+                            "match test values")
+
+    def test_dihedral_batch(self, atomgroup):
+        dihedral = Dihedral([atomgroup, atomgroup[::-1]]).run(batch_size=4)
+        serial = Dihedral([atomgroup, atomgroup[::-1]]).run()
+
+        assert_almost_equal(dihedral.angles, serial.angles, 5)
+
+    def test_dihedral_batch_changing_box(self, atomgroup):
+        def grow_box(ts):
+            # the box changes in every frame
+            ts.dimensions[:3] *= 1 + 0.01 * ts.frame
+            return ts
+
+        atomgroup.universe.trajectory.add_transformations(grow_box)
+        dihedral = Dihedral([atomgroup]).run(batch_size=3)
+        serial = Dihedral([atomgroup]).run()
+
+        assert_almost_equal(dihedral.angles, serial.angles, 5)
+
     def test_atomgroup_list(self, atomgroup):
         dihedral = Dihedral([atomgroup, atomgroup]).run()
         test_dihedral = np.load(DihedralsArray)
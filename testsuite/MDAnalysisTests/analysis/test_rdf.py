@@ -22,10 +22,12 @@
 #
 import pytest
 
+from numpy.testing import assert_almost_equal, assert_equal
+
 import MDAnalysis as mda
 from MDAnalysis.analysis.rdf import InterRDF
 
-from MDAnalysisTests.datafiles import two_water_gro
+from MDAnalysisTests.datafiles import two_water_gro, GRO_MEMPROT, XTC_MEMPROT
 
 
 @pytest.fixture(scope='module')
@@ -83,6 +85,29 @@ def test_double_run(sels):
     assert len(rdf.count[rdf.count == 4]) == 2
 
 
+def test_parallel():
+    u = mda.Universe(GRO_MEMPROT, XTC_MEMPROT)
+    s1 = u.select_atoms('name OD1 OD2')
+    s2 = u.select_atoms('name ZND')
+    serial = InterRDF(s1, s2, range=(0, 8)).run()
+    parallel = InterRDF(s1, s2, range=(0, 8)).run(backend='multiprocessing',
+                                                  n_workers=2)
+    assert_equal(parallel.count, serial.count)
+    assert_almost_equal(parallel.rdf, serial.rdf)
+
+
+@pytest.mark.parametrize('exclusion_block', [None, (1, 2)])
+def test_batch(exclusion_block):
+    u = mda.Universe(GRO_MEMPROT, XTC_MEMPROT)
+    s1 = u.select_atoms('name OD1 OD2')
+    s2 = u.select_atoms('name OD1 OD2 ZND')
+    kwargs = dict(range=(0, 8), exclusion_block=exclusion_block)
+    serial = InterRDF(s1, s2, **kwargs).run()
+    batch = InterRDF(s1, s2, **kwargs).run(batch_size=2)
+    assert_equal(batch.count, serial.count)
+    assert_almost_equal(batch.rdf, serial.rdf)
+
+
 def test_exclusion(sels):
     # should see two distances with 4 counts each
     s1, s2 = sels
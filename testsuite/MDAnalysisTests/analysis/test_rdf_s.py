@@ -22,7 +22,7 @@
 #
 import pytest
 
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_equal
 
 import MDAnalysis as mda
 from MDAnalysis.analysis.rdf import InterRDF_s, InterRDF
@@ -88,6 +88,16 @@ def test_count(rdf):
     assert len(rdf.count[1][1][0][rdf.count[1][1][0] == 3]) == 1
 
 
+def test_parallel(u, sels, rdf):
+    parallel = InterRDF_s(u, sels).run(backend='multiprocessing',
+                                       n_workers=2)
+    for count, parallel_count in zip(rdf.count, parallel.count):
+        assert_equal(parallel_count, count)
+    for rdf_i, parallel_rdf_i in zip(rdf.rdf, parallel.rdf):
+        assert_almost_equal(parallel_rdf_i, rdf_i)
+    assert_almost_equal(parallel.volume, rdf.volume)
+
+
 def test_double_run(rdf):
     # running rdf twice should give the same result
     assert len(rdf.count[0][0][1][rdf.count[0][0][1] == 5]) == 1
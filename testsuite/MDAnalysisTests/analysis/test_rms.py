@@ -312,6 +312,23 @@ class TestRMSD(object):
                             err_msg="error: rmsd profile should match"
                             "test values")
 
+    @pytest.mark.parametrize('groupselections', [[], ['backbone']])
+    def test_rmsd_parallel(self, universe, groupselections):
+        kwargs = dict(select='name CA', groupselections=groupselections)
+        serial = rms.RMSD(universe, **kwargs).run(step=7)
+        parallel = rms.RMSD(universe, **kwargs).run(
+            step=7, backend='multiprocessing', n_workers=3)
+        assert_almost_equal(parallel.rmsd, serial.rmsd, 6)
+
+    @pytest.mark.parametrize('groupselections', [[], ['backbone', 'name O']])
+    @pytest.mark.parametrize('weights', [None, 'mass'])
+    def test_rmsd_batch(self, universe, groupselections, weights):
+        kwargs = dict(select='name CA', groupselections=groupselections,
+                      weights=weights)
+        serial = rms.RMSD(universe, **kwargs).run(step=3)
+        batch = rms.RMSD(universe, **kwargs).run(step=3, batch_size=8)
+        assert_almost_equal(batch.rmsd, serial.rmsd, 4)
+
     def test_rmsd_backbone_and_group_selection(self, universe,
                                                correct_values_backbone_group):
         RMSD = MDAnalysis.analysis.rms.RMSD(
@@ -503,6 +503,92 @@ class MultiframeReaderTest(BaseReaderTest):
                                          ref.iter_ts(ref.aux_lowf_frames_with_steps[i]),
                                          decimal=ref.prec)
 
+    @pytest.mark.parametrize('frames', [slice(None), slice(1, None, 2),
+                                        [4, 0, 3, 2]])
+    def test_prefetch(self, ref, reader, frames):
+        reader.prefetch(n_frames=2)
+        n_frames = 0
+        for ts in reader[frames]:
+            assert_timestep_almost_equal(ts, ref.iter_ts(ts.frame),
+                                         decimal=ref.prec)
+            n_frames += 1
+        assert n_frames == len(np.arange(ref.n_frames)[frames])
+
+    def test_prefetch_iter(self, ref, reader):
+        reader.prefetch(n_frames=3)
+        for i, ts in enumerate(reader):
+            assert ts is reader.ts
+            assert_timestep_almost_equal(ts, ref.iter_ts(i),
+                                         decimal=ref.prec)
+        assert i == ref.n_frames - 1
+        # rewound like without prefetching
+        assert_equal(reader.ts.frame, 0)
+
+    def test_prefetch_break(self, ref, reader):
+        reader.prefetch()
+        for ts in reader:
+            if ts.frame == 2:
+                break
+        assert_equal(reader.ts.frame, 2)
+        assert_timestep_almost_equal(next(reader), ref.iter_ts(3),
+                                     decimal=ref.prec)
+
+    def test_prefetch_transformations(self, ref, transformed):
+        transformed.prefetch(n_frames=2)
+        v1 = np.float32((1,1,1))
+        v2 = np.float32((0,0,0.33))
+        for i, ts in enumerate(transformed):
+            idealcoords = ref.iter_ts(i).positions + v1 + v2
+            assert_array_almost_equal(ts.positions, idealcoords,
+                                      decimal=ref.prec)
+
+    def test_prefetch_negative(self, reader):
+        with pytest.raises(ValueError):
+            reader.prefetch(-1)
+
+    @pytest.mark.parametrize('sl', [slice(None), slice(1, None, 2),
+                                    slice(None, None, -2)])
+    @pytest.mark.parametrize('atom_indices', [None, [4, 0, 3]])
+    def test_read_block(self, ref, reader, sl, atom_indices):
+        reader[1]
+        positions, dimensions = reader.read_block(sl.start, sl.stop, sl.step,
+                                                  atom_indices=atom_indices)
+        # the current frame is kept
+        assert_timestep_almost_equal(reader.ts, ref.iter_ts(1),
+                                     decimal=ref.prec)
+        frames = np.arange(ref.n_frames)[sl]
+        ix = slice(None) if atom_indices is None else atom_indices
+        assert positions.shape == (len(frames),
+                                   len(np.arange(ref.n_atoms)[ix]), 3)
+        for k, i in enumerate(frames):
+            ts = reader[i]
+            assert_array_almost_equal(positions[k], ts.positions[ix],
+                                      decimal=ref.prec)
+            if ts.dimensions is not None:
+                assert_array_almost_equal(dimensions[k], ts.dimensions,
+                                          decimal=ref.prec)
+
+    def test_read_block_out(self, ref, reader):
+        out = np.empty((2, ref.n_atoms, 3), dtype=np.float32)
+        positions, _ = reader.read_block(1, 3, out=out)
+        assert positions is out
+        assert_array_almost_equal(out[1], ref.iter_ts(2).positions,
+                                  decimal=ref.prec)
+
+    def test_read_block_wrong_out(self, ref, reader):
+        with pytest.raises(ValueError):
+            reader.read_block(0, 3, out=np.empty((2, ref.n_atoms, 3),
+                                                 dtype=np.float32))
+
+    def test_read_block_transformations(self, ref, transformed):
+        positions, _ = transformed.read_block()
+        v1 = np.float32((1,1,1))
+        v2 = np.float32((0,0,0.33))
+        for i in range(ref.n_frames):
+            idealcoords = ref.iter_ts(i).positions + v1 + v2
+            assert_array_almost_equal(positions[i], idealcoords,
+                                      decimal=ref.prec)
+
     #  To make sure we not only save the current timestep information,
     #  but also maintain its relative position.
     def test_pickle_next_ts_reader(self, reader):
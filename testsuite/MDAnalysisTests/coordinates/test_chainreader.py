@@ -22,12 +22,14 @@
 #
 import numpy as np
 import os
+import pickle
 
 import pytest
 
 from numpy.testing import (assert_equal, assert_almost_equal)
 
 import MDAnalysis as mda
+from MDAnalysis.coordinates import offsets
 from MDAnalysis.transformations import translate
 from MDAnalysisTests.datafiles import (PDB, PSF, CRD, DCD,
                                        GRO, XTC, TRR, PDB_small, PDB_closed)
@@ -172,6 +174,50 @@ class TestChainReader(object):
         transformed.trajectory.rewind()
         assert_almost_equal(transformed.trajectory.ts.positions, ref, decimal = 6)
 
+    def test_open_threads(self, universe):
+        u = mda.Universe(PSF, [DCD, CRD, DCD, CRD, DCD, CRD, CRD],
+                         open_threads=3)
+        assert_equal(u.trajectory._start_frames,
+                     universe.trajectory._start_frames)
+        assert_equal(u.trajectory.dts, universe.trajectory.dts)
+        for ts, ref_ts in zip(u.trajectory[::20], universe.trajectory[::20]):
+            assert_equal(ts.positions, ref_ts.positions)
+
+    def test_prefetch_next(self, universe):
+        u = mda.Universe(PSF, [DCD, CRD, DCD, CRD, DCD, CRD, CRD],
+                         prefetch_next=True)
+        assert u.trajectory._read_ahead_index == 1
+        for ts, ref_ts in zip(u.trajectory, universe.trajectory):
+            assert_equal(ts.positions, ref_ts.positions)
+        assert u.trajectory._read_ahead_index == 6
+        u.trajectory.close()
+        assert u.trajectory._read_ahead is None
+
+    def test_prefetch_next_cancel(self):
+        u = mda.Universe(PSF, [DCD, CRD, DCD, CRD, DCD], prefetch_next=True)
+        stop = u.trajectory._read_ahead_job[1]
+        # jump from the first to the last trajectory and back to the third
+        u.trajectory[-1]
+        # a queued read is cancelled, a running one is stopped
+        assert stop.is_set()
+        assert u.trajectory._read_ahead_job is None
+        u.trajectory[100]
+        assert u.trajectory._read_ahead_index == 3
+        stop = u.trajectory._read_ahead_job[1]
+        u.trajectory.close()
+        assert stop.is_set()
+        assert u.trajectory._read_ahead_job is None
+
+    def test_prefetch_next_pickle(self):
+        u = mda.Universe(PSF, [DCD, CRD, DCD], prefetch_next=True)
+        u.trajectory[50]
+        new = pickle.loads(pickle.dumps(u.trajectory))
+        assert new._read_ahead is None
+        assert_equal(new.ts.positions, u.trajectory.ts.positions)
+        new[98]
+        assert new._read_ahead_index == 2
+
+
 class TestChainReaderCommonDt(object):
     common_dt = 100.0
     prec = 3
@@ -316,6 +362,33 @@ class TestChainReaderContinuous(object):
         u = mda.Universe(utop._topology, fnames, continuous=True)
         assert_equal(u.trajectory._start_frames, [0, 2, 4])
 
+    def test_open_threads(self, tmpdir):
+        sequences = ([5, 6, 7, 8, 9], [2, 3, 4, 5, 6], [0, 1, 2, 3])
+        utop, fnames = build_trajectories(str(tmpdir), sequences=sequences)
+        u = mda.Universe(utop._topology, fnames, continuous=True,
+                         open_threads=3)
+        assert_equal(u.trajectory._start_frames, [0, 2, 5])
+        assert_almost_equal([ts.time for ts in u.trajectory], np.arange(10),
+                            decimal=4)
+
+    def test_metadata_cache(self, tmpdir):
+        sequences = ([0, 1, 2, 3], [2, 3, 4, 5], [4, 5, 6, 7])
+        utop, fnames = build_trajectories(str(tmpdir.mkdir('traj')),
+                                          sequences=sequences)
+        offsets.set_offsets_dir(str(tmpdir.mkdir('cache')))
+        try:
+            u = mda.Universe(utop._topology, fnames, continuous=True)
+            # offsets and metadata of each trajectory
+            assert len([f for f in os.listdir(str(tmpdir.join('cache')))
+                        if f.endswith('.npz')]) == 6
+            cached = mda.Universe(utop._topology, fnames, continuous=True)
+        finally:
+            offsets.set_offsets_dir(None)
+        assert_equal(cached.trajectory._start_frames,
+                     u.trajectory._start_frames)
+        assert_almost_equal(cached.trajectory.total_times,
+                            u.trajectory.total_times)
+
     def test_missing(self, tmpdir):
         folder = str(tmpdir)
         sequences = ([0, 1, 2, 3], [5, 6, 7, 8, 9])
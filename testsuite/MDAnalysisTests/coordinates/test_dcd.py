@@ -20,6 +20,9 @@
 # MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
 # J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
 #
+from functools import partial
+import pickle
+
 import numpy as np
 
 import MDAnalysis as mda
@@ -86,6 +89,45 @@ class TestDCDReader(MultiframeReaderTest):
                             decimal=5)
 
 
+class DCDMmapReference(DCDReference):
+    def __init__(self):
+        super(DCDMmapReference, self).__init__()
+        self.reader = partial(mda.coordinates.DCD.DCDReader, mmap=True)
+
+
+class TestDCDReaderMmap(MultiframeReaderTest):
+    @staticmethod
+    @pytest.fixture()
+    def ref():
+        return DCDMmapReference()
+
+    @pytest.mark.parametrize("order", ("fac", "fca", "afc", "acf", "caf",
+                                       "cfa"))
+    def test_timeseries_view(self, ref, reader, order):
+        xyz = reader.timeseries(order=order)
+        ref_xyz = DCDReader(ref.trajectory).timeseries(order=order)
+        assert_array_equal(xyz, ref_xyz)
+        assert np.shares_memory(xyz, reader._mmap_xyz)
+        assert not xyz.flags.writeable
+
+    def test_timeseries_atoms(self, ref, reader):
+        u = mda.Universe(ref.topology, ref.trajectory)
+        ag = u.atoms[[4, 1, 2]]
+        assert_array_equal(
+            reader.timeseries(ag, 1, 4, order='afc'),
+            DCDReader(ref.trajectory).timeseries(ag, 1, 4, order='afc'))
+
+    def test_timeseries_wrong_order(self, reader):
+        with pytest.raises(ValueError, match="unkown order"):
+            reader.timeseries(order='fxa')
+
+    def test_pickle(self, reader):
+        # the mapped file is not copied into the pickle but mapped again
+        assert reader.__getstate__()['_mmap_xyz'] is None
+        reader_p = pickle.loads(pickle.dumps(reader))
+        assert_array_equal(reader_p._mmap_xyz, reader._mmap_xyz)
+
+
 @pytest.mark.parametrize('fstart', (0, 1, 2, 37, None))
 def test_write_istart(universe_dcd, tmpdir, fstart):
     outfile = str(tmpdir.join('test.dcd'))
@@ -371,6 +413,37 @@ def test_write_unitcell_triclinic(ref, tmpdir):
                                 "at frame {0}".format(ts_orig.frame))
 
 
+@pytest.mark.parametrize("ref", (RefCHARMMtriclinicDCD, RefNAMDtriclinicDCD))
+def test_mmap_unitcell_triclinic(ref):
+    u = mda.Universe(ref.topology, ref.trajectory, mmap=True)
+    for ts, box in zip(u.trajectory, ref.ref_dimensions[:, 1:]):
+        assert_array_almost_equal(ts.dimensions, box, 4)
+
+
+def test_mmap_big_endian(tmpdir):
+    # byte-swap every 4 byte field of COORDINATES_DCD; the halves of the
+    # doubles in the unit cell records then have to be swapped as well
+    ref = DCDReader(COORDINATES_DCD)
+    raw = np.fromfile(COORDINATES_DCD, dtype='<i4')
+    data = raw.byteswap()
+    # keep the "CORD" signature and the title lines
+    n_title = raw[24]
+    data[1] = raw[1]
+    data[25:25 + 20 * n_title] = raw[25:25 + 20 * n_title]
+    for frame in range(ref.n_frames):
+        start = (ref._file._header_size + frame * ref._file._framesize) // 4
+        cell = data[start + 1:start + 13].reshape(6, 2)
+        cell[:] = cell[:, ::-1].copy()
+    outfile = str(tmpdir.join('big_endian.dcd'))
+    data.tofile(outfile)
+
+    reader = DCDReader(outfile, mmap=True)
+    for ts, ref_ts in zip(reader, ref):
+        assert_array_almost_equal(ts.positions, ref_ts.positions)
+        assert_array_almost_equal(ts.dimensions, ref_ts.dimensions)
+    assert reader.timeseries().dtype == np.float32
+
+
 @pytest.fixture(scope='module')
 def ncdf2dcd(tmpdir_factory):
     pytest.importorskip("netCDF4")
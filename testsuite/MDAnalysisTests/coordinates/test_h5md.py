@@ -24,6 +24,7 @@ class H5MDReference(BaseReference):
         self.trajectory = COORDINATES_H5MD
         self.topology = COORDINATES_TOPOLOGY
         self.reader = mda.coordinates.H5MD.H5MDReader
+        self.writer = mda.coordinates.H5MD.H5MDWriter
         self.ext = 'h5md'
         self.prec = 3
         self.changing_dimensions = True
@@ -52,29 +53,178 @@ class H5MDReference(BaseReference):
 
 @pytest.mark.skipif(not HAS_H5PY, reason="h5py not installed")
 class TestH5MDReader(MultiframeReaderTest):
-    """Tests H5MDReader with MultiframeReaderTest.
-    get_writer tests are marked with expected to fail since
-    H5MDWriter is not implemented yet."""
+    """Tests H5MDReader with MultiframeReaderTest."""
     @staticmethod
     @pytest.fixture()
     def ref():
         return H5MDReference()
 
-    @pytest.mark.xfail(reason='H5MD writer not implemented yet')
-    def test_get_writer_1(self, ref, reader, tmpdir):
-        with tmpdir.as_cwd():
-            outfile = 'test-writer.' + ref.ext
-            with reader.Writer(outfile) as W:
-                assert_equal(isinstance(W, ref.writer), True)
-                assert_equal(W.n_atoms, reader.n_atoms)
-
-    @pytest.mark.xfail(reason='H5MD writer not implemented yet')
-    def test_get_writer_2(self, ref, reader, tmpdir):
-        with tmpdir.as_cwd():
-            outfile = 'test-writer.' + ref.ext
-            with reader.Writer(outfile, n_atoms=100) as W:
-                assert_equal(isinstance(W, ref.writer), True)
-                assert_equal(W.n_atoms, 100)
+    def test_chunk_cache(self, ref, reader):
+        for ts in reader:
+            pass
+        # the chunks of all datasets fit into the default cache
+        assert reader._chunk_cache
+        uncached = ref.reader(ref.trajectory, chunk_cache=0)
+        for ts, ref_ts in zip(reader, uncached):
+            assert_timestep_almost_equal(ts, ref_ts, decimal=ref.prec)
+        assert not uncached._chunk_cache
+
+    def test_chunk_cache_evict(self, ref):
+        # positions do not fit, the 1D datasets only one at a time
+        reader = ref.reader(ref.trajectory, chunk_cache=64)
+        uncached = ref.reader(ref.trajectory, chunk_cache=0)
+        for ts, ref_ts in zip(reader[::-1], uncached[::-1]):
+            assert_timestep_almost_equal(ts, ref_ts, decimal=ref.prec)
+            assert ts.data['time'] == ref_ts.data['time']
+            assert reader._chunk_cache_nbytes <= 64
+
+    @pytest.mark.parametrize('start, stop, step', [
+        (None, None, -1), (3, 0, -2), (1, 5, 2)])
+    def test_read_block_slices(self, ref, reader, start, stop, step):
+        positions, dimensions = reader.read_block(start, stop, step)
+        frames = range(*reader.check_slice_indices(start, stop, step))
+        for k, i in enumerate(frames):
+            ts = reader[i]
+            assert_almost_equal(positions[k], ts.positions, decimal=ref.prec)
+            assert_almost_equal(dimensions[k], ts.dimensions,
+                                decimal=ref.prec)
+
+
+@pytest.mark.skipif(not HAS_H5PY, reason="h5py not installed")
+class TestH5MDWriter(BaseWriterTest):
+    @staticmethod
+    @pytest.fixture()
+    def ref():
+        return H5MDReference()
+
+    @pytest.mark.parametrize('compression, opts', [
+        (None, None), ('gzip', 9), ('lzf', None)])
+    def test_compression(self, ref, reader, universe, tmpdir, compression,
+                         opts):
+        outfile = str(tmpdir.join('compressed.h5md'))
+        with ref.writer(outfile, universe.atoms.n_atoms, chunks=(2, 5, 3),
+                        compression=compression,
+                        compression_opts=opts) as W:
+            for ts in universe.trajectory:
+                W.write(universe)
+        with h5py.File(outfile, 'r') as f:
+            value = f['particles/trajectory/position/value']
+            assert value.chunks == (2, 5, 3)
+            assert value.compression == compression
+            assert value.compression_opts == opts
+        self._check_copy(outfile, ref, reader)
+
+    def test_wrong_compression(self, ref, tmpdir):
+        with pytest.raises(ValueError, match='compression'):
+            ref.writer(str(tmpdir.join('out.h5md')), 5, compression='bz2')
+
+    def test_no_velocities_forces(self, ref, universe, tmpdir):
+        outfile = str(tmpdir.join('positions.h5md'))
+        with ref.writer(outfile, universe.atoms.n_atoms, velocities=False,
+                        forces=False) as W:
+            for ts in universe.trajectory:
+                W.write(universe)
+        u = mda.Universe(ref.topology, outfile)
+        assert u.trajectory.has_positions
+        assert not u.trajectory.has_velocities
+        assert not u.trajectory.has_forces
+        for ts, ref_ts in zip(u.trajectory, universe.trajectory):
+            assert_almost_equal(ts.positions, ref_ts.positions,
+                                decimal=ref.prec)
+
+    def test_n_frames(self, ref, reader, universe, tmpdir):
+        # frames reserved but not written are dropped on closing
+        outfile = str(tmpdir.join('n_frames.h5md'))
+        with ref.writer(outfile, universe.atoms.n_atoms,
+                        n_frames=2 * reader.n_frames) as W:
+            for ts in universe.trajectory:
+                W.write(universe)
+        self._check_copy(outfile, ref, reader)
+
+    def test_write_block(self, ref, reader, tmpdir):
+        outfile = str(tmpdir.join('block.h5md'))
+        times = [ts.time for ts in reader]
+        with ref.writer(outfile, reader.n_atoms) as W:
+            for start in range(0, reader.n_frames, 2):
+                positions, dimensions = reader.read_block(start, start + 2)
+                frames = slice(start, start + 2)
+                W.write_block(positions, dimensions,
+                              velocities=positions / 10,
+                              forces=positions / 100,
+                              times=times[frames])
+        self._check_copy(outfile, ref, reader)
+
+    def test_write_block_missing(self, ref, reader, tmpdir):
+        positions, dimensions = reader.read_block(0, 2)
+        with ref.writer(str(tmpdir.join('out.h5md')), reader.n_atoms) as W:
+            W.write_block(positions, dimensions, velocities=positions)
+            with pytest.raises(NoDataError):
+                W.write_block(positions, dimensions)
+
+    def test_write_block_shape(self, ref, reader, tmpdir):
+        positions, dimensions = reader.read_block(0, 2)
+        with ref.writer(str(tmpdir.join('out.h5md')), 3) as W:
+            with pytest.raises(ValueError):
+                W.write_block(positions, dimensions)
+
+    @pytest.mark.parametrize('kwargs', [
+        {'times': np.arange(3)},
+        {'steps': np.arange(3)},
+        {'dimensions': np.ones((3, 6))},
+        {'positions': None},
+    ])
+    def test_write_block_invalid(self, ref, reader, tmpdir, kwargs):
+        outfile = str(tmpdir.join('out.h5md'))
+        positions, dimensions = reader.read_block(0, 2)
+        block = dict(positions=positions, dimensions=dimensions)
+        block.update(kwargs)
+        with ref.writer(outfile, reader.n_atoms) as W:
+            with pytest.raises(ValueError):
+                W.write_block(**block)
+            # nothing is created before the block is checked
+            assert 'particles' not in W._file
+            W.write_block(positions, dimensions)
+            with pytest.raises(ValueError):
+                W.write_block(**block)
+            # and nothing is grown
+            value = W._file['particles/trajectory/position/value']
+            assert value.shape[0] == 2
+            assert W._file['particles/trajectory/box/edges/value'].shape[0] == 2
+        u = mda.Universe(ref.topology, outfile)
+        assert u.trajectory.n_frames == 2
+        assert_almost_equal(u.trajectory.read_block(0, 2)[0], positions,
+                            decimal=ref.prec)
+
+    def test_write_no_box(self, ref, tmpdir):
+        outfile = str(tmpdir.join('nobox.h5md'))
+        u = mda.Universe.empty(5, trajectory=True)
+        u.atoms.positions = np.arange(15).reshape(5, 3)
+        with ref.writer(outfile, u.atoms.n_atoms) as W:
+            W.write(u)
+        with h5py.File(outfile, 'r') as f:
+            box = f['particles/trajectory/box']
+            assert 'edges' not in box
+            assert_array_equal(box.attrs['boundary'], 3 * [b'none'])
+        u2 = mda.Universe.empty(5)
+        u2.load_new(outfile, format='H5MD')
+        assert u2.trajectory.ts.dimensions is None
+        assert_almost_equal(u2.atoms.positions, u.atoms.positions)
+
+    def test_write_box_after_no_box(self, ref, reader, tmpdir):
+        positions, dimensions = reader.read_block(0, 2)
+        with ref.writer(str(tmpdir.join('out.h5md')), reader.n_atoms) as W:
+            W.write_block(positions)
+            with pytest.warns(UserWarning, match='box'):
+                W.write_block(positions, dimensions)
+            # only warned once
+            with pytest.warns(None) as record:
+                W.write_block(positions, dimensions)
+            assert not [w for w in record if 'box' in str(w.message)]
+
+    def test_wrong_n_atoms(self, ref, universe, tmpdir):
+        with ref.writer(str(tmpdir.join('out.h5md')), 3) as W:
+            with pytest.raises(IOError):
+                W.write(universe)
 
 
 # The tests below test an example trajectory H5MD_xvf
@@ -20,12 +20,19 @@
 # MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
 # J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
 #
+import os
+import pickle
+
 import numpy as np
 
 import MDAnalysis as mda
 import pytest
-from MDAnalysis.coordinates.memory import MemoryReader
-from MDAnalysisTests.datafiles import DCD, PSF
+from MDAnalysis.coordinates import memory
+from MDAnalysis.coordinates.memory import (MemoryReader,
+                                           CompressedMemoryReader)
+from MDAnalysis.transformations import translate
+from MDAnalysisTests.datafiles import (DCD, PSF, COORDINATES_TOPOLOGY,
+                                       COORDINATES_TRR)
 from MDAnalysisTests.coordinates.base import (BaseReference,
                                               MultiframeReaderTest)
 from MDAnalysis.coordinates.memory import Timestep
@@ -370,3 +377,198 @@ class TestMemoryReaderModifications(object):
         with pytest.raises(TypeError):
             mr = MemoryReader(np.zeros((10, 30, 3)),
                               **{attr: 'not an array'})
+
+
+class TestMemoryReaderMmap(object):
+    @staticmethod
+    @pytest.fixture()
+    def cache(tmpdir):
+        return str(tmpdir.join('positions.npy'))
+
+    @staticmethod
+    @pytest.fixture()
+    def universe(cache):
+        u = mda.Universe(PSF, DCD)
+        u.transfer_to_memory(cache_file=cache)
+        return u
+
+    def test_mapped(self, universe, cache):
+        array = universe.trajectory.coordinate_array
+        assert isinstance(array, np.memmap)
+        assert array.filename == os.path.abspath(cache)
+
+    @pytest.mark.parametrize('start, stop, step', [
+        (None, None, None),
+        (10, 30, 2),
+        (None, None, -3),
+        (-10, None, None),
+    ])
+    def test_transfer(self, start, stop, step, cache, monkeypatch):
+        # several blocks per trajectory
+        monkeypatch.setattr(memory, '_CACHE_BLOCK_BYTES', 3341 * 12 * 4)
+        ref = mda.Universe(PSF, DCD)
+        ref.transfer_to_memory(start=start, stop=stop, step=step)
+        u = mda.Universe(PSF, DCD)
+        u.transfer_to_memory(start=start, stop=stop, step=step,
+                             cache_file=cache)
+        assert_equal(u.trajectory.timeseries(), ref.trajectory.timeseries())
+        assert_equal(u.trajectory.dimensions_array,
+                     ref.trajectory.dimensions_array)
+        assert_almost_equal(u.trajectory.dt, ref.trajectory.dt)
+
+    def test_reuse(self, universe, cache):
+        u = mda.Universe(PSF, np.load(cache, mmap_mode='r'),
+                         format=MemoryReader)
+        assert_equal(u.trajectory.timeseries(),
+                     universe.trajectory.timeseries())
+
+    def test_velocities_forces(self, tmpdir):
+        cache = str(tmpdir.join('trr.npy'))
+        ref = mda.Universe(COORDINATES_TOPOLOGY, COORDINATES_TRR)
+        u = mda.Universe(COORDINATES_TOPOLOGY, COORDINATES_TRR)
+        u.transfer_to_memory(cache_file=cache)
+        for name in ('trr_velocities.npy', 'trr_forces.npy'):
+            assert os.path.exists(str(tmpdir.join(name)))
+        for ts, ref_ts in zip(u.trajectory, ref.trajectory):
+            assert_almost_equal(ts.positions, ref_ts.positions)
+            assert_almost_equal(ts.velocities, ref_ts.velocities)
+            assert_almost_equal(ts.forces, ref_ts.forces)
+            assert_almost_equal(ts.dimensions, ref_ts.dimensions)
+
+    def test_copy(self, universe, cache):
+        copy = universe.trajectory.copy()
+        assert isinstance(copy.coordinate_array, np.memmap)
+        copy[5].positions = 7
+        assert_almost_equal(copy[5].positions, 7)
+        assert not np.any(universe.trajectory[5].positions == 7)
+        assert not np.any(np.load(cache)[5] == 7)
+
+    def test_pickle(self, universe):
+        reader = universe.trajectory
+        reader[3]
+        state = reader.__getstate__()
+        assert isinstance(state['coordinate_array'], dict)
+        new = pickle.loads(pickle.dumps(reader))
+        assert isinstance(new.coordinate_array, np.memmap)
+        assert new.ts.frame == 3
+        assert_equal(new.timeseries(), reader.timeseries())
+        # both map the same file
+        reader[3].positions = 7
+        new.coordinate_array.flush()
+        assert_almost_equal(new[3].positions, 7)
+
+    def test_transformations(self, universe, cache):
+        ref = mda.Universe(PSF, DCD).trajectory.timeseries(order='fac')
+        universe.trajectory.add_transformations(translate([1, 2, 3]))
+        universe.trajectory.coordinate_array.flush()
+        assert_almost_equal(np.load(cache), ref + [1, 2, 3], decimal=4)
+
+
+class CompressedMemoryReference(MemoryReference):
+    def reader(self, trajectory):
+        u = mda.Universe(self.topology, trajectory)
+        u.transfer_to_memory(compression='zlib')
+        return u.trajectory
+
+
+class TestCompressedMemoryReader(MultiframeReaderTest):
+    @staticmethod
+    @pytest.fixture(scope='class')
+    def ref():
+        return CompressedMemoryReference()
+
+    @pytest.mark.parametrize('order', ['afc', 'fac', 'cfa'])
+    def test_timeseries(self, ref, reader, order):
+        ref_reader = mda.Universe(PSF, DCD, in_memory=True).trajectory
+        assert_equal(reader.timeseries(order=order, start=5, stop=40,
+                                       step=3),
+                     ref_reader.timeseries(order=order, start=5, stop=40,
+                                           step=3))
+
+    def test_timeseries_atoms(self, ref, reader):
+        u = mda.Universe(PSF, DCD)
+        ag = u.atoms[[3, 1, 7]]
+        assert_equal(reader.timeseries(ag),
+                     u.trajectory.timeseries(ag))
+
+    def test_compressed(self, reader):
+        assert reader.nbytes < 98 * 3341 * 12
+
+    def test_modification_lost(self, reader):
+        reader[2].positions = 7
+        assert not np.any(reader[2].positions == 7)
+
+    def test_repr(self, reader):
+        assert repr(reader) == ('<CompressedMemoryReader with 98 frames of '
+                                '3341 atoms>')
+
+    def test_get_writer_1(self):
+        pass
+
+    def test_get_writer_2(self):
+        pass
+
+
+class TestCompressedMemoryReaderXTC(object):
+    @staticmethod
+    @pytest.fixture()
+    def ref():
+        return mda.Universe(PSF, DCD, in_memory=True).trajectory
+
+    @pytest.mark.parametrize('chunk_size', [None, 1, 7])
+    def test_precision(self, ref, chunk_size):
+        reader = CompressedMemoryReader(ref.coordinate_array,
+                                        dimensions=ref.dimensions_array,
+                                        chunk_size=chunk_size, cache_size=2)
+        assert_almost_equal(reader.timeseries(order='fac'),
+                            ref.coordinate_array, decimal=3)
+        assert reader.nbytes < ref.coordinate_array.nbytes / 2
+        for i in (5, 0, 97, 50):
+            assert_almost_equal(reader[i].positions, ref[i].positions,
+                                decimal=3)
+
+    def test_order(self, ref):
+        reader = CompressedMemoryReader(ref.timeseries(order='caf'),
+                                        order='caf')
+        assert_almost_equal(reader.timeseries(order='fac'),
+                            ref.coordinate_array, decimal=3)
+
+    def test_velocities_forces(self):
+        u = mda.Universe(COORDINATES_TOPOLOGY, COORDINATES_TRR)
+        u.transfer_to_memory(compression='xtc')
+        assert isinstance(u.trajectory, CompressedMemoryReader)
+        ref = mda.Universe(COORDINATES_TOPOLOGY, COORDINATES_TRR)
+        for ts, ref_ts in zip(u.trajectory, ref.trajectory):
+            assert_almost_equal(ts.positions, ref_ts.positions, decimal=3)
+            # velocities and forces are not rounded
+            assert_equal(ts.velocities, ref_ts.velocities)
+            assert_equal(ts.forces, ref_ts.forces)
+            assert_almost_equal(ts.dimensions, ref_ts.dimensions, decimal=3)
+
+    def test_large_velocities_forces(self):
+        values = np.full((2, 3, 3), 1e6, dtype=np.float32)
+        reader = CompressedMemoryReader(np.zeros((2, 3, 3)),
+                                        velocities=values, forces=values)
+        assert_equal(reader[1].velocities, values[1])
+        assert_equal(reader[1].forces, values[1])
+
+    def test_transfer_again(self):
+        u = mda.Universe(PSF, DCD)
+        u.transfer_to_memory(compression='xtc')
+        reader = u.trajectory
+        u.transfer_to_memory(compression='xtc')
+        assert u.trajectory is reader
+
+    def test_too_large(self):
+        with pytest.raises(ValueError, match='too large'):
+            CompressedMemoryReader(np.full((2, 3, 3), 1e6))
+
+    def test_unknown_compression(self):
+        with pytest.raises(ValueError, match='compression'):
+            CompressedMemoryReader(np.zeros((2, 3, 3)), compression='lz4')
+
+    def test_cache_file(self, tmpdir):
+        u = mda.Universe(PSF, DCD)
+        with pytest.raises(ValueError, match='combined'):
+            u.transfer_to_memory(compression='xtc',
+                                 cache_file=str(tmpdir.join('x.npy')))
@@ -0,0 +1,168 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+# doi: 10.25080/majora-629e541a-00e
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+import os
+import shutil
+
+import pytest
+import numpy as np
+from numpy.testing import assert_equal, assert_almost_equal
+
+import MDAnalysis as mda
+from MDAnalysis.coordinates import offsets
+from MDAnalysis.coordinates.XDR import offsets_filename
+
+from MDAnalysisTests.datafiles import (COORDINATES_XTC, COORDINATES_XYZ,
+                                       COORDINATES_TOPOLOGY, PRM, TRJ,
+                                       PDB_multiframe)
+
+
+@pytest.fixture
+def offsets_dir(tmpdir):
+    cache = str(tmpdir.mkdir('offsets'))
+    offsets.set_offsets_dir(cache)
+    yield cache
+    offsets.set_offsets_dir(None)
+
+
+class TestCachedOffsets(object):
+    @staticmethod
+    @pytest.fixture
+    def traj(tmpdir):
+        fname = str(tmpdir.join('traj.dat'))
+        with open(fname, 'wb') as f:
+            f.write(b'0123456789' * 10)
+        return fname
+
+    @staticmethod
+    def scanner(calls):
+        def scan():
+            calls.append(1)
+            return {'offsets': np.arange(len(calls) * 3)}
+        return scan
+
+    def test_no_dir(self, traj):
+        calls = []
+        data = offsets.cached_offsets(traj, self.scanner(calls))
+        data = offsets.cached_offsets(traj, self.scanner(calls))
+        assert len(calls) == 2
+        assert_equal(data['offsets'], np.arange(6))
+
+    def test_env(self, tmpdir, monkeypatch):
+        monkeypatch.setenv('MDANALYSIS_OFFSETS_DIR', str(tmpdir))
+        assert offsets.get_offsets_dir() == str(tmpdir)
+
+    def test_hit(self, traj, offsets_dir):
+        calls = []
+        data = offsets.cached_offsets(traj, self.scanner(calls), n_atoms=3)
+        data = offsets.cached_offsets(traj, self.scanner(calls), n_atoms=3)
+        assert len(calls) == 1
+        assert_equal(data['offsets'], np.arange(3))
+        assert len([f for f in os.listdir(offsets_dir)
+                    if f.endswith('.npz')]) == 1
+
+    def test_refresh(self, traj, offsets_dir):
+        calls = []
+        offsets.cached_offsets(traj, self.scanner(calls))
+        data = offsets.cached_offsets(traj, self.scanner(calls), refresh=True)
+        assert_equal(data['offsets'], np.arange(6))
+        data = offsets.cached_offsets(traj, self.scanner(calls))
+        assert len(calls) == 2
+        assert_equal(data['offsets'], np.arange(6))
+
+    def test_copy_shares_entry(self, traj, tmpdir):
+        other = str(tmpdir.join('copy.dat'))
+        shutil.copy(traj, other)
+        assert offsets.offsets_key(traj) == offsets.offsets_key(other)
+
+    def test_key_content(self, traj):
+        key = offsets.offsets_key(traj)
+        with open(traj, 'r+b') as f:
+            f.write(b'x')
+        assert offsets.offsets_key(traj) != key
+
+    def test_key_size(self, traj):
+        key = offsets.offsets_key(traj)
+        with open(traj, 'ab') as f:
+            f.write(b'x')
+        assert offsets.offsets_key(traj) != key
+
+    def test_key_params(self, traj):
+        assert (offsets.offsets_key(traj, n_atoms=3) !=
+                offsets.offsets_key(traj, n_atoms=4))
+
+    def test_rewritten_middle(self, tmpdir, offsets_dir):
+        # the middle of a large file is not part of the key
+        traj = str(tmpdir.join('large.dat'))
+        with open(traj, 'wb') as f:
+            f.write(b'\0' * (3 * offsets._HASHED_BYTES))
+        calls = []
+        offsets.cached_offsets(traj, self.scanner(calls))
+        key = offsets.offsets_key(traj)
+        mtime = os.stat(traj).st_mtime_ns
+        with open(traj, 'r+b') as f:
+            f.seek(offsets._HASHED_BYTES + 10)
+            f.write(b'x')
+        os.utime(traj, ns=(mtime + 10**9, mtime + 10**9))
+        assert offsets.offsets_key(traj) == key
+        data = offsets.cached_offsets(traj, self.scanner(calls))
+        assert len(calls) == 2
+        assert_equal(data['offsets'], np.arange(6))
+        # the new entry is used for the rewritten file
+        offsets.cached_offsets(traj, self.scanner(calls))
+        assert len(calls) == 2
+
+    def test_broken_entry(self, traj, offsets_dir):
+        calls = []
+        key = offsets.offsets_key(traj)
+        with open(os.path.join(offsets_dir, key + '.npz'), 'w') as f:
+            f.write('garbage')
+        data = offsets.cached_offsets(traj, self.scanner(calls))
+        assert len(calls) == 1
+        assert_equal(data['offsets'], np.arange(3))
+
+    def test_scan_error(self, traj, offsets_dir):
+        def scan():
+            raise IOError('unreadable')
+
+        with pytest.raises(IOError, match='unreadable'):
+            offsets.cached_offsets(traj, scan)
+
+
+@pytest.mark.parametrize('topology, trajectory', [
+    (COORDINATES_TOPOLOGY, COORDINATES_XTC),
+    (COORDINATES_XYZ, COORDINATES_XYZ),
+    (PRM, TRJ),
+    (PDB_multiframe, PDB_multiframe),
+])
+def test_reader(topology, trajectory, offsets_dir, tmpdir):
+    # a copy of the trajectory shares the cache entry of the original
+    traj = str(tmpdir.join(os.path.basename(trajectory)))
+    shutil.copy(trajectory, traj)
+    ref = mda.Universe(topology, trajectory)
+    u = mda.Universe(topology, traj)
+    assert u.trajectory.n_frames == ref.trajectory.n_frames > 1
+    assert len([f for f in os.listdir(offsets_dir)
+                if f.endswith('.npz')]) == 1
+    assert not os.path.exists(offsets_filename(traj))
+    for ts, ref_ts in zip(u.trajectory[::-1], ref.trajectory[::-1]):
+        assert_almost_equal(ts.positions, ref_ts.positions, decimal=5)
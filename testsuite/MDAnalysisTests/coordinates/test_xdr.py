@@ -66,6 +66,13 @@ class _XDRReader_Sub(object):
         ts = udry.atoms.ts
         assert_timestep_almost_equal(ts, atoms.ts)
 
+    def test_sub_restrict_to(self, atoms):
+        udry = mda.Universe(PDB_sub_dry)
+        udry.load_new(self.XDR_SUB_SOL, sub=atoms.indices)
+        udry.trajectory.restrict_to(udry.atoms[[4, 2]])
+        assert_almost_equal(udry.atoms.positions[[4, 2]],
+                            atoms.positions[[4, 2]])
+
 
 class TestTRRReader_Sub(_XDRReader_Sub):
     XDR_SUB_SOL = TRR_sub_sol
@@ -210,6 +217,42 @@ class _GromacsReader(object):
         with pytest.raises(StopIteration):
             go_beyond_EOF()
 
+    @pytest.mark.parametrize('indices', [[300, 5, 100], []])
+    def test_restrict_to(self, universe, indices):
+        u = mda.Universe(GRO, self.filename)
+        u.trajectory.restrict_to(u.atoms[indices])
+        rest = np.setdiff1d(np.arange(u.atoms.n_atoms), indices)
+        for ts, ref_ts in zip(u.trajectory[::3], universe.trajectory[::3]):
+            assert_almost_equal(ts.positions[indices],
+                                ref_ts.positions[indices], self.prec)
+            assert np.all(np.isnan(ts.positions[rest]))
+
+    def test_restrict_to_reset(self, universe):
+        u = mda.Universe(GRO, self.filename)
+        u.trajectory.restrict_to([3, 1])
+        u.trajectory.restrict_to(None)
+        universe.trajectory[0]
+        assert_almost_equal(u.atoms.positions, universe.atoms.positions,
+                            self.prec)
+        u.trajectory[4]
+        universe.trajectory[4]
+        assert_almost_equal(u.atoms.positions, universe.atoms.positions,
+                            self.prec)
+
+    def test_restrict_to_copy(self):
+        u = mda.Universe(GRO, self.filename)
+        u.trajectory.restrict_to([3, 1])
+        new = u.trajectory.copy()
+        new[2]
+        assert np.all(np.isnan(new.ts.positions[0]))
+        assert_almost_equal(new.ts.positions[[1, 3]],
+                            u.trajectory[2].positions[[1, 3]])
+
+    def test_restrict_to_out_of_range(self):
+        u = mda.Universe(GRO, self.filename)
+        with pytest.raises(ValueError):
+            u.trajectory.restrict_to([u.atoms.n_atoms])
+
 
 class TestXTCReader(_GromacsReader):
     filename = XTC
@@ -829,6 +872,10 @@ class TestXTCReader_offsets(_GromacsReader_offsets):
     ])
     _reader = mda.coordinates.XTC.XTCReader
 
+    def test_offset_threads(self, traj):
+        reader = self._reader(traj, offset_threads=3, refresh_offsets=True)
+        assert_equal(reader._xdr.offsets, self.ref_offsets)
+
 
 class TestTRRReader_offsets(_GromacsReader_offsets):
     __test__ = True
@@ -1270,6 +1270,15 @@ class TestAtomGroup(object):
                                                unwrap=unwrap)
         assert_almost_equal(vals, ref, decimal=5)
 
+    def test_center_compounds_reassigned(self, ag):
+        # the cached compound partition must follow topology changes
+        ag = ag[np.random.RandomState(42).permutation(len(ag))]
+        ag.center_of_geometry(compound='residues')
+        ag.universe.atoms[:10].residues = ag.universe.residues[-1]
+        ref = [a.center_of_geometry() for a in ag.groupby('resids').values()]
+        vals = ag.center_of_geometry(compound='residues')
+        assert_almost_equal(vals, ref, decimal=5)
+
     def test_center_wrong_compound(self, ag):
         with pytest.raises(ValueError):
             ag.center(weights=None, compound="foo")
@@ -192,6 +192,17 @@ class TestAtomnames(TestAtomAttr):
         assert_equal(u.residues[[]]._get_next_residues_by_resid(),
                      u.residues[[]])
 
+    def test_set_atoms_interned(self, attr):
+        n_names = len(attr.name_lookup)
+        attr.set_atoms(DummyGroup([1, 4, 6]), np.array(['OW', 'XX', 'XX'],
+                                                       dtype=object))
+        # known names are reused, new names are added only once
+        assert len(attr.name_lookup) == n_names + 1
+        assert attr.nmidx[1] == attr.namedict['OW']
+        assert_equal(attr.name_lookup[attr.nmidx], attr.values)
+        assert_equal(attr.values[[1, 4, 6]], ['OW', 'XX', 'XX'])
+        assert_equal(attr.values[[0, 2]], ['O', 'CA'])
+
 
 class AggregationMixin(TestAtomAttr):
     def test_get_residues(self, attr):
@@ -444,6 +455,71 @@ class TestCrossLevelAttributeSetting(object):
             setattr(item, attr, 1.0)
 
 
+class TestConnection(object):
+    @pytest.fixture()
+    def bonds(self):
+        # a chain of 5 atoms followed by 5 unbonded atoms
+        return tpattrs.Bonds([(1, 0), (1, 2), (3, 2), (3, 4)],
+                             types=['a', 'b', ('c', 'd'), 'e'])
+
+    @pytest.fixture()
+    def universe(self, bonds):
+        u = mda.Universe.empty(10)
+        u.add_TopologyAttr(bonds)
+        return u
+
+    def test_values(self, bonds):
+        assert bonds.values == [(0, 1), (1, 2), (2, 3), (3, 4)]
+        assert bonds.types == ['a', 'b', ('c', 'd'), 'e']
+        assert bonds.order == [None] * 4
+        assert bonds.is_guessed == [False] * 4
+
+    def test_len(self, bonds):
+        # number of atoms with bonds
+        assert len(bonds) == 5
+
+    @pytest.mark.parametrize('values', ([(0, 1, 2)], [(0.0, 1.0)],
+                                        [(0, 1), (2,)]))
+    def test_wrong_values(self, values):
+        with pytest.raises(ValueError):
+            tpattrs.Bonds(values)
+
+    @pytest.mark.parametrize('ix, ref', (
+        ([0], [(0, 1)]),
+        ([2, 3], [(1, 2), (2, 3), (3, 4)]),
+        ([7], np.zeros((0, 2))),
+        (slice(None), [(0, 1), (1, 2), (2, 3), (3, 4)]),
+    ))
+    def test_get_atoms(self, universe, ix, ref):
+        assert_equal(universe.atoms[ix].bonds.to_indices(), ref)
+
+    def test_get_atom(self, universe):
+        bonds = universe.atoms[3].bonds
+        assert_equal(bonds.to_indices(), [(2, 3), (3, 4)])
+        assert list(bonds.types()) == [('c', 'd'), 'e']
+
+    def test_add_bonds(self, universe):
+        universe.add_bonds([(1, 0), (8, 9)], types=['x', 'y'])
+        attr = universe._topology.bonds
+        assert attr.values[-1] == (8, 9)
+        assert attr.types[-1] == 'y'
+        assert len(attr.values) == 5
+        assert_equal(universe.atoms[9].bonds.to_indices(), [(8, 9)])
+
+    def test_delete_bonds(self, universe):
+        universe.delete_bonds([(2, 1)])
+        assert_equal(universe.atoms[1].bonds.to_indices(), [(0, 1)])
+        assert universe._topology.bonds.types == ['a', ('c', 'd'), 'e']
+        with pytest.raises(ValueError, match="Cannot delete nonexistent"):
+            universe.delete_bonds([(1, 2)])
+
+    def test_copy(self, bonds):
+        copy = bonds.copy()
+        assert copy.values == bonds.values
+        assert copy.types == bonds.types
+        assert copy.is_guessed == bonds.is_guessed
+
+
 class TestRecordTypes(object):
     def test_record_types_default(self):
         u = make_Universe()
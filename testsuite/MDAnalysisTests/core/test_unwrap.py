@@ -26,6 +26,7 @@ import pytest
 
 import MDAnalysis as mda
 from MDAnalysis import NoDataError
+from MDAnalysis.lib.mdamath import make_whole, UnwrapPlan
 from MDAnalysisTests.core.util import UnWrapUniverse
 
 
@@ -356,3 +357,67 @@ class TestUnwrap(object):
             group.unwrap(compound='molecules', reference=reference,
                          inplace=True)
         assert_array_equal(group.atoms.positions, orig_pos)
+
+
+class TestUnwrapPlan(object):
+    precision = 5
+
+    @pytest.mark.parametrize('compound', ('fragments', 'molecules',
+                                          'residues', 'group', 'segments'))
+    @pytest.mark.parametrize('reference', ('com', 'cog', None))
+    @pytest.mark.parametrize('is_triclinic', (False, True))
+    def test_reuse(self, compound, reference, is_triclinic):
+        u = UnWrapUniverse(is_triclinic=is_triclinic)
+        if compound == 'group':
+            group = u.atoms[39:47]  # molecule 12
+        elif compound == 'segments':
+            group = u.atoms[23:47]  # molecules 10, 11, 12
+        else:
+            group = u.atoms
+        plan = UnwrapPlan(group, compound=compound)
+        wrapped = group.positions
+        for shift in (0.0, 0.25, 0.5):
+            # a new frame: move everything and wrap it back into the box
+            group.positions = wrapped + shift * u.dimensions[:3]
+            group.wrap(compound='atoms')
+            ref = group.unwrap(compound=compound, reference=reference,
+                               inplace=False)
+            positions = plan.unwrap(reference=reference)
+            assert_almost_equal(positions, ref, decimal=self.precision)
+            assert_array_equal(group.positions, positions)
+
+    def test_no_bonds(self):
+        u = mda.Universe.empty(2, trajectory=True)
+        with pytest.raises(NoDataError):
+            UnwrapPlan(u.atoms)
+
+    def test_wrong_compound(self):
+        u = UnWrapUniverse()
+        with pytest.raises(ValueError):
+            UnwrapPlan(u.atoms, compound='foo')
+
+
+@pytest.mark.parametrize('compound', ('fragments', 'residues'))
+def test_unwrap_matches_make_whole(compound):
+    # chains of two residues of 5 atoms, wrapped into the box
+    n_chains = 20
+    n_atoms = 10 * n_chains
+    u = mda.Universe.empty(n_atoms, n_residues=n_atoms // 5,
+                           atom_resindex=np.arange(n_atoms) // 5,
+                           trajectory=True)
+    chains = np.arange(n_atoms).reshape(-1, 10)
+    u.add_TopologyAttr('bonds', np.concatenate([chains[:, i:i + 2]
+                                                for i in range(9)]))
+    u.dimensions = [10, 10, 10, 90, 90, 90]
+    rng = np.random.RandomState(42)
+    steps = rng.uniform(-1, 1, (n_chains, 10, 3)).cumsum(axis=1)
+    positions = (rng.uniform(0, 10, (n_chains, 1, 3)) + steps).reshape(-1, 3)
+    u.atoms.positions = positions % 10
+
+    ref = u.atoms.positions
+    compounds = (u.atoms.fragments if compound == 'fragments'
+                 else u.residues)
+    for c in compounds:
+        ref[c.atoms.ix] = make_whole(c.atoms, inplace=False)
+    unwrapped = u.atoms.unwrap(compound=compound, reference=None)
+    assert_almost_equal(unwrapped, ref, decimal=5)
@@ -570,6 +570,15 @@ def test_readframes_atomindices(indices, dcd):
     assert_array_almost_equal(xyz, allframes[indices])
 
 
+@pytest.mark.parametrize("slice", ((None, None, None), (4, 8, None)))
+def test_readframes_no_unitcell(slice, dcd):
+    # frames without a unitcell get the same one as from read()
+    unitcell = dcd.read().unitcell
+    frames = dcd.readframes(*slice)
+    assert_array_almost_equal(frames.unitcell,
+                              np.tile(unitcell, (len(frames.xyz), 1)))
+
+
 def test_write_random_unitcell(tmpdir):
     testname = str(tmpdir.join('test.dcd'))
     rstate = np.random.RandomState(1178083)
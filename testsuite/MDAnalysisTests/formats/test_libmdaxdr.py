@@ -29,7 +29,7 @@ from numpy.testing import (assert_almost_equal, assert_array_almost_equal,
 
 from MDAnalysis.lib.formats.libmdaxdr import TRRFile, XTCFile
 
-from MDAnalysisTests.datafiles import TRR_multi_frame, XTC_multi_frame
+from MDAnalysisTests.datafiles import TRR_multi_frame, XTC_multi_frame, XTC
 
 import pytest
 
@@ -239,6 +239,25 @@ class TestOffsets(object):
         assert reader._bytes_tell() == big_offset
 
 
+@pytest.mark.parametrize('n_threads', [2, 3, 7, 64])
+def test_calc_offsets_threads(n_threads):
+    with XTCFile(XTC) as f:
+        assert_array_equal(f.calc_offsets(n_threads=n_threads),
+                           f.calc_offsets())
+
+
+@pytest.mark.parametrize('n_threads', [2, 3, 7])
+def test_calc_offsets_threads_truncated(tmpdir, n_threads):
+    fname = str(tmpdir.join('truncated.xtc'))
+    with open(XTC, 'rb') as f:
+        data = f.read()
+    with open(fname, 'wb') as f:
+        f.write(data[:len(data) - 1000])
+    with XTCFile(fname) as f:
+        assert_array_equal(f.calc_offsets(n_threads=n_threads),
+                           f.calc_offsets())
+
+
 @pytest.mark.parametrize("xdrfile, fname", ((XTCFile, XTC_multi_frame),
                                             (TRRFile, TRR_multi_frame)))
 def test_steps(xdrfile, fname):
@@ -267,6 +286,35 @@ def test_xyz_xtc(xtc):
         assert_array_almost_equal(frame.x, ones * i, decimal=3)
 
 
+def test_xyz_xtc_n_decode(xtc):
+    ones = np.ones(12).reshape(4, 3)
+    for i, frame in enumerate(iter(lambda: xtc.read(n_decode=4), None)):
+        assert_array_almost_equal(frame.x, ones * i, decimal=3)
+        if i == 9:
+            break
+    # the file was read up to the end
+    assert xtc.tell() == 10
+
+
+@pytest.mark.parametrize('indices', [None, [7, 2]])
+def test_read_frames_xtc(xtc, indices):
+    frames = [4, 5, 0]
+    n_atoms = 10 if indices is None else len(indices)
+    xyz = np.empty((3, n_atoms, 3), dtype=np.float32)
+    box = np.empty((3, 3, 3), dtype=np.float32)
+    xtc.read_frames(frames, xyz, box, indices=indices)
+    for k, i in enumerate(frames):
+        assert_array_almost_equal(xyz[k], np.ones((n_atoms, 3)) * i,
+                                  decimal=3)
+        assert_array_almost_equal(box[k], np.eye(3) * 20, decimal=3)
+
+
+def test_read_frames_wrong_shape(xtc):
+    with pytest.raises(ValueError):
+        xtc.read_frames([0, 1], np.empty((2, 9, 3), dtype=np.float32),
+                        np.empty((2, 3, 3), dtype=np.float32))
+
+
 def test_box_trr(trr):
     box = np.eye(3) * 20
     for frame in trr:
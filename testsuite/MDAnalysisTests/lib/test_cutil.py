@@ -22,9 +22,10 @@
 #
 import pytest
 import numpy as np
-from numpy.testing import assert_equal
+from numpy.testing import assert_equal, assert_almost_equal
 
-from MDAnalysis.lib._cutil import unique_int_1d, find_fragments
+from MDAnalysis.lib._cutil import (unique_int_1d, find_fragments,
+                                   _unwrap_order, _make_whole_ordered)
 
 
 @pytest.mark.parametrize('values', (
@@ -62,3 +63,45 @@ def test_find_fragments(edges, ref):
     assert len(fragments) == len(ref)
     for frag, r in zip(fragments, ref):
         assert_equal(frag, r)
+
+
+def test_unwrap_order():
+    # a ring 0-1-2-3-0 with a branch on 3, a lone atom and a chain 6-7-5
+    # sharing a bond (2, 5) with the ring that is ignored
+    compounds = [0, 0, 0, 0, 0, 1, 2, 2, 2]
+    bonds = [[0, 1], [1, 2], [2, 3], [3, 0], [3, 4], [6, 7], [7, 8], [2, 6]]
+    order, parents = _unwrap_order(np.array(compounds), np.array(bonds))
+    assert_equal(order, [0, 1, 3, 2, 4, 5, 6, 7, 8])
+    assert_equal(parents, [-1, 0, 1, 0, 3, -1, -1, 6, 7])
+
+
+def test_unwrap_order_not_contiguous():
+    order, parents = _unwrap_order(np.array([0, 1, 0, 0]),
+                                   np.array([[0, 3]]))
+    assert_equal(order, [0, 3, 2, 1])
+    assert_equal(parents, [-1, -1, -2, 0])
+
+
+@pytest.mark.parametrize('x, whole', ((2, True), (8, False)))
+def test_make_whole_ordered_not_contiguous(x, whole):
+    box = np.array([10, 10, 10, 90, 90, 90], dtype=np.float32)
+    positions = np.array([[1, 1, 1], [x, 1, 1]], dtype=np.float32)
+    order, parents = _unwrap_order(np.array([0, 0]), np.empty((0, 2)))
+    if whole:
+        # nothing to do, like make_whole
+        _make_whole_ordered(positions, order, parents, box)
+        assert_equal(positions, [[1, 1, 1], [x, 1, 1]])
+    else:
+        with pytest.raises(ValueError):
+            _make_whole_ordered(positions, order, parents, box)
+
+
+def test_make_whole_ordered():
+    box = np.array([10, 10, 10, 90, 90, 90], dtype=np.float32)
+    positions = np.array([[1, 1, 1], [9, 1, 1], [8, 1, 1],
+                          [5, 5, 5], [5, 5, 6]], dtype=np.float32)
+    order, parents = _unwrap_order(np.array([0, 0, 0, 1, 1]),
+                                   np.array([[0, 1], [1, 2], [3, 4]]))
+    _make_whole_ordered(positions, order, parents, box)
+    assert_almost_equal(positions, [[1, 1, 1], [-1, 1, 1], [-2, 1, 1],
+                                    [5, 5, 5], [5, 5, 6]], decimal=5)
@@ -855,6 +855,46 @@ class TestConvFloat(object):
         assert ret == output
 
 
+class TestParseFloats(object):
+    @pytest.mark.parametrize('lines', [
+        ['1 2.5 -3\n', '4e1 5 6\n'],
+        [b'1 2.5 -3\n', b'4e1 5 6\n'],
+        ['1 2.5\n', '-3 4e1 5 6\n'],
+    ])
+    def test_whitespace(self, lines):
+        values = util.whitespace_floats(lines, 3)
+        assert_equal(values, [[1, 2.5, -3], [40, 5, 6]])
+
+    @pytest.mark.parametrize('lines', [
+        ['1 2 3\n', '4 5\n'],
+        ['1 2 3\n', '4 x 6\n'],
+    ])
+    def test_whitespace_ValueError(self, lines):
+        with pytest.raises(ValueError):
+            util.whitespace_floats(lines, 3)
+
+    @pytest.mark.parametrize('lines', [
+        ['ATOM   1.000-2.500 3.000\n', 'ATOM  10.000 2.000-3.000\n'],
+        [b'ATOM   1.000-2.500 3.000\n', b'ATOM  10.000 2.000-3.000\n'],
+        ['ATOM   1.000-2.500 3.000', 'ATOM  10.000 2.000-3.000  trailing'],
+    ])
+    def test_fixed_width(self, lines):
+        values = util.fixed_width_floats(lines, [(4, 12), (12, 18), (18, 24)],
+                                         np.float32)
+        assert values.dtype == np.float32
+        assert_equal(values, [[1, -2.5, 3], [10, 2, -3]])
+
+    @pytest.mark.parametrize('lines', [
+        ['ATOM   1.000-2.500 3.000\n', 'ATOM  10.000 2.000\n'],
+        ['ATOM   1.000-2.500 3.000\n', 'ATOM  10.000      -3.000\n'],
+        ['ATOM   1.000-2.500 3.000\n', 'ATOM  10.000 2.0x0-3.000\n'],
+        ['ATOM   1.000-2.500 3.000\n', 'ATOM  10.000 2.\u00e90-3.000\n'],
+    ])
+    def test_fixed_width_ValueError(self, lines):
+        with pytest.raises(ValueError):
+            util.fixed_width_floats(lines, [(4, 12), (12, 18), (18, 24)])
+
+
 class TestFixedwidthBins(object):
     def test_keys(self):
         ret = util.fixedwidth_bins(0.5, 1.0, 2.0)
@@ -0,0 +1,188 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- https://www.mdanalysis.org
+# Copyright (c) 2006-2017 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+# doi: 10.25080/majora-629e541a-00e
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+import os
+import pickle
+import shutil
+
+import pytest
+import numpy as np
+from numpy.testing import assert_equal
+
+import MDAnalysis as mda
+from MDAnalysis.core.topology import Topology
+from MDAnalysis.core.topologyattrs import Atomnames, Masses
+from MDAnalysis.topology import cache
+
+from MDAnalysisTests.datafiles import PSF, DCD, TPR, PDB_full, mol2_molecule
+
+
+def assert_same_topology(top, ref):
+    assert top.n_atoms == ref.n_atoms
+    assert top.n_residues == ref.n_residues
+    assert top.n_segments == ref.n_segments
+    assert_equal(top.tt._AR, ref.tt._AR)
+    assert_equal(top.tt._RS, ref.tt._RS)
+    attrs = {attr.attrname: attr for attr in top.attrs}
+    ref_attrs = {attr.attrname: attr for attr in ref.attrs}
+    assert attrs.keys() == ref_attrs.keys()
+    for name, ref_attr in ref_attrs.items():
+        attr = attrs[name]
+        assert type(attr) is type(ref_attr)
+        if name in ('indices', 'resindices', 'segindices'):
+            continue
+        assert attr.is_guessed == ref_attr.is_guessed
+        if hasattr(ref_attr, 'types'):
+            assert attr.values == ref_attr.values
+            assert list(attr.types) == list(ref_attr.types)
+            assert list(attr.order) == list(ref_attr.order)
+        else:
+            assert_equal(attr.values, ref_attr.values)
+            assert attr.values.dtype == ref_attr.values.dtype
+
+
+class TestSnapshot(object):
+    @pytest.mark.parametrize('filename', [PSF, TPR, PDB_full, mol2_molecule])
+    def test_roundtrip(self, filename, tmpdir):
+        ref = mda.Universe(filename)._topology
+        snapshot = str(tmpdir.join('top.top'))
+        cache.save_topology(ref, snapshot)
+        assert_same_topology(cache.load_topology(snapshot), ref)
+
+    def test_writable(self, tmpdir):
+        snapshot = str(tmpdir.join('top.top'))
+        cache.save_topology(mda.Universe(PSF)._topology, snapshot)
+        top = cache.load_topology(snapshot)
+        top.masses.values[:3] = 1.0
+        assert_equal(top.masses.values[:3], 1.0)
+        # copy-on-write: the snapshot is not changed
+        assert cache.load_topology(snapshot).masses.values[0] != 1.0
+
+    def test_not_snapshot(self, tmpdir):
+        snapshot = str(tmpdir.join('top.top'))
+        with open(snapshot, 'wb') as f:
+            f.write(b'garbage')
+        with pytest.raises(ValueError):
+            cache.load_topology(snapshot)
+
+    def test_unstorable(self, tmpdir):
+        top = Topology(2, 1, 1, attrs=[Atomnames(np.array(['A', 1],
+                                                          dtype=object))])
+        with pytest.raises(TypeError):
+            cache.save_topology(top, str(tmpdir.join('top.top')))
+
+
+class TestCachedTopology(object):
+    @staticmethod
+    @pytest.fixture
+    def psf(tmpdir):
+        fname = str(tmpdir.join('adk.psf'))
+        shutil.copy(PSF, fname)
+        return fname
+
+    @staticmethod
+    def parser(calls):
+        def parse():
+            calls.append(1)
+            return Topology(3, 1, 1, attrs=[Masses(np.arange(3.0))])
+        return parse
+
+    def test_hit(self, psf, tmpdir):
+        calls = []
+        directory = str(tmpdir.join('cache'))
+        cache.cached_topology(psf, self.parser(calls), directory)
+        top = cache.cached_topology(psf, self.parser(calls), directory)
+        assert len(calls) == 1
+        assert_equal(top.masses.values, np.arange(3.0))
+        assert len([f for f in os.listdir(directory)
+                    if f.endswith('.top')]) == 1
+
+    def test_refresh(self, psf, tmpdir):
+        calls = []
+        directory = str(tmpdir)
+        cache.cached_topology(psf, self.parser(calls), directory)
+        cache.cached_topology(psf, self.parser(calls), directory,
+                              refresh=True)
+        assert len(calls) == 2
+
+    def test_key_content(self, psf, tmpdir):
+        key = cache.topology_key(psf)
+        other = str(tmpdir.join('copy.psf'))
+        shutil.copy(psf, other)
+        assert cache.topology_key(other) == key
+        with open(other, 'r+b') as f:
+            f.seek(os.path.getsize(other) // 2)
+            f.write(b'x')
+        assert cache.topology_key(other) != key
+
+    def test_key_params(self, psf):
+        assert (cache.topology_key(psf, parser='PSF') !=
+                cache.topology_key(psf, parser='PDB'))
+
+    def test_broken_entry(self, psf, tmpdir):
+        calls = []
+        directory = str(tmpdir)
+        key = cache.topology_key(psf)
+        with open(os.path.join(directory, key + '.top'), 'w') as f:
+            f.write('garbage')
+        top = cache.cached_topology(psf, self.parser(calls), directory)
+        assert len(calls) == 1
+        assert_equal(top.masses.values, np.arange(3.0))
+        top = cache.cached_topology(psf, self.parser(calls), directory)
+        assert len(calls) == 1
+
+    def test_unstorable(self, psf, tmpdir):
+        def parse():
+            return Topology(1, 1, 1, attrs=[Atomnames(np.array([None]))])
+
+        with pytest.warns(UserWarning, match='topology cache'):
+            top = cache.cached_topology(psf, parse, str(tmpdir))
+        assert top.names.values[0] is None
+        assert not [f for f in os.listdir(str(tmpdir))
+                    if f.endswith(('.top', '.tmp'))]
+
+    def test_stream(self, tmpdir):
+        calls = []
+        with open(PSF) as f:
+            stream = mda.lib.util.NamedStream(f, PSF)
+            cache.cached_topology(stream, self.parser(calls), str(tmpdir))
+        assert len(calls) == 1
+        assert not os.listdir(str(tmpdir))
+
+
+class TestUniverse(object):
+    def test_topology_cache(self, tmpdir):
+        directory = str(tmpdir)
+        ref = mda.Universe(PSF, DCD)
+        u = mda.Universe(PSF, DCD, topology_cache=directory)
+        assert len([f for f in os.listdir(directory)
+                    if f.endswith('.top')]) == 1
+        u = mda.Universe(PSF, DCD, topology_cache=directory)
+        assert_same_topology(u._topology, ref._topology)
+        assert_equal(u.atoms.positions, ref.atoms.positions)
+        assert len(u.bonds) == len(ref.bonds)
+
+    def test_pickle(self, tmpdir):
+        u = mda.Universe(PSF, DCD, topology_cache=str(tmpdir))
+        assert u.kwargs['topology_cache'] == str(tmpdir)
+        u2 = pickle.loads(pickle.dumps(u))
+        assert_equal(u2.atoms.names, u.atoms.names)
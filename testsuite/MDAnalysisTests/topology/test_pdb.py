@@ -71,6 +71,45 @@ def test_hy36decode(hybrid, integer):
     assert mda.topology.PDBParser.hy36decode(5, hybrid) == integer
 
 
+def test_hy36decode_array():
+    hybrids, integers = zip(*hybrid36)
+    values, valid = mda.topology.PDBParser.hy36decode_array(5, hybrids)
+    assert valid.all()
+    assert_equal(values, integers)
+
+
+@pytest.mark.parametrize('hybrid', ['*****', 'A00', 'A0-00', 'a0A00',
+                                    ' 1 2 ', '     ', 'A00000'])
+def test_hy36decode_array_invalid(hybrid):
+    with pytest.raises((ValueError, KeyError)):
+        mda.topology.PDBParser.hy36decode(5, hybrid)
+    values, valid = mda.topology.PDBParser.hy36decode_array(
+        5, ['    1', hybrid])
+    assert_equal(valid, [True, False])
+    assert values[0] == 1
+
+
+PDB_wrapped = """\
+ATOM  99999  CA  ALA A9998       1.000   2.000   3.000  1.00  0.00      PROT
+ATOM  *****  CA  ALA A9999       1.000   2.000   3.000  1.00  0.00      PROT
+ATOM  *****  CA  ALA A   0       1.000   2.000   3.000  1.00  0.00      PROT
+ATOM  A0000  CA  ALA A   1       1.000   2.000   3.000              PROT
+ATOM  *****  CA  ALA A9999       1.000   2.000   3.000  1.00  0.00      PROT
+ATOM  *****  CA  ALA A   2       1.000   2.000   3.000  1.00  0.00      PROT
+END
+"""
+
+
+def test_PDB_wrapped():
+    with pytest.warns(UserWarning, match='Serial numbers went over'):
+        u = mda.Universe(StringIO(PDB_wrapped), format='PDB')
+    assert_equal(u.atoms.ids, [99999, 100000, 100001, 100000, 100002,
+                               100003])
+    assert_equal(u.atoms.resids, [9998, 9999, 10000, 10001, 9999, 10002])
+    assert_equal(u.atoms.occupancies, [1, 1, 1, 0, 1, 1])
+    assert_equal(u.atoms.tempfactors, [0, 0, 0, 1, 0, 0])
+
+
 class PDBBase(ParserBase):
     expected_attrs = ['ids', 'names', 'record_types', 'resids',
                       'resnames', 'altLocs', 'icodes', 'occupancies',
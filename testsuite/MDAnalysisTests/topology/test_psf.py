@@ -157,3 +157,59 @@ def test_psf_nosegid():
     assert isinstance(u, mda.Universe)
     assert u.atoms.n_atoms == 98
     assert_equal(u.segments.segids, ["SYSTEM"])
+
+
+class TestPSFVariants(object):
+    """PSF files rewritten from :data:`PSF` in other formats"""
+    @staticmethod
+    @pytest.fixture(scope='class')
+    def ref():
+        return mda.topology.PSFParser.PSFParser(PSF).parse()
+
+    @staticmethod
+    @pytest.fixture(scope='class')
+    def lines():
+        with open(PSF) as f:
+            return f.readlines()
+
+    @staticmethod
+    def parse(tmpdir, lines):
+        fname = str(tmpdir.join('variant.psf'))
+        with open(fname, 'w') as f:
+            f.writelines(lines)
+        return mda.topology.PSFParser.PSFParser(fname).parse()
+
+    @staticmethod
+    def assert_same_atoms(top, ref):
+        for attr in ('ids', 'names', 'types', 'charges', 'masses', 'resids',
+                     'resnames', 'segids'):
+            assert_equal(getattr(top, attr).values,
+                         getattr(ref, attr).values)
+
+    def test_namd(self, tmpdir, lines, ref):
+        natom = [i for i, l in enumerate(lines) if '!NATOM' in l][0]
+        n_atoms = int(lines[natom].split()[0])
+        atoms = [' '.join(l.split()) + '\n'
+                 for l in lines[natom + 1:natom + 1 + n_atoms]]
+        new = (['PSF CMAP NAMD\n'] + lines[1:natom + 1] + atoms +
+               lines[natom + 1 + n_atoms:])
+        top = self.parse(tmpdir, new)
+        self.assert_same_atoms(top, ref)
+        assert_equal(top.bonds.values, ref.bonds.values)
+
+    def test_guess_namd(self, tmpdir, lines, ref):
+        # standard lines don't fit the EXT columns
+        top = self.parse(tmpdir, ['PSF EXT CMAP CHEQ\n'] + lines[1:])
+        self.assert_same_atoms(top, ref)
+
+    def test_truncated_section(self, tmpdir, lines, ref):
+        nbond = [i for i, l in enumerate(lines) if '!NBOND' in l][0]
+        top = self.parse(tmpdir, lines[:nbond + 5])
+        self.assert_same_atoms(top, ref)
+        for attr in ('bonds', 'angles', 'dihedrals', 'impropers'):
+            assert len(getattr(top, attr).values) == 0
+
+    def test_truncated_atoms(self, tmpdir, lines):
+        natom = [i for i, l in enumerate(lines) if '!NATOM' in l][0]
+        with pytest.raises(ValueError, match='not valid PSF file'):
+            self.parse(tmpdir, lines[:natom + 5])
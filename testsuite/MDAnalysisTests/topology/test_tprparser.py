@@ -39,6 +39,7 @@ from MDAnalysis.tests.datafiles import (
 )
 from MDAnalysisTests.topology.base import ParserBase
 import MDAnalysis.topology.TPRParser
+from MDAnalysis.topology.tpr import utils as tpr_utils
 
 BONDED_TPRS = (
     TPR510_bonded,
@@ -287,3 +288,23 @@ def test_elements():
         'H', '', 'Na', 'Na', 'Na', 'Na',
     ], dtype=object)
     assert_equal(topology.elements.values[-20:], reference)
+
+
+@pytest.mark.parametrize('unpacker_class', (
+    tpr_utils.TPXUnpacker, tpr_utils.TPXUnpacker2020,
+))
+def test_unpack_array(unpacker_class):
+    data = unpacker_class(np.arange(-3, 7, dtype='>i4').tobytes())
+    data.unpack_int()
+    values = data.unpack_array('>i4', 5)
+    assert_equal(values, np.arange(-2, 3))
+    # the position is advanced past the values
+    assert data.unpack_int() == 3
+    with pytest.raises(EOFError):
+        data.unpack_array('>i4', 4)
+
+
+def test_ndo_real_precision():
+    data = tpr_utils.TPXUnpacker(np.arange(6, dtype='>f8').tobytes())
+    data.unpack_real = data.unpack_double
+    assert_equal(tpr_utils.ndo_rvec(data, 2), [[0, 1, 2], [3, 4, 5]])